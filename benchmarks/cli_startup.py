@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark how long ``lomen --all`` takes before it can answer ``tools/list``.
+
+Each run starts a fresh interpreter that instantiates every plugin, builds the
+MCP server and lists its tools, i.e. everything the CLI does before serving.
+Runs alternate between lazy, manifest-driven plugins (the default) and eagerly
+imported plugins, and the median wall time of each mode is reported together
+with the number of imported modules and whether web3 was imported.
+
+Usage:
+    python benchmarks/cli_startup.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+from lomen.cli import create_server, instantiate_plugins
+plugins = instantiate_plugins([], all_plugins=True, lazy={lazy})
+tools = asyncio.run(create_server(plugins).list_tools())
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "tools": len(tools),
+    "modules": len(sys.modules),
+    "web3": "web3" in sys.modules,
+}}))
+"""
+
+
+def probe(lazy: bool) -> dict:
+    """Time one cold start in a fresh interpreter."""
+    # Plugin construction makes no API calls, so a placeholder key is enough
+    env = {"ONEINCH_API_KEY": "benchmark", **os.environ}
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(lazy=lazy)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per mode")
+    args = parser.parse_args()
+
+    results = {True: [], False: []}
+    for _ in range(args.runs):
+        for lazy in (True, False):
+            results[lazy].append(probe(lazy))
+
+    print(f"lomen --all startup until tools/list, median of {args.runs} runs")
+    medians = {}
+    for lazy, label in ((False, "eager imports"), (True, "lazy manifests")):
+        runs = results[lazy]
+        medians[lazy] = statistics.median(run["seconds"] for run in runs)
+        last = runs[-1]
+        print(
+            f"  {label:15s} {medians[lazy] * 1000:8.1f} ms  "
+            f"{last['tools']} tools, {last['modules']} modules, "
+            f"web3 imported: {last['web3']}"
+        )
+    print(f"  speed-up:       {medians[False] / medians[True]:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
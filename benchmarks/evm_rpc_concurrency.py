@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent ``get_block`` calls against a local JSON-RPC node stub.
+
+The stub (``stubs.py``) answers every request after a fixed delay, standing in
+for a slow RPC node. N calls are issued concurrently, once with a blocking ``Web3``
+client (how the tool used to work) and once with the ``GetBlock`` tool. The stub
+runs on its own thread so that blocking calls really block the benchmark's loop.
+With a blocking client the calls serialize (wall time ~ N x delay); with
+``AsyncWeb3`` they overlap (wall time ~ delay).
+
+Usage:
+    python benchmarks/evm_rpc_concurrency.py --calls 20 --delay 0.2
+"""
+
+import argparse
+import asyncio
+import time
+
+from stubs import Faults, StubServer, make_rpc_app
+from web3 import Web3
+
+from lomen.plugins.evm_rpc.tools.get_block import GetBlock
+
+
+async def run_concurrently(fn, calls: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(fn(i) for i in range(calls)))
+    return time.perf_counter() - start
+
+
+async def main_async(rpc_url: str, calls: int, delay: float) -> None:
+    tool = GetBlock()
+
+    async def blocking_call(i: int) -> dict:
+        # The previous implementation: a synchronous Web3 call inside a coroutine
+        web3 = Web3(Web3.HTTPProvider(rpc_url))
+        return dict(web3.eth.get_block(i))
+
+    async def async_call(i: int) -> dict:
+        return await tool.arun(rpc_url=rpc_url, chain_id=1, block_number=i)
+
+    await async_call(0)  # warm up
+    blocking = await run_concurrently(blocking_call, calls)
+    overlapped = await run_concurrently(async_call, calls)
+
+    print(
+        f"{calls} concurrent get_block calls, {delay * 1000:.0f} ms per RPC round trip"
+    )
+    print(
+        f"  blocking Web3:  {blocking:7.3f} s  (~{calls * delay:.3f} s if serialized)"
+    )
+    print(f"  AsyncWeb3 tool: {overlapped:7.3f} s  (~{delay:.3f} s if overlapped)")
+    print(f"  speed-up:       {blocking / overlapped:7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=20, help="Concurrent calls")
+    parser.add_argument(
+        "--delay", type=float, default=0.2, help="Stub RPC latency in seconds"
+    )
+    args = parser.parse_args()
+    with StubServer(make_rpc_app(Faults(latency=args.delay))) as node:
+        asyncio.run(main_async(node.url, args.calls, args.delay))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Local stand-ins for the upstream services, used by the benchmarks.
+
+``make_rpc_app`` emulates an EVM JSON-RPC node (single and batch requests) and
+``make_oneinch_app`` the ``api.1inch.dev`` endpoints the 1inch tools call. Both
+answer after a configurable latency and fail a configurable share of requests
+(see ``Faults``). ``StubServer`` serves an app on its own thread and event loop,
+so that the stand-in does not compete with the code under test for its loop.
+"""
+
+import asyncio
+import random
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from aiohttp import web
+
+ZERO_HASH = "0x" + "00" * 32
+HEAD_BLOCK = 20_000_000
+
+
+@dataclass
+class Faults:
+    """Latency and errors injected into every response."""
+
+    latency: float = 0.05  # mean seconds before answering
+    jitter: float = 0.0  # standard deviation of the latency
+    error_rate: float = 0.0  # share of requests answered with ``error_status``
+    error_status: int = 500
+
+    async def delay(self) -> None:
+        if self.latency > 0 or self.jitter > 0:
+            await asyncio.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+
+    def error(self) -> Optional[web.Response]:
+        """An error response for the share of requests that should fail."""
+        if self.error_rate > 0 and random.random() < self.error_rate:
+            return web.json_response(
+                {"description": "Injected failure"}, status=self.error_status
+            )
+        return None
+
+
+def make_block(number: int) -> dict:
+    """A minimal, well-formed ``eth_getBlockByNumber`` result."""
+    return {
+        "number": hex(number),
+        "hash": "0x" + f"{number:064x}",
+        "parentHash": "0x" + f"{max(number - 1, 0):064x}",
+        "nonce": "0x0000000000000000",
+        "sha3Uncles": ZERO_HASH,
+        "logsBloom": "0x" + "00" * 256,
+        "transactionsRoot": ZERO_HASH,
+        "stateRoot": ZERO_HASH,
+        "receiptsRoot": ZERO_HASH,
+        "miner": "0x" + "00" * 20,
+        "difficulty": "0x0",
+        "extraData": "0x",
+        "size": "0x220",
+        "gasLimit": "0x1c9c380",
+        "gasUsed": "0x0",
+        "timestamp": hex(1_700_000_000 + number * 12),
+        "transactions": [],
+        "uncles": [],
+    }
+
+
+def make_rpc_app(faults: Optional[Faults] = None) -> web.Application:
+    """JSON-RPC node stand-in answering single and batch requests."""
+    faults = faults or Faults()
+
+    def answer(request: dict) -> dict:
+        method = request.get("method")
+        params = request.get("params") or []
+        if method == "eth_getBlockByNumber":
+            tag = params[0]
+            # "latest", "finalized", "safe": the head is final enough here
+            number = int(tag, 16) if tag.startswith("0x") else HEAD_BLOCK
+            result = make_block(number)
+        elif method == "eth_blockNumber":
+            result = hex(HEAD_BLOCK)
+        elif method == "eth_chainId":
+            result = "0x1"
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {"code": -32601, "message": "Method not found"},
+            }
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        await faults.delay()
+        error = faults.error()
+        if error is not None:
+            return error
+        if isinstance(payload, list):
+            return web.json_response([answer(item) for item in payload])
+        return web.json_response(answer(payload))
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    return app
+
+
+def make_token(chain_id: int, index: int) -> dict:
+    return {
+        "symbol": f"TKN{index}",
+        "name": f"Token {index}",
+        "address": "0x" + f"{chain_id:08x}{index:032x}",
+        "decimals": 18,
+        "logo_uri": f"https://tokens.example/{chain_id}/{index}.png",
+        "amount": 10**18 * (index + 1),
+        "amount_usd": 1.5 * (index + 1),
+    }
+
+
+def make_oneinch_app(
+    faults: Optional[Faults] = None, tokens: int = 20
+) -> web.Application:
+    """
+    ``api.1inch.dev`` stand-in for the paths the 1inch tools request.
+
+    Args:
+        faults: Latency and errors to inject.
+        tokens: Tokens per portfolio, NFT and protocol list, i.e. response size.
+    """
+    faults = faults or Faults()
+
+    def balances(chain_id: int, address: str) -> dict:
+        return {"balances": [make_token(chain_id, i) for i in range(tokens)]}
+
+    def pnl(chain_id: int, address: str) -> dict:
+        return {"result": [{"chain_id": chain_id, "abs_profit_usd": 12.5, "roi": 0.1}]}
+
+    def protocols(chain_id: int, address: str) -> dict:
+        return {
+            "result": [
+                {"protocol_name": f"Protocol {i}", "chain_id": chain_id, "value_usd": i}
+                for i in range(tokens)
+            ]
+        }
+
+    def nfts(chain_id: int, address: str) -> dict:
+        return {
+            "assets": [
+                {"id": str(i), "chain_id": chain_id, "name": f"NFT #{i}"}
+                for i in range(tokens)
+            ]
+        }
+
+    portfolio = {
+        "balances": balances,
+        "pnl": pnl,
+        "protocols": protocols,
+        "nfts": nfts,
+    }
+
+    def route(handler: Callable[[web.Request], object]):
+        async def wrapper(request: web.Request) -> web.Response:
+            await faults.delay()
+            error = faults.error()
+            if error is not None:
+                return error
+            return web.json_response(handler(request))
+
+        return wrapper
+
+    def portfolio_handler(request: web.Request):
+        endpoint = portfolio[request.match_info["endpoint"]]
+        chain_id = int(request.match_info["chain_id"])
+        return endpoint(chain_id, request.match_info["address"])
+
+    def token_search(request: web.Request):
+        token = make_token(int(request.match_info["chain_id"]), 0)
+        return [{**token, "symbol": request.query.get("query", token["symbol"])}]
+
+    def token_custom(request: web.Request):
+        token = make_token(int(request.match_info["chain_id"]), 0)
+        return {**token, "address": request.match_info["address"]}
+
+    def domain_lookup(request: web.Request):
+        return {"result": {"protocol": "ens", "address": "0x" + "ab" * 20}}
+
+    app = web.Application()
+    app.router.add_get(
+        "/portfolio/v3/{chain_id}/{endpoint:balances|pnl|protocols|nfts}/{address}",
+        route(portfolio_handler),
+    )
+    app.router.add_get("/token/v1.2/{chain_id}/search", route(token_search))
+    app.router.add_get("/token/v1.2/{chain_id}/custom/{address}", route(token_custom))
+    app.router.add_get("/domains/v2.0/lookup", route(domain_lookup))
+    return app
+
+
+class StubServer:
+    """Runs a stand-in on its own thread and event loop, like a remote service."""
+
+    def __init__(self, app: web.Application):
+        self.app = app
+        self.url = None
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        # Keep-alive connections from many clients: do not cap the backlog low
+        runner = web.AppRunner(self.app, access_log=None)
+        self._loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+        self._loop.run_until_complete(site.start())
+        port = runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/"
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(runner.cleanup())
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Benchmark lomen's tools under increasing concurrency against local stand-ins.
+
+The 1inch API and an EVM JSON-RPC node are replaced by local aiohttp servers
+(``stubs.py``) with configurable latency, jitter and error injection. Each tool
+runs in a fresh interpreter, so its peak RSS is its own: for every concurrency
+level, that many callers invoke the tool back to back for ``--duration``
+seconds. Reported per level are successful calls per second, p50/p99 latency of
+successful calls, the share of failed calls and the process's peak RSS so far.
+
+Usage:
+    python benchmarks/tool_throughput.py --concurrency 1,8,64 --duration 3
+    python benchmarks/tool_throughput.py --tools get_block,get_portfolio \\
+        --latency 0.1 --error-rate 0.05 --json baseline.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Arguments of the i-th call of each tool; addresses and blocks vary by call so
+# that response caches do not answer every call
+TOOL_CALLS: Dict[str, Callable[[int, str], Dict[str, Any]]] = {
+    "get_blockchain_metadata": lambda i, rpc_url: {"chain_id": 1},
+    "get_block_number": lambda i, rpc_url: {"chain_id": 1, "rpc_url": rpc_url},
+    "get_block": lambda i, rpc_url: {
+        "chain_id": 1,
+        "block_number": 19_000_000 + i,
+        "rpc_url": rpc_url,
+    },
+    "get_blocks": lambda i, rpc_url: {
+        "chain_id": 1,
+        "start_block": 19_000_000 + 10 * i,
+        "end_block": 19_000_000 + 10 * i + 9,
+        "rpc_url": rpc_url,
+    },
+    "get_portfolio": lambda i, rpc_url: {"address": _address(i), "chain_id": 1},
+    "get_portfolio_all_chains": lambda i, rpc_url: {"address": _address(i)},
+    "get_profit_and_loss": lambda i, rpc_url: {"address": _address(i), "chain_id": 1},
+    "get_protocol_investments": lambda i, rpc_url: {
+        "address": _address(i),
+        "chain_id": 1,
+    },
+    "get_nfts_for_address": lambda i, rpc_url: {"address": _address(i), "chain_id": 1},
+    "get_token_info_by_address": lambda i, rpc_url: {
+        "token_address": _address(i),
+        "chain_id": 1,
+    },
+    "get_address_from_domain": lambda i, rpc_url: {"domain": f"user{i}.eth"},
+}
+
+
+def _address(i: int) -> str:
+    return "0x" + f"{i:040x}"
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return float("nan")
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+async def run_level(
+    call: Callable[[], Awaitable[Any]], concurrency: int, duration: float
+) -> Dict[str, Any]:
+    """Call the tool from ``concurrency`` callers for ``duration`` seconds."""
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def caller():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    total = len(latencies) + errors
+    return {
+        "concurrency": concurrency,
+        "calls": total,
+        "calls_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "error_rate": errors / total if total else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+async def worker_async(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Benchmark one tool at every concurrency level (in the worker process)."""
+    from lomen.cli import create_server, instantiate_tools
+
+    tool_name = config["tool"]
+    rpc_url = config["rpc_url"]
+    plugins, found = instantiate_tools([tool_name], lazy=False)
+    if not found:
+        raise SystemExit(f"Unknown tool: {tool_name}")
+    for plugin in plugins:
+        await plugin.startup()
+    # Shared by all levels, so that later levels do not repeat cached calls
+    counter = itertools.count()
+
+    if config["adapter"] == "mcp":
+        # Through the MCP server: argument validation, concurrency limits,
+        # metrics and result serialization included
+        server = create_server(plugins, manage_plugins=False, tool_names=found)
+
+        async def call():
+            arguments = TOOL_CALLS[tool_name](next(counter), rpc_url)
+            return await server.call_tool(tool_name, arguments)
+
+    else:
+        (tool,) = [
+            tool
+            for plugin in plugins
+            for tool in plugin.tools
+            if tool.name == tool_name
+        ]
+
+        async def call():
+            return await tool.arun(**TOOL_CALLS[tool_name](next(counter), rpc_url))
+
+    try:
+        await call()  # warm up connection pools and imports
+        return [
+            await run_level(call, concurrency, config["duration"])
+            for concurrency in config["concurrency"]
+        ]
+    finally:
+        for plugin in plugins:
+            await plugin.aclose()
+
+
+def worker(config: Dict[str, Any]) -> None:
+    # Tools print progress; keep stdout for the results
+    with contextlib.redirect_stdout(sys.stderr):
+        results = asyncio.run(worker_async(config))
+    print(json.dumps(results))
+
+
+def run_tool(config: Dict[str, Any], oneinch_url: str) -> List[Dict[str, Any]]:
+    """Benchmark one tool in a fresh interpreter."""
+    env = {
+        **os.environ,
+        # The plugin makes no real API calls, so a placeholder key is enough
+        "ONEINCH_API_KEY": "benchmark",
+        "ONEINCH_BASE_URL": oneinch_url,
+        # Measure lomen, not the client-side rate limit or the response cache
+        "ONEINCH_RATE_LIMIT_RPS": "0",
+        "ONEINCH_CACHE_SIZE": os.environ.get("ONEINCH_CACHE_SIZE", "0"),
+    }
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", json.dumps(config)],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=None if config["verbose"] else subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Benchmarking {config['tool']} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--tools",
+        default=",".join(TOOL_CALLS),
+        help="Comma-separated tools to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        default="1,8,32,128",
+        help="Comma-separated concurrency levels, run in this order",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=3.0, help="Seconds per concurrency level"
+    )
+    parser.add_argument(
+        "--adapter",
+        choices=("direct", "mcp"),
+        default="direct",
+        help="Call the tools' arun directly or through the MCP server",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Stand-in latency in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.01, help="Latency standard deviation"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of failed responses"
+    )
+    parser.add_argument(
+        "--error-status", type=int, default=500, help="HTTP status of failures"
+    )
+    parser.add_argument(
+        "--tokens", type=int, default=20, help="Tokens per 1inch portfolio response"
+    )
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the tools' output")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(json.loads(args.worker))
+        return
+
+    from stubs import Faults, StubServer, make_oneinch_app, make_rpc_app
+
+    tools = [name.strip() for name in args.tools.split(",") if name.strip()]
+    unknown = sorted(set(tools) - set(TOOL_CALLS))
+    if unknown:
+        parser.error(f"Unknown tools: {', '.join(unknown)}")
+    levels = [int(level) for level in args.concurrency.split(",")]
+    faults = Faults(args.latency, args.jitter, args.error_rate, args.error_status)
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    with (
+        StubServer(make_rpc_app(faults)) as node,
+        StubServer(make_oneinch_app(faults, tokens=args.tokens)) as oneinch,
+    ):
+        print(
+            f"{args.adapter} calls, stand-in latency {args.latency * 1000:.0f} "
+            f"+/- {args.jitter * 1000:.0f} ms, error rate {args.error_rate:.0%}, "
+            f"{args.duration:g} s per level"
+        )
+        print(
+            f"{'tool':26s} {'conc':>5s} {'calls/s':>9s} {'p50 ms':>8s} "
+            f"{'p99 ms':>8s} {'errors':>7s} {'peak RSS':>9s}"
+        )
+        for tool in tools:
+            config = {
+                "tool": tool,
+                "rpc_url": node.url,
+                "adapter": args.adapter,
+                "concurrency": levels,
+                "duration": args.duration,
+                "verbose": args.verbose,
+            }
+            results[tool] = run_tool(config, oneinch.url)
+            for level in results[tool]:
+                print(
+                    f"{tool:26s} {level['concurrency']:5d} "
+                    f"{level['calls_per_second']:9.1f} {level['p50_ms']:8.1f} "
+                    f"{level['p99_ms']:8.1f} {level['error_rate']:7.1%} "
+                    f"{level['peak_rss_mb']:6.1f} MB"
+                )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
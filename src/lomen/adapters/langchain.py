@@ -1,14 +1,67 @@
-from typing import List
+import asyncio
+import threading
+from typing import Any, Awaitable, List, Optional, TypeVar
 
 from langchain_core.tools import StructuredTool
 
-from lomen.plugins.base import BasePlugin
+from lomen.metrics import instrument
+from lomen.plugins.base import BasePlugin, BaseTool
+from lomen.tracing import trace_tool
+
+T = TypeVar("T")
+
+# Event loop running in a daemon thread, shared by every synchronous tool call
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="lomen-langchain-loop", daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+        return _background_loop
+
+
+def run_sync(coroutine: Awaitable[T]) -> T:
+    """
+    Run a coroutine on the adapter's persistent background event loop.
+
+    Synchronous tool calls go through this loop, so loop-bound resources (HTTP
+    sessions, pooled RPC clients) are created once and reused across calls.
+    Release them on the same loop, e.g. ``run_sync(plugin.aclose())``.
+
+    Args:
+        coroutine: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_background_loop()).result()
+
+
+def _overrides(tool: BaseTool, method_name: str) -> bool:
+    """Whether the tool provides its own ``method_name`` instead of BaseTool's."""
+    method = getattr(tool, method_name, None)
+    if not callable(method):
+        return False
+    return getattr(method, "__func__", None) is not getattr(BaseTool, method_name)
 
 
 def register_langchain_tools(plugins: List[BasePlugin]) -> List[StructuredTool]:
     """
     Register tools from plugins to the LangChain structured tool.
 
+    A tool's ``arun`` becomes the StructuredTool's coroutine, so async runners
+    such as LangGraph's ``ToolNode`` execute calls concurrently on their own event
+    loop. Synchronous calls run ``arun`` on a persistent background loop (see
+    ``run_sync``); tools that only implement ``run`` are called directly.
+
     Args:
         plugins: A list of BasePlugin instances.
 
@@ -23,10 +76,20 @@ def register_langchain_tools(plugins: List[BasePlugin]) -> List[StructuredTool]:
 
         return wrapper
 
-    for plugin in plugins:
-        for tool_class in plugin.tools:
-            tool_instance = tool_class  # Create an instance of the tool
+    def create_sync_fallback(coroutine_function):
+        def wrapper(**kwargs):
+            return run_sync(coroutine_function(**kwargs))
+
+        return wrapper
+
+    def create_coroutine(instance):
+        async def wrapper(**kwargs):
+            return await instance.arun(**kwargs)
 
+        return wrapper
+
+    for plugin in plugins:
+        for tool_instance in plugin.tools:
             # Get schema if available
             schema = None
             if hasattr(tool_instance, "get_params") and callable(
@@ -34,17 +97,31 @@ def register_langchain_tools(plugins: List[BasePlugin]) -> List[StructuredTool]:
             ):
                 schema = tool_instance.get_params()
 
-            # Get description from docstring
-            description = tool_instance.run.__doc__ or ""
+            # Calls are recorded in lomen.metrics and traced (see lomen.tracing)
+            tool_name = getattr(tool_instance, "name", tool_instance.__class__.__name__)
 
-            # Create wrapper for this specific instance's run method
-            wrapper_func = create_wrapper(tool_instance)
+            # Get description from the docstring of the method doing the work
+            if _overrides(tool_instance, "arun"):
+                coroutine = trace_tool(
+                    tool_name,
+                    instrument(tool_name, create_coroutine(tool_instance)),
+                )
+                # Runs the same coroutine, so the span lives on the background loop
+                func: Any = create_sync_fallback(coroutine)
+                description = tool_instance.arun.__doc__ or ""
+            else:
+                # Synchronous-only tool
+                func = trace_tool(
+                    tool_name, instrument(tool_name, create_wrapper(tool_instance))
+                )
+                coroutine = None
+                description = tool_instance.run.__doc__ or ""
 
             # Create the structured tool
-            tool_name = getattr(tool_instance, "name", tool_instance.__class__.__name__)
             structured_tools.append(
                 StructuredTool.from_function(
-                    func=wrapper_func,
+                    func=func,
+                    coroutine=coroutine,
                     name=tool_name,
                     description=description,
                     args_schema=schema,
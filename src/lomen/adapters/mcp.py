@@ -1,28 +1,392 @@
-from typing import List
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import math
+import os
+import time
 import traceback
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
-from lomen.plugins.base import BasePlugin
+from lomen.metrics import MetricsRegistry, instrument, metrics
+from lomen.plugins.base import PARTIAL_RESULT_KWARG, BasePlugin, BaseTool
+from lomen.tracing import trace_tool
 
+logger = logging.getLogger(__name__)
 
-def register_mcp_tools(server: FastMCP, plugins: List[BasePlugin]) -> FastMCP:
+MAX_CONCURRENCY_ENV = "LOMEN_MAX_CONCURRENCY"
+MAX_TOOL_CONCURRENCY_ENV = "LOMEN_MAX_TOOL_CONCURRENCY"
+TOOL_CONCURRENCY_ENV = "LOMEN_TOOL_CONCURRENCY"
+MAX_QUEUE_ENV = "LOMEN_MAX_QUEUE"
+QUEUE_TIMEOUT_ENV = "LOMEN_QUEUE_TIMEOUT"
+
+DEFAULT_MAX_CONCURRENCY = 64  # tool calls running at once, across all tools
+DEFAULT_MAX_TOOL_CONCURRENCY = 16  # calls of any single tool running at once
+DEFAULT_MAX_QUEUE = 256  # calls waiting for a slot before new ones are rejected
+DEFAULT_QUEUE_TIMEOUT = 30.0  # seconds a call may wait for a slot
+WAIT_WINDOW = 1024  # recent queue waits kept for percentiles
+
+
+class ToolBusyError(Exception):
+    """Raised when a tool call is rejected because the server is overloaded."""
+
+
+def _parse_tool_limits(value: str) -> Dict[str, int]:
+    """Parse ``name=limit`` pairs separated by commas, e.g. ``get_blocks=2``."""
+    limits = {}
+    for item in value.split(","):
+        name, _, limit = item.partition("=")
+        if name.strip() and limit.strip():
+            limits[name.strip()] = int(limit)
+    return limits
+
+
+def _percentile(samples: Deque[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = math.ceil(percentile / 100 * len(ordered)) - 1
+    return ordered[min(max(index, 0), len(ordered) - 1)]
+
+
+class _ToolSlots:
+    __slots__ = ("limit", "semaphore", "running", "waiting", "calls", "rejected")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+        self.running = 0
+        self.waiting = 0
+        self.calls = 0
+        self.rejected = 0
+
+
+class ToolExecutor:
+    """
+    Runs tool calls with global and per-tool concurrency caps.
+
+    A call first takes a slot of its tool, then one of the global pool. Calls
+    that cannot start immediately wait in a bounded queue; once ``max_queue``
+    calls are waiting, or a call has waited ``queue_timeout`` seconds, calls fail
+    fast with ``ToolBusyError`` instead of piling up upstream connections. Queue
+    wait times and rejections are recorded for ``stats`` and in ``lomen.metrics``.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_tool_concurrency: Optional[int] = None,
+        tool_limits: Optional[Dict[str, int]] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Args:
+            max_concurrency: Tool calls running at once across all tools (defaults
+                to LOMEN_MAX_CONCURRENCY or 64).
+            max_tool_concurrency: Calls of a single tool running at once (defaults
+                to LOMEN_MAX_TOOL_CONCURRENCY or 16).
+            tool_limits: Per-tool overrides of ``max_tool_concurrency`` (defaults
+                to LOMEN_TOOL_CONCURRENCY, e.g. ``get_portfolio_all_chains=4``).
+            max_queue: Calls allowed to wait for a slot (defaults to
+                LOMEN_MAX_QUEUE or 256; 0 rejects every call that cannot start).
+            queue_timeout: Seconds a call may wait for a slot (defaults to
+                LOMEN_QUEUE_TIMEOUT or 30; 0 waits without limit).
+            registry: Where to record queue waits and rejections (defaults to
+                the process-wide registry).
+        """
+        self.max_concurrency = (
+            max_concurrency
+            if max_concurrency is not None
+            else int(os.environ.get(MAX_CONCURRENCY_ENV, DEFAULT_MAX_CONCURRENCY))
+        )
+        self.max_tool_concurrency = (
+            max_tool_concurrency
+            if max_tool_concurrency is not None
+            else int(
+                os.environ.get(MAX_TOOL_CONCURRENCY_ENV, DEFAULT_MAX_TOOL_CONCURRENCY)
+            )
+        )
+        self.tool_limits = (
+            tool_limits
+            if tool_limits is not None
+            else _parse_tool_limits(os.environ.get(TOOL_CONCURRENCY_ENV, ""))
+        )
+        self.max_queue = (
+            max_queue
+            if max_queue is not None
+            else int(os.environ.get(MAX_QUEUE_ENV, DEFAULT_MAX_QUEUE))
+        )
+        self.queue_timeout = (
+            queue_timeout
+            if queue_timeout is not None
+            else float(os.environ.get(QUEUE_TIMEOUT_ENV, DEFAULT_QUEUE_TIMEOUT))
+        )
+        self.registry = registry if registry is not None else metrics
+        if self.max_concurrency < 1 or self.max_tool_concurrency < 1:
+            raise ValueError("Concurrency limits must be at least 1.")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global: Optional[asyncio.Semaphore] = None
+        self._tools: Dict[str, _ToolSlots] = {}
+
+        # Metrics
+        self._running = 0
+        self._waiting = 0
+        self._max_waiting = 0
+        self._calls = 0
+        self._queued = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._waits: Deque[float] = deque(maxlen=WAIT_WINDOW)
+
+    def _bind_loop(self) -> None:
+        # Semaphores bind to the loop they are first contended on, so keep them
+        # per loop (in practice the server's single loop)
+        loop = asyncio.get_running_loop()
+        if self._global is None or self._loop is not loop:
+            self._global = asyncio.Semaphore(self.max_concurrency)
+            self._tools = {}
+            self._loop = loop
+
+    def _slots(self, tool_name: str) -> _ToolSlots:
+        slots = self._tools.get(tool_name)
+        if slots is None:
+            limit = self.tool_limits.get(tool_name, self.max_tool_concurrency)
+            slots = _ToolSlots(max(1, min(limit, self.max_concurrency)))
+            self._tools[tool_name] = slots
+        return slots
+
+    async def _acquire_both(self, slots: _ToolSlots) -> None:
+        await slots.semaphore.acquire()
+        try:
+            await self._global.acquire()
+        except BaseException:
+            slots.semaphore.release()
+            raise
+
+    def _reject(self, tool_name: str, slots: _ToolSlots, cause: str, reason: str):
+        self._rejected += 1
+        slots.rejected += 1
+        self.registry.observe_rejection(tool_name, cause)
+        return ToolBusyError(
+            f"Server busy: tool '{tool_name}' {reason}; please retry later."
+        )
+
+    @asynccontextmanager
+    async def slot(self, tool_name: str) -> AsyncIterator[float]:
+        """
+        Hold a slot of ``tool_name`` and of the global pool for a call.
+
+        Args:
+            tool_name: The tool being called.
+
+        Yields:
+            The number of seconds spent waiting for the slot.
+
+        Raises:
+            ToolBusyError: If the queue is full or the wait timed out.
+        """
+        self._bind_loop()
+        slots = self._slots(tool_name)
+        start = time.monotonic()
+
+        if slots.semaphore.locked() or self._global.locked():
+            if self._waiting >= self.max_queue:
+                raise self._reject(
+                    tool_name, slots, "queue_full", f"has {self._waiting} calls queued"
+                )
+            self._waiting += 1
+            slots.waiting += 1
+            self._max_waiting = max(self._max_waiting, self._waiting)
+            self._queued += 1
+            try:
+                await asyncio.wait_for(
+                    self._acquire_both(slots), timeout=self.queue_timeout or None
+                )
+            except asyncio.TimeoutError:
+                self._timed_out += 1
+                raise self._reject(
+                    tool_name,
+                    slots,
+                    "timeout",
+                    f"found no free slot within {self.queue_timeout}s",
+                ) from None
+            finally:
+                self._waiting -= 1
+                slots.waiting -= 1
+        else:
+            await self._acquire_both(slots)
+
+        waited = time.monotonic() - start
+        self._calls += 1
+        slots.calls += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        self._waits.append(waited)
+        self.registry.observe_queue_wait(tool_name, waited)
+        self._running += 1
+        slots.running += 1
+        try:
+            yield waited
+        finally:
+            self._running -= 1
+            slots.running -= 1
+            self._global.release()
+            slots.semaphore.release()
+
+    def wrap(self, tool_name: str, func: Callable) -> Callable:
+        """
+        Wrap a tool's coroutine function so every call runs in a slot.
+
+        The wrapper keeps ``func``'s name, docstring and signature, so FastMCP
+        derives the same input schema from it.
+        """
+
+        @functools.wraps(func)
+        async def limited(*args, **kwargs):
+            async with self.slot(tool_name):
+                return await func(*args, **kwargs)
+
+        return limited
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return concurrency and queue metrics.
+
+        Returns:
+            Dictionary with the configured limits, the number of running and
+            queued calls (and the highest queue depth seen), totals of started,
+            queued, rejected and timed-out calls, queue wait times in seconds
+            (average, maximum, p50/p95 over recent calls) and, per tool, its
+            limit, running and queued calls, calls and rejections.
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "running": self._running,
+            "waiting": self._waiting,
+            "max_waiting": self._max_waiting,
+            "calls": self._calls,
+            "queued": self._queued,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "avg_wait_seconds": self._total_wait / self._calls if self._calls else 0.0,
+            "max_wait_seconds": self._max_wait,
+            "p50_wait_seconds": _percentile(self._waits, 50) if self._waits else 0.0,
+            "p95_wait_seconds": _percentile(self._waits, 95) if self._waits else 0.0,
+            "tools": {
+                tool_name: {
+                    "limit": slots.limit,
+                    "running": slots.running,
+                    "waiting": slots.waiting,
+                    "calls": slots.calls,
+                    "rejected": slots.rejected,
+                }
+                for tool_name, slots in self._tools.items()
+            },
+        }
+
+
+def _make_streaming_handler(tool_instance: BaseTool) -> Callable:
+    """
+    Wrap a streaming tool's ``arun`` so partial results reach the MCP client.
+
+    The returned coroutine function exposes the same parameters as ``arun``
+    except the partial-result callback, plus a FastMCP ``Context``. Each partial
+    result is sent as a progress notification and a log message before the final
+    result is returned.
+    """
+    arun = tool_instance.arun
+    signature = inspect.signature(arun)
+    parameters = [
+        param
+        for name, param in signature.parameters.items()
+        if name != PARTIAL_RESULT_KWARG
+    ]
+    parameters.append(
+        inspect.Parameter(
+            "ctx", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Context
+        )
+    )
+
+    @functools.wraps(arun)
+    async def handler(ctx: Context = None, **kwargs):
+        received = 0
+
+        async def forward(partial: Dict[str, Any]) -> None:
+            nonlocal received
+            received += 1
+            if ctx is None:
+                return
+            await ctx.report_progress(received)
+            await ctx.info(json.dumps(partial, default=str))
+
+        return await arun(**kwargs, **{PARTIAL_RESULT_KWARG: forward})
+
+    handler.__signature__ = signature.replace(parameters=parameters)
+    # wraps copied arun's annotations; FastMCP finds the Context parameter
+    # through the type hints, so they must match the patched signature
+    handler.__annotations__ = {
+        name: annotation
+        for name, annotation in arun.__annotations__.items()
+        if name != PARTIAL_RESULT_KWARG
+    }
+    handler.__annotations__["ctx"] = Context
+    return handler
+
+
+def register_mcp_tools(
+    server: FastMCP,
+    plugins: List[BasePlugin],
+    executor: Optional[ToolExecutor] = None,
+    tool_names: Optional[Iterable[str]] = None,
+) -> FastMCP:
     """
     Register tools from plugins to the MCP server.
 
+    Every tool call runs through ``executor``, which caps concurrent calls and
+    rejects calls with ``ToolBusyError`` when overloaded, and is recorded in
+    ``lomen.metrics`` once it got a slot; the executor's running and queued
+    calls, queue waits and rejections are reported there too. With tracing on
+    (see ``lomen.tracing``) every call runs in a ``tool <name>`` span.
+
     Args:
         server: The MCP server instance.
         plugins: A list of BasePlugin instances.
+        executor: Concurrency limits to run the tools with. Defaults to a new
+            ``ToolExecutor`` configured from the environment.
+        tool_names: Only register the tools with these names (default: all
+            tools of the plugins).
 
     Returns:
         The MCP server instance with the registered tools.
     """
+    executor = executor if executor is not None else ToolExecutor()
+    executor.registry.track_executor(executor)
+    selected = None if tool_names is None else set(tool_names)
 
     for plugin in plugins:
         plugin_tools = []
         try:
             plugin_tools = plugin.tools
             print(f"Found {len(plugin_tools)} tools in plugin '{plugin.name}'")
+            if selected is not None:
+                plugin_tools = [tool for tool in plugin_tools if tool.name in selected]
         except Exception as e:
             print(f"Error getting tools from plugin '{plugin.name}': {e}")
             continue
@@ -36,6 +400,13 @@ def register_mcp_tools(server: FastMCP, plugins: List[BasePlugin]) -> FastMCP:
                 # All tools should now have 'arun', register it directly
                 if hasattr(tool_instance, "arun") and callable(tool_instance.arun):
                     exec_func = tool_instance.arun
+                    if PARTIAL_RESULT_KWARG in inspect.signature(exec_func).parameters:
+                        exec_func = _make_streaming_handler(tool_instance)
+                    exec_func = executor.wrap(
+                        tool_name, instrument(tool_name, exec_func)
+                    )
+                    # The span also covers the wait for an executor slot
+                    exec_func = trace_tool(tool_name, exec_func)
                     description = tool_instance.arun.__doc__ or ""
 
                     # Register the arun method, relying on FastMCP introspection
@@ -55,3 +426,44 @@ def register_mcp_tools(server: FastMCP, plugins: List[BasePlugin]) -> FastMCP:
                 print(traceback.format_exc())
 
     return server
+
+
+def plugins_lifespan(plugins: List[BasePlugin]):
+    """
+    Build a FastMCP lifespan that starts plugins and releases their resources.
+
+    Each plugin's async ``startup`` method is awaited before the server accepts
+    requests. Plugins that hold long-lived resources (e.g. pooled HTTP sessions)
+    expose an async ``aclose`` method, which is awaited when the server stops.
+
+    Args:
+        plugins: The plugins whose tools are served.
+
+    Returns:
+        A callable suitable for ``FastMCP(lifespan=...)``.
+    """
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP):
+        for plugin in plugins:
+            startup = getattr(plugin, "startup", None)
+            if startup is None:
+                continue
+            try:
+                await startup()
+            except Exception:
+                # Not print: under the stdio transport stdout is the MCP stream
+                logger.exception("Error starting plugin '%s'", plugin.name)
+        try:
+            yield {}
+        finally:
+            for plugin in plugins:
+                aclose = getattr(plugin, "aclose", None)
+                if aclose is None:
+                    continue
+                try:
+                    await aclose()
+                except Exception:
+                    logger.exception("Error closing plugin '%s'", plugin.name)
+
+    return lifespan
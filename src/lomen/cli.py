@@ -4,62 +4,84 @@
 import argparse
 import asyncio
 import os
-import importlib
 import sys
-from typing import Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI
-from mcp.server.fastmcp import FastMCP
-import uvicorn
-
-from lomen.adapters.mcp import register_mcp_tools
 from lomen.plugins.base import BasePlugin
+from lomen.plugins.manifest import create_plugin, find_manifests
+from lomen.registry import PluginRegistry
+
+# The MCP server stack is imported only when a server is started, so that
+# ``lomen tokens`` and plugin discovery stay fast
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+    from starlette.applications import Starlette
+
+    from lomen.adapters.mcp import ToolExecutor
+
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+# How the CLI tells uvicorn worker processes what to serve
+SERVE_PLUGINS_ENV = "LOMEN_SERVE_PLUGINS"
+SERVE_TRANSPORT_ENV = "LOMEN_SERVE_TRANSPORT"
+SERVE_TOOLS_ENV = "LOMEN_SERVE_TOOLS"
+
+DEFAULT_BACKLOG = 2048  # pending TCP connections per listening socket
+# Longer than the 60s idle timeout of common load balancers, so they never reuse a
+# connection the server is about to close
+DEFAULT_KEEP_ALIVE = 75
 
+METRICS_PATH = "/metrics"
 
-def find_plugins() -> Dict[str, type]:
-    """Find and return all available plugin classes."""
-    from lomen.plugins import oneinch, blockchain, evm_rpc
 
-    plugin_modules = [oneinch, blockchain, evm_rpc]
-    plugins = {}
+def check_transport(transport: str) -> None:
+    """
+    Check the installed MCP SDK can serve ``transport``.
 
-    for module in plugin_modules:
-        for item_name in dir(module):
-            item = getattr(module, item_name)
-            try:
-                if (
-                    isinstance(item, type)
-                    and issubclass(item, BasePlugin)
-                    and item is not BasePlugin
-                ):
-                    plugins[item.__name__.lower().replace("plugin", "")] = item
-            except TypeError:
-                # Not a class or other type error
-                continue
+    Raises:
+        ValueError: If the transport needs a newer MCP SDK.
+    """
+    from mcp.server.fastmcp import FastMCP
 
-    return plugins
+    if transport == "streamable-http" and not hasattr(FastMCP, "streamable_http_app"):
+        raise ValueError(
+            "The streamable-http transport needs mcp>=1.8; upgrade mcp or use "
+            "--transport sse."
+        )
+
+
+def find_plugins() -> Dict[str, Dict[str, Any]]:
+    """Find all available plugins, keyed by name, from their manifests."""
+    return find_manifests()
 
 
 def instantiate_plugins(
-    plugin_names: List[str], all_plugins: bool = False
+    plugin_names: List[str], all_plugins: bool = False, lazy: bool = True
 ) -> List[BasePlugin]:
-    """Instantiate the requested plugins."""
+    """
+    Instantiate the requested plugins.
+
+    With ``lazy`` (the default), plugins shipping a manifest are served from it
+    and their implementation is imported on the first tool call.
+    """
     available_plugins = find_plugins()
+    # Also accept names without underscores (e.g. "evmrpc")
+    aliases = {name.replace("_", ""): name for name in available_plugins}
 
     if all_plugins:
         plugin_names = list(available_plugins.keys())
 
     instances = []
     for name in plugin_names:
-        if name not in available_plugins:
+        key = name if name in available_plugins else aliases.get(name.replace("_", ""))
+        if key is None:
             print(f"Warning: Plugin '{name}' not found and will be skipped")
             continue
 
-        plugin_class = available_plugins[name]
-
         try:
             # No API key needed - plugins get them from environment
-            instance = plugin_class()
+            instance = create_plugin(available_plugins[key], lazy=lazy)
             instances.append(instance)
             print(f"Loaded plugin: {instance.name}")
         except Exception as e:
@@ -67,15 +89,321 @@ def instantiate_plugins(
     return instances
 
 
-async def print_registered_tools(server: FastMCP):
+def instantiate_tools(
+    tool_names: List[str], lazy: bool = True
+) -> Tuple[List[BasePlugin], List[str]]:
+    """
+    Instantiate the plugins providing the requested tools.
+
+    Tool names are resolved through a registry of the discovered plugins, which
+    are listed from their manifests; with ``lazy`` (the default) only the plugins
+    owning a selected tool are imported, on the first call to one of its tools.
+
+    Returns:
+        The owning plugins and the names of the tools that were found.
+    """
+    registry = PluginRegistry()
+    registry.discover_plugins(lazy=lazy)
+
+    plugins: Dict[str, BasePlugin] = {}
+    found = []
+    for name in tool_names:
+        plugin = registry.get_tool_plugin(name)
+        if plugin is None:
+            print(f"Warning: Tool '{name}' not found and will be skipped")
+            continue
+        if plugin.name not in plugins:
+            plugins[plugin.name] = plugin
+            print(f"Loaded plugin: {plugin.name}")
+        found.append(name)
+    return list(plugins.values()), found
+
+
+def create_server(
+    plugins: List[BasePlugin],
+    manage_plugins: bool = True,
+    tool_names: Optional[List[str]] = None,
+    executor: Optional["ToolExecutor"] = None,
+    **settings: Any,
+) -> "FastMCP":
+    """
+    Create the MCP server exposing the tools of ``plugins``.
+
+    Args:
+        plugins: The plugins whose tools are served.
+        manage_plugins: Start and close the plugins in the MCP server's lifespan.
+            The server enters that lifespan once per session, which suits stdio;
+            HTTP apps manage plugins in the app lifespan instead (``create_app``).
+        tool_names: Only expose these tools (default: all tools of the plugins).
+        executor: Concurrency limits to run the tools with (defaults to a new
+            ``ToolExecutor`` configured from the environment). Its metrics are
+            reported by ``lomen.metrics``.
+        **settings: Additional FastMCP settings.
+    """
+    from mcp.server.fastmcp import FastMCP
+
+    from lomen.adapters.mcp import plugins_lifespan, register_mcp_tools
+
+    # Plugin resources (such as pooled HTTP sessions) are released when the
+    # server shuts down
+    server = FastMCP(
+        name="Lomen MCP Server",
+        lifespan=plugins_lifespan(plugins) if manage_plugins else None,
+        **settings,
+    )
+
+    # Register the plugin tools with the MCP server
+    return register_mcp_tools(server, plugins, executor=executor, tool_names=tool_names)
+
+
+def create_app(
+    plugins: List[BasePlugin],
+    transport: str = "sse",
+    stateless: bool = False,
+    server: Optional["FastMCP"] = None,
+    tool_names: Optional[List[str]] = None,
+    executor: Optional["ToolExecutor"] = None,
+) -> "Starlette":
+    """
+    Create an ASGI app serving the tools of ``plugins`` over HTTP.
+
+    The plugins are started when the app starts and closed when it shuts down,
+    and are shared by all MCP sessions of the process. ``GET /metrics`` returns
+    the process's tool, upstream and executor metrics in the Prometheus text
+    format. The tool executor is kept in ``app.state.executor``.
+
+    Args:
+        plugins: The plugins whose tools are served.
+        transport: ``sse`` or ``streamable-http``.
+        stateless: Serve streamable HTTP without server-side sessions, so any
+            worker process can answer any request.
+        server: The MCP server to serve, created with ``manage_plugins=False``
+            (defaults to a new one).
+        tool_names: Only expose these tools when creating the server (default:
+            all tools of the plugins).
+        executor: The executor the tools run with; pass the one given to
+            ``create_server`` with ``server``, or leave it out to create one with
+            the server.
+
+    Returns:
+        The Starlette app.
+
+    Raises:
+        ValueError: If the transport is unknown or not supported by the
+            installed MCP SDK.
+    """
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from lomen import metrics
+    from lomen.adapters.mcp import ToolExecutor, plugins_lifespan
+
+    if server is None:
+        executor = executor if executor is not None else ToolExecutor()
+        server = create_server(
+            plugins,
+            manage_plugins=False,
+            tool_names=tool_names,
+            executor=executor,
+            stateless_http=stateless,
+        )
+    if transport == "streamable-http":
+        check_transport(transport)
+        app = server.streamable_http_app()
+    elif transport == "sse":
+        app = server.sse_app()
+    else:
+        raise ValueError(f"Unknown HTTP transport: {transport}")
+
+    # Keep the transport's own lifespan (e.g. the streamable HTTP session manager)
+    transport_lifespan = app.router.lifespan_context
+    plugins_running = plugins_lifespan(plugins)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with plugins_running(server):
+            async with transport_lifespan(app) as state:
+                yield state
+
+    app.router.lifespan_context = lifespan
+    app.state.executor = executor
+
+    async def render_metrics(request):
+        return PlainTextResponse(
+            metrics.render_prometheus(), media_type=metrics.CONTENT_TYPE
+        )
+
+    app.router.routes.append(Route(METRICS_PATH, render_metrics, methods=["GET"]))
+    return app
+
+
+def app_factory() -> "Starlette":
+    """
+    Build the HTTP app in a uvicorn worker process.
+
+    The selection and transport are passed by ``main`` in the
+    ``LOMEN_SERVE_TOOLS`` or ``LOMEN_SERVE_PLUGINS`` (``*`` for all plugins) and
+    ``LOMEN_SERVE_TRANSPORT`` environment variables. Streamable HTTP is served
+    statelessly, since consecutive requests of a client may reach different
+    workers.
+    """
+    tools = os.environ.get(SERVE_TOOLS_ENV)
+    selection = os.environ.get(SERVE_PLUGINS_ENV, "*")
+    transport = os.environ.get(SERVE_TRANSPORT_ENV, "streamable-http")
+    tool_names = None
+    if tools:
+        plugins, tool_names = instantiate_tools(tools.split(","))
+    elif selection == "*":
+        plugins = instantiate_plugins([], all_plugins=True)
+    else:
+        plugins = instantiate_plugins(selection.split(","))
+    return create_app(plugins, transport, stateless=True, tool_names=tool_names)
+
+
+def serve_http(
+    server: "FastMCP",
+    plugins: List[BasePlugin],
+    plugin_names: Optional[List[str]],
+    transport: str,
+    host: str,
+    port: int,
+    workers: int = 1,
+    backlog: int = DEFAULT_BACKLOG,
+    keep_alive: int = DEFAULT_KEEP_ALIVE,
+    tool_names: Optional[List[str]] = None,
+) -> None:
+    """
+    Serve the MCP server over HTTP with uvicorn.
+
+    Args:
+        server: The MCP server to serve with a single worker.
+        plugins: The plugins of ``server``.
+        plugin_names: Names of the plugins for worker processes (None for all).
+        transport: ``sse`` or ``streamable-http``.
+        host: Host to listen on.
+        port: Port to listen on.
+        workers: Number of worker processes.
+        backlog: Maximum number of pending connections.
+        keep_alive: Seconds to keep idle HTTP connections open.
+        tool_names: Names of the selected tools for worker processes (None for
+            all tools of the plugins).
+
+    Raises:
+        ValueError: If the installed MCP SDK cannot serve ``transport``.
+    """
+    import uvicorn
+
+    # Worker processes build the app themselves, where errors would only make
+    # uvicorn restart them
+    check_transport(transport)
+
+    config = {
+        "host": host,
+        "port": port,
+        "backlog": backlog,
+        "timeout_keep_alive": keep_alive,
+        "log_level": "info",
+    }
+    if workers > 1:
+        # Every worker builds its own app (and plugins) from the import string
+        os.environ[SERVE_PLUGINS_ENV] = (
+            "*" if plugin_names is None else ",".join(plugin_names)
+        )
+        os.environ[SERVE_TOOLS_ENV] = ",".join(tool_names or [])
+        os.environ[SERVE_TRANSPORT_ENV] = transport
+        uvicorn.run("lomen.cli:app_factory", factory=True, workers=workers, **config)
+    else:
+        uvicorn.run(create_app(plugins, transport, server=server), **config)
+
+
+async def print_registered_tools(server: "FastMCP"):
     """Print detailed information about registered tools."""
     registered_tools = await server.list_tools()
     print("\n=== Registered Tools ===")
     print(f"Total tools registered: {len(registered_tools)}")
 
 
-def main():
+async def _sync_tokens(
+    chain_ids: Optional[List[int]], directory: Optional[str], force: bool
+) -> List[Dict]:
+    """Download the 1inch token lists with a short-lived client."""
+    from lomen.plugins.oneinch.client import OneInchClient
+    from lomen.plugins.oneinch.token_sync import sync_tokens
+
+    client = OneInchClient(os.environ["ONEINCH_API_KEY"])
+    try:
+        return await sync_tokens(
+            client, chain_ids=chain_ids, directory=directory, force=force
+        )
+    finally:
+        await client.aclose()
+
+
+def tokens_main(argv: List[str]):
+    """Entry point for ``lomen tokens``: manage the local 1inch token cache."""
+    parser = argparse.ArgumentParser(
+        prog="lomen tokens", description="Manage the local 1inch token list cache"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    sync_parser = subparsers.add_parser(
+        "sync", help="Download the token list of each supported chain"
+    )
+    sync_parser.add_argument(
+        "--chains",
+        type=str,
+        help="Comma-separated chain IDs to sync (default: all 1inch chains)",
+    )
+    sync_parser.add_argument(
+        "--dir",
+        type=str,
+        help=(
+            "Token cache directory (default: LOMEN_TOKENS_DIR or the bundled "
+            "tokens directory)"
+        ),
+    )
+    sync_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download full lists even if they have not changed",
+    )
+
+    args = parser.parse_args(argv)
+
+    if not os.environ.get("ONEINCH_API_KEY"):
+        print("Error: the ONEINCH_API_KEY environment variable must be set.")
+        sys.exit(1)
+
+    chain_ids = None
+    if args.chains:
+        try:
+            chain_ids = [int(chain.strip()) for chain in args.chains.split(",")]
+        except ValueError:
+            parser.error("--chains must be a comma-separated list of chain IDs")
+
+    results = asyncio.run(_sync_tokens(chain_ids, args.dir, args.force))
+
+    failed = 0
+    for result in results:
+        status = result["status"]
+        if status == "updated":
+            print(f"Chain {result['chain_id']}: updated ({result['tokens']} tokens)")
+        elif status == "unchanged":
+            print(f"Chain {result['chain_id']}: unchanged")
+        else:
+            failed += 1
+            print(f"Chain {result['chain_id']}: error: {result['error']}")
+    if failed:
+        sys.exit(1)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "tokens":
+        tokens_main(argv[1:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Run Lomen MCP server with specified plugins and tools"
     )
@@ -100,27 +428,56 @@ def main():
     parser.add_argument(
         "--port", type=int, default=8000, help="Port to listen on (default: 8000)"
     )
-
-    args = parser.parse_args()
-
-    # Initialize the MCP server with proper server_info
-    server = FastMCP(
-        server_info={"name": "Lomen MCP Server", "version": "0.1.1"},
-        capabilities={"resources": {}, "tools": {}},
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default="stdio",
+        help="MCP transport (default: stdio); sse and streamable-http serve "
+        "many clients over HTTP",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for HTTP transports (default: 1; more than one "
+        "requires streamable-http)",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=DEFAULT_BACKLOG,
+        help=f"Maximum pending connections (default: {DEFAULT_BACKLOG})",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=DEFAULT_KEEP_ALIVE,
+        help="Seconds to keep idle HTTP connections open "
+        f"(default: {DEFAULT_KEEP_ALIVE})",
     )
 
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.transport != "streamable-http":
+        # SSE messages must reach the process holding the session's stream
+        parser.error("--workers > 1 requires --transport streamable-http")
+    try:
+        check_transport(args.transport)
+    except ValueError as e:
+        parser.error(str(e))
+
     # Load the appropriate plugins
+    plugin_names = None
+    tool_names = None
     if args.all:
         plugins = instantiate_plugins([], all_plugins=True)
     elif args.plugins:
         plugin_names = [name.strip() for name in args.plugins.split(",")]
         plugins = instantiate_plugins(plugin_names)
     elif args.tools:
-        # This would need a more complex implementation to find specific tools
-        # For now, we'll just print an error and exit
-        print("Tool-specific selection not yet implemented.")
-        print("Please use --plugins to select specific plugins instead.")
-        sys.exit(1)
+        requested = [name.strip() for name in args.tools.split(",") if name.strip()]
+        plugins, tool_names = instantiate_tools(requested)
 
     if not plugins:
         print(
@@ -128,15 +485,39 @@ def main():
         )
         sys.exit(1)
 
-    # Register the plugin tools with the MCP server
-    server = register_mcp_tools(server, plugins)
+    # Over HTTP, plugins are managed by the app rather than per MCP session
+    server = create_server(
+        plugins, manage_plugins=args.transport == "stdio", tool_names=tool_names
+    )
 
     # Print information about registered tools
     asyncio.run(print_registered_tools(server))
 
-    # Run the server using stdio transport
-    print("\nStarting Lomen MCP server with stdio transport...")
-    server.run(transport="stdio")
+    if args.transport == "stdio":
+        print("\nStarting Lomen MCP server with stdio transport...")
+        server.run(transport="stdio")
+        return
+
+    print(
+        f"\nStarting Lomen MCP server with {args.transport} transport on "
+        f"{args.host}:{args.port} ({args.workers} worker(s))..."
+    )
+    try:
+        serve_http(
+            server,
+            plugins,
+            plugin_names,
+            args.transport,
+            args.host,
+            args.port,
+            workers=args.workers,
+            backlog=args.backlog,
+            keep_alive=args.keep_alive,
+            tool_names=tool_names,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,474 @@
+"""Per-tool and upstream call metrics, with a Prometheus text exposition."""
+
+import functools
+import inspect
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Bucket upper bounds of the histograms
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf,
+)  # fmt: skip
+SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, math.inf,
+)  # fmt: skip
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                upper = min(bound, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+def response_size(result: Any) -> Optional[int]:
+    """Size in bytes of a tool result serialized as JSON (text as is)."""
+    try:
+        if isinstance(result, (bytes, bytearray)):
+            return len(result)
+        if isinstance(result, str):
+            return len(result.encode())
+        return len(json.dumps(result, default=str).encode())
+    except (TypeError, ValueError):
+        return None
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+class MetricsRegistry:
+    """
+    Collects tool and upstream call metrics in-process.
+
+    Tool calls record their latency, outcome, error type and response size;
+    upstream requests (1inch API, RPC endpoints) record latency and outcome per
+    service and target. The MCP tool executor records how long calls waited for
+    a slot and which calls it rejected, and its running and queued calls are
+    read live from the executor passed to ``track_executor``. ``snapshot``
+    returns the numbers as a dictionary and ``render_prometheus`` in the
+    Prometheus text format.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor: Optional[Any] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all recorded metrics."""
+        with self._lock:
+            self._tool_calls: Dict[Labels, int] = {}  # (tool, outcome)
+            self._tool_errors: Dict[Labels, int] = {}  # (tool, error_type)
+            self._tool_latency: Dict[Labels, Histogram] = {}  # (tool,)
+            self._tool_bytes: Dict[Labels, Histogram] = {}  # (tool,)
+            self._upstream_calls: Dict[Labels, int] = {}  # (upstream, target, outcome)
+            self._upstream_latency: Dict[Labels, Histogram] = {}  # (upstream, target)
+            self._queue_wait: Dict[Labels, Histogram] = {}  # (tool,)
+            self._tool_rejections: Dict[Labels, int] = {}  # (tool, reason)
+
+    def observe_tool(
+        self,
+        tool: str,
+        seconds: float,
+        error: Optional[BaseException] = None,
+        response_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Record one tool call.
+
+        Args:
+            tool: The tool name.
+            seconds: How long the call took.
+            error: The exception if the call failed.
+            response_bytes: Size of the serialized result, if known.
+        """
+        key = (tool,)
+        outcome = "ok" if error is None else "error"
+        with self._lock:
+            calls_key = (tool, outcome)
+            self._tool_calls[calls_key] = self._tool_calls.get(calls_key, 0) + 1
+            if error is not None:
+                error_key = (tool, type(error).__name__)
+                self._tool_errors[error_key] = self._tool_errors.get(error_key, 0) + 1
+            latency = self._tool_latency.get(key)
+            if latency is None:
+                latency = self._tool_latency[key] = Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+            if response_bytes is not None:
+                size = self._tool_bytes.get(key)
+                if size is None:
+                    size = self._tool_bytes[key] = Histogram(SIZE_BUCKETS)
+                size.observe(response_bytes)
+
+    def observe_upstream(
+        self, upstream: str, target: str, seconds: float, outcome: str = "ok"
+    ) -> None:
+        """
+        Record one request to an upstream service.
+
+        Args:
+            upstream: The service, e.g. ``oneinch`` or ``evm_rpc``.
+            target: What was called, e.g. an API family or an RPC host (keep the
+                number of distinct values small).
+            seconds: How long the request took.
+            outcome: ``ok``, an HTTP status code or an exception type.
+        """
+        with self._lock:
+            calls_key = (upstream, target, outcome)
+            self._upstream_calls[calls_key] = self._upstream_calls.get(calls_key, 0) + 1
+            key = (upstream, target)
+            latency = self._upstream_latency.get(key)
+            if latency is None:
+                latency = self._upstream_latency[key] = Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+
+    def observe_queue_wait(self, tool: str, seconds: float) -> None:
+        """
+        Record how long a tool call waited for an executor slot.
+
+        Args:
+            tool: The tool name.
+            seconds: How long the call waited before it started.
+        """
+        key = (tool,)
+        with self._lock:
+            wait = self._queue_wait.get(key)
+            if wait is None:
+                wait = self._queue_wait[key] = Histogram(LATENCY_BUCKETS)
+            wait.observe(seconds)
+
+    def observe_rejection(self, tool: str, reason: str) -> None:
+        """
+        Record a tool call the executor rejected.
+
+        Args:
+            tool: The tool name.
+            reason: ``queue_full`` or ``timeout``.
+        """
+        with self._lock:
+            key = (tool, reason)
+            self._tool_rejections[key] = self._tool_rejections.get(key, 0) + 1
+
+    def track_executor(self, executor: Any) -> None:
+        """
+        Report the running and queued calls of a tool executor.
+
+        Args:
+            executor: An object with a ``stats()`` method like
+                ``lomen.adapters.mcp.ToolExecutor``; replaces any tracked before.
+        """
+        with self._lock:
+            self._executor = executor
+
+    def _executor_gauges(self) -> Dict[str, Dict[Labels, int]]:
+        # Read outside the lock; the executor keeps its own counts
+        executor = self._executor
+        tools = executor.stats()["tools"] if executor is not None else {}
+        return {
+            name: {(tool,): stats[name] for tool, stats in tools.items()}
+            for name in ("running", "waiting")
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return all metrics as a dictionary.
+
+        Returns:
+            Dictionary with, per tool, call and error counts, errors by exception
+            type, latency (seconds) and response size (bytes) summaries with
+            count, sum, average, maximum and estimated p50/p95/p99; and, per
+            upstream service and target, request counts by outcome and latency;
+            and for the tool executor, running and queued calls, rejected and
+            timed-out calls and, per tool, those numbers and queue wait times.
+        """
+        gauges = self._executor_gauges()
+        with self._lock:
+            tools: Dict[str, Dict[str, Any]] = {}
+            for (tool,), latency in self._tool_latency.items():
+                size = self._tool_bytes.get((tool,))
+                tools[tool] = {
+                    "calls": latency.count,
+                    "errors": self._tool_calls.get((tool, "error"), 0),
+                    "errors_by_type": {
+                        error_type: count
+                        for (name, error_type), count in self._tool_errors.items()
+                        if name == tool
+                    },
+                    "latency_seconds": latency.summary(),
+                    "response_bytes": size.summary() if size else None,
+                }
+            upstreams: Dict[str, Dict[str, Any]] = {}
+            for (upstream, target), latency in self._upstream_latency.items():
+                upstreams.setdefault(upstream, {})[target] = {
+                    "requests": latency.count,
+                    "by_outcome": {
+                        outcome: count
+                        for (service, name, outcome), count in (
+                            self._upstream_calls.items()
+                        )
+                        if service == upstream and name == target
+                    },
+                    "latency_seconds": latency.summary(),
+                }
+            executor_tools: Dict[str, Dict[str, Any]] = {}
+            names = {tool for (tool,) in gauges["running"]}
+            names.update(tool for (tool,) in self._queue_wait)
+            names.update(tool for tool, _ in self._tool_rejections)
+            for tool in sorted(names):
+                wait = self._queue_wait.get((tool,))
+                timed_out = self._tool_rejections.get((tool, "timeout"), 0)
+                executor_tools[tool] = {
+                    "running": gauges["running"].get((tool,), 0),
+                    "waiting": gauges["waiting"].get((tool,), 0),
+                    "rejected": self._tool_rejections.get((tool, "queue_full"), 0)
+                    + timed_out,
+                    "timed_out": timed_out,
+                    "queue_wait_seconds": wait.summary() if wait else None,
+                }
+            executor = {
+                name: sum(stats[name] for stats in executor_tools.values())
+                for name in ("running", "waiting", "rejected", "timed_out")
+            }
+            executor["tools"] = executor_tools
+            return {"tools": tools, "upstreams": upstreams, "executor": executor}
+
+    def _render_counter(
+        self,
+        lines: List[str],
+        name: str,
+        help_text: str,
+        label_names: Sequence[str],
+        values: Dict[Labels, int],
+        kind: str = "counter",
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in sorted(values.items()):
+            lines.append(f"{name}{_format_labels(label_names, labels)} {value}")
+
+    def _render_histogram(
+        self,
+        lines: List[str],
+        name: str,
+        help_text: str,
+        label_names: Sequence[str],
+        values: Dict[Labels, Histogram],
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        bucket_labels = tuple(label_names) + ("le",)
+        for labels, histogram in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                bucket = _format_labels(bucket_labels, labels + (_format_bound(bound),))
+                lines.append(f"{name}_bucket{bucket} {cumulative}")
+            suffix = _format_labels(label_names, labels)
+            lines.append(f"{name}_sum{suffix} {histogram.sum!r}")
+            lines.append(f"{name}_count{suffix} {histogram.count}")
+
+    def render_prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        gauges = self._executor_gauges()
+        with self._lock:
+            self._render_counter(
+                lines,
+                "lomen_tool_calls_total",
+                "Tool calls by outcome.",
+                ("tool", "outcome"),
+                self._tool_calls,
+            )
+            self._render_counter(
+                lines,
+                "lomen_tool_errors_total",
+                "Failed tool calls by exception type.",
+                ("tool", "error_type"),
+                self._tool_errors,
+            )
+            self._render_histogram(
+                lines,
+                "lomen_tool_duration_seconds",
+                "Tool call latency.",
+                ("tool",),
+                self._tool_latency,
+            )
+            self._render_histogram(
+                lines,
+                "lomen_tool_response_bytes",
+                "Size of tool results serialized as JSON.",
+                ("tool",),
+                self._tool_bytes,
+            )
+            self._render_counter(
+                lines,
+                "lomen_upstream_requests_total",
+                "Requests to upstream services by outcome.",
+                ("upstream", "target", "outcome"),
+                self._upstream_calls,
+            )
+            self._render_histogram(
+                lines,
+                "lomen_upstream_duration_seconds",
+                "Upstream request latency.",
+                ("upstream", "target"),
+                self._upstream_latency,
+            )
+            self._render_counter(
+                lines,
+                "lomen_tool_calls_running",
+                "Tool calls holding an executor slot.",
+                ("tool",),
+                gauges["running"],
+                kind="gauge",
+            )
+            self._render_counter(
+                lines,
+                "lomen_tool_calls_waiting",
+                "Tool calls queued for an executor slot.",
+                ("tool",),
+                gauges["waiting"],
+                kind="gauge",
+            )
+            self._render_counter(
+                lines,
+                "lomen_tool_rejections_total",
+                "Tool calls rejected by the executor, by reason.",
+                ("tool", "reason"),
+                self._tool_rejections,
+            )
+            self._render_histogram(
+                lines,
+                "lomen_tool_queue_wait_seconds",
+                "Time tool calls waited for an executor slot.",
+                ("tool",),
+                self._queue_wait,
+            )
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry used by the adapters and plugins
+metrics = MetricsRegistry()
+
+
+def snapshot() -> Dict[str, Any]:
+    """Return the process-wide metrics as a dictionary (see ``MetricsRegistry``)."""
+    return metrics.snapshot()
+
+
+def render_prometheus() -> str:
+    """Return the process-wide metrics in the Prometheus text format."""
+    return metrics.render_prometheus()
+
+
+def instrument(
+    tool_name: str, func: Callable, registry: Optional[MetricsRegistry] = None
+) -> Callable:
+    """
+    Wrap a tool function so every call records its latency, outcome and size.
+
+    Coroutine functions get a coroutine wrapper, other callables a plain one; the
+    wrapper keeps ``func``'s name, docstring and signature.
+
+    Args:
+        tool_name: The tool name to record the calls under.
+        func: The tool's ``arun`` (or ``run``) or a wrapper of it.
+        registry: Where to record (defaults to the process-wide registry).
+    """
+    registry = registry or metrics
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def instrumented(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                registry.observe_tool(tool_name, time.perf_counter() - started, e)
+                raise
+            registry.observe_tool(
+                tool_name,
+                time.perf_counter() - started,
+                response_bytes=response_size(result),
+            )
+            return result
+
+    else:
+
+        @functools.wraps(func)
+        def instrumented(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                registry.observe_tool(tool_name, time.perf_counter() - started, e)
+                raise
+            registry.observe_tool(
+                tool_name,
+                time.perf_counter() - started,
+                response_bytes=response_size(result),
+            )
+            return result
+
+    return instrumented
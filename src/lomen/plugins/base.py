@@ -1,7 +1,14 @@
 """Base classes for Lomen plugins."""
 
+import functools
 import inspect
-from typing import List, Dict, Any
+import logging
+from typing import Any, Dict, List, Tuple
+
+# Tools whose ``arun`` accepts this keyword can report partial results as they arrive
+PARTIAL_RESULT_KWARG = "on_partial_result"
+
+logger = logging.getLogger(__name__)
 
 
 class BaseTool:
@@ -41,10 +48,60 @@ class BaseTool:
             "Subclasses must implement the 'get_params' method to define input schema."
         )
 
+    async def startup(self) -> None:
+        """Acquire resources the tool needs before serving calls (optional)."""
+
+    async def aclose(self) -> None:
+        """Release resources held by the tool (optional)."""
+
+
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
+
+@functools.lru_cache(maxsize=None)
+def _model_schema(model: type) -> Dict[str, Any]:
+    """JSON schema of a parameter model class, computed once per class."""
+    if hasattr(model, "model_json_schema"):  # Pydantic v2
+        return model.model_json_schema()
+    if hasattr(model, "schema"):  # Pydantic v1
+        return model.schema()
+    # Fallback for non-Pydantic classes
+    return _EMPTY_SCHEMA
+
+
+def tool_parameters_schema(tool: BaseTool) -> Dict[str, Any]:
+    """Get serializable parameter schema from a tool.
+
+    Schemas of Pydantic models are generated once per model class and shared, so
+    the returned dictionary must not be modified.
+
+    Args:
+        tool: The BaseTool instance
+
+    Returns:
+        A JSON-serializable dictionary of the tool's parameters
+    """
+    params = tool.get_params()
+
+    # Handle case where get_params returns a class (Pydantic model class)
+    if inspect.isclass(params):
+        try:
+            return _model_schema(params)
+        except Exception:
+            # If schema extraction fails, return empty schema
+            return _EMPTY_SCHEMA
+
+    # Handle case where get_params returns a dict already
+    return params
+
 
 class BasePlugin:
     """Base class for all Lomen plugins."""
 
+    # Environment variables the plugin cannot be instantiated without; recorded in
+    # its manifest so that lazily loaded plugins can be rejected up front
+    required_env: Tuple[str, ...] = ()
+
     def __init__(self):
         pass
 
@@ -67,8 +124,43 @@ class BasePlugin:
 
     @property
     def tools(self) -> List[BaseTool]:
-        """List of tools provided by the plugin."""
-        raise NotImplementedError("Subclasses must implement the 'tools' property.")
+        """List of tools provided by the plugin.
+
+        The tools are created by ``create_tools`` on first access and the same
+        instances are returned afterwards, so state they keep (caches, pools,
+        limiters) lasts as long as the plugin.
+        """
+        tools = self.__dict__.get("_tools")
+        if tools is None:
+            tools = self._tools = self.create_tools()
+        return tools
+
+    def create_tools(self) -> List[BaseTool]:
+        """Create the plugin's tools; called once per plugin instance."""
+        raise NotImplementedError(
+            "Subclasses must implement 'create_tools' or the 'tools' property."
+        )
+
+    async def startup(self) -> None:
+        """Prepare the plugin's tools before they serve calls.
+
+        Adapters call this once when they start serving the plugin.
+        """
+        for tool in self.tools:
+            await tool.startup()
+
+    async def aclose(self) -> None:
+        """Release the resources held by the plugin's tools.
+
+        Adapters call this when they stop serving the plugin. Plugins owning
+        shared resources override it and call ``super().aclose()``.
+        """
+        for tool in self.__dict__.get("_tools") or ():
+            try:
+                await tool.aclose()
+            except Exception:
+                # Runs while serving stdio, where stdout is the MCP stream
+                logger.exception("Error closing tool '%s'", tool.name)
 
     def _get_serializable_params(self, tool: BaseTool) -> Dict[str, Any]:
         """Get serializable parameter schema from a tool.
@@ -79,25 +171,7 @@ class BasePlugin:
         Returns:
             A JSON-serializable dictionary of the tool's parameters
         """
-        params = tool.get_params()
-
-        # Handle case where get_params returns a class (Pydantic model class)
-        if inspect.isclass(params):
-            try:
-                # Try to get schema from Pydantic (v1 or v2)
-                if hasattr(params, "schema"):
-                    return params.schema()
-                elif hasattr(params, "model_json_schema"):
-                    return params.model_json_schema()
-                else:
-                    # Fallback for non-Pydantic classes
-                    return {"type": "object", "properties": {}}
-            except Exception:
-                # If schema extraction fails, return empty schema
-                return {"type": "object", "properties": {}}
-
-        # Handle case where get_params returns a dict already
-        return params
+        return tool_parameters_schema(tool)
 
     def get_tool_details(self) -> List[Dict[str, Any]]:
         """Get details for all tools in this plugin.
@@ -48,6 +48,13 @@ The plugin supports a wide range of EVM-compatible networks, including:
 - zkSync Era
 - And various testnets
 
+The metadata is loaded once into a read-only index (`lomen.plugins.blockchain.chains.chain_index`),
+which other plugins use as well. Changes to `chains.json` (or the file named by `LOMEN_CHAINS_FILE`)
+are picked up within a few seconds; `chain_index.reload()` applies them immediately.
+
+A chain's `rpc` is its primary RPC URL. Chains with fallback endpoints also list all of their
+URLs in order of preference under `rpc_urls`; the EVM RPC plugin spreads calls over them.
+
 ## Tools
 
 - `get_blockchain_metadata`: Retrieves detailed metadata for a specific blockchain network
@@ -63,11 +70,10 @@ metadata_tool = plugin.tools[0]
 # Get Ethereum mainnet metadata
 result = await metadata_tool.arun(chain_id=1)
 print(f"Network name: {result['name']}")
-print(f"RPC URL: {result['rpc_url']}")
+print(f"RPC URL: {result['rpc']}")
 ```
 """
 
-    @property
-    def tools(self) -> List[BaseTool]:
-        """Return the tools provided by the plugin."""
+    def create_tools(self) -> List[BaseTool]:
+        """Create the tools provided by the plugin."""
         return [GetBlockchainMetadata()]
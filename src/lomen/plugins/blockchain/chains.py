@@ -0,0 +1,123 @@
+"""In-memory index of the chain metadata in ``chains.json``."""
+
+import json
+import os
+import time
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+CHAINS_FILE_ENV = "LOMEN_CHAINS_FILE"
+DEFAULT_CHAINS_FILE = os.path.join(os.path.dirname(__file__), "chains.json")
+
+# Seconds between checks of the file's modification time
+DEFAULT_REFRESH_INTERVAL = 5.0
+
+ChainMetadata = Mapping[str, Any]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable copy of a frozen value (mappings become dicts, tuples lists)."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ChainIndex:
+    """
+    Read-only view of ``chains.json`` keyed by integer chain ID.
+
+    The file is parsed once, on first use, into an immutable mapping. Afterwards
+    its modification time is checked at most every ``refresh_interval`` seconds
+    and the index is rebuilt only when the file changed; ``reload()`` forces a
+    rebuild. If a refresh fails (e.g. the file is being rewritten), the previous
+    index is kept.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ):
+        """
+        Args:
+            path: Chains file. Defaults to ``LOMEN_CHAINS_FILE`` or the bundled
+                ``chains.json``, resolved on every refresh.
+            refresh_interval: Minimum seconds between modification time checks.
+        """
+        self._path = path
+        self.refresh_interval = refresh_interval
+        self._chains: Optional[Mapping[int, ChainMetadata]] = None
+        self._version: Optional[Tuple[str, int, int]] = None
+        self._checked_at = 0.0
+
+    @property
+    def path(self) -> str:
+        """The chains file backing the index."""
+        return self._path or os.environ.get(CHAINS_FILE_ENV) or DEFAULT_CHAINS_FILE
+
+    def _load(self, path: str) -> Mapping[int, ChainMetadata]:
+        with open(path, "r") as f:
+            raw = json.load(f)
+        return MappingProxyType(
+            {int(chain_id): _freeze(chain) for chain_id, chain in raw.items()}
+        )
+
+    def reload(self) -> Mapping[int, ChainMetadata]:
+        """
+        Re-read the chains file unconditionally.
+
+        Raises:
+            FileNotFoundError: If the chains file does not exist.
+            json.JSONDecodeError: If the chains file is not valid JSON.
+        """
+        path = self.path
+        stat = os.stat(path)
+        self._chains = self._load(path)
+        self._version = (path, stat.st_mtime_ns, stat.st_size)
+        self._checked_at = time.monotonic()
+        return self._chains
+
+    def chains(self) -> Mapping[int, ChainMetadata]:
+        """
+        Return the (possibly refreshed) mapping of chain ID to metadata.
+
+        Raises:
+            FileNotFoundError: If the chains file has never been loaded and does
+                not exist.
+            json.JSONDecodeError: If the chains file has never been loaded and is
+                not valid JSON.
+        """
+        if self._chains is None:
+            return self.reload()
+
+        now = time.monotonic()
+        if now - self._checked_at < self.refresh_interval:
+            return self._chains
+        self._checked_at = now
+        try:
+            path = self.path
+            stat = os.stat(path)
+            if (path, stat.st_mtime_ns, stat.st_size) != self._version:
+                self.reload()
+        except (OSError, ValueError) as e:
+            print(f"Warning: Keeping previous chain metadata, reload failed: {e}")
+        return self._chains
+
+    def get(self, chain_id: int) -> Optional[ChainMetadata]:
+        """Return the read-only metadata of a chain, or None if unknown."""
+        return self.chains().get(int(chain_id))
+
+
+# Shared by every plugin that needs chain metadata
+chain_index = ChainIndex()
@@ -1,9 +1,10 @@
 import json
-import os
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
 from lomen.plugins.base import BaseTool
+from lomen.plugins.blockchain.chains import ChainIndex, chain_index, thaw
 
 
 class GetBlockchainMetadataParams(BaseModel):
@@ -15,6 +16,10 @@ class GetBlockchainMetadata(BaseTool):
     Retrieve metadata for the specified blockchain network.
     """
 
+    def __init__(self, chains: Optional[ChainIndex] = None):
+        """Initializes the tool with the (shared) chain metadata index."""
+        self.chains = chains or chain_index
+
     @property
     def name(self) -> str:
         """Name of the tool."""
@@ -35,7 +40,6 @@ class GetBlockchainMetadata(BaseTool):
     async def arun(self, chain_id: int):
         """
         Asynchronously retrieve metadata for the specified blockchain network.
-        (Note: Internally uses synchronous file I/O)
 
         Supported chains and its IDs are:
         - Ethereum Mainnet: 1
@@ -68,33 +72,19 @@ class GetBlockchainMetadata(BaseTool):
         Raises:
             Exception: If the chain is not found
         """
-        # This logic remains synchronous (file I/O)
         try:
-            # print("Executing blockchain_metadata tool with chain_id:", chain_id) # Optional print
-            # Read chains data from JSON file
-            chains_file = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "chains.json"
-            )
-            with open(chains_file, "r") as f:
-                chains = json.load(f)
-
-            chain_id_str = str(chain_id)
-
-            # Find chain by ID
-            if chain_id_str in chains:
-                result = chains[chain_id_str].copy()
-                # Add chain_id to result (as int if possible)
-                try:
-                    result["chain_id"] = int(chain_id_str)
-                except ValueError:
-                    result["chain_id"] = chain_id_str
-                return result
-            else:
-                raise Exception(f"Chain ID {chain_id} not found or not supported")
-
+            chain = self.chains.get(chain_id)
         except FileNotFoundError:
             raise Exception("Chains data file not found")
         except json.JSONDecodeError:
             raise Exception("Invalid chains data file format")
-        except Exception as e:
-            raise Exception(f"Failed to get blockchain metadata: {str(e)}")
+
+        if chain is None:
+            raise Exception(
+                f"Failed to get blockchain metadata: Chain ID {chain_id} not found "
+                "or not supported"
+            )
+        # Mutable copy; the shared index itself is read-only
+        result = thaw(chain)
+        result["chain_id"] = int(chain_id)
+        return result
@@ -1,12 +1,17 @@
 """EVM RPC plugin for Lomen."""
 
-from typing import List
+from typing import List, Optional
 
 from ..base import BasePlugin, BaseTool
+from .block_cache import BlockCache
+from .endpoints import EndpointSelector
+from .head_tracker import HeadTracker
+from .provider_pool import Web3ProviderPool
 from .tools.get_block import GetBlock
 
 # Import after defining the class to avoid circular imports
 from .tools.get_block_number import GetBlockNumber
+from .tools.get_blocks import GetBlocks
 
 
 class EvmRpcPlugin(BasePlugin):
@@ -17,6 +22,36 @@ class EvmRpcPlugin(BasePlugin):
     and details.
     """
 
+    def __init__(
+        self, pool_size: Optional[int] = None, pool_idle_timeout: Optional[float] = None
+    ):
+        """
+        Initializes the plugin.
+
+        Args:
+            pool_size: Maximum number of pooled RPC clients (defaults to
+                EVM_RPC_POOL_SIZE or 32).
+            pool_idle_timeout: Seconds after which an unused RPC client is closed
+                (defaults to EVM_RPC_POOL_IDLE_TIMEOUT or 300).
+        """
+        super().__init__()
+        # One client per (rpc_url, is_poa), shared by every tool
+        self.provider_pool = Web3ProviderPool(
+            max_size=pool_size, idle_timeout=pool_idle_timeout
+        )
+        # Latency and error rate of every RPC endpoint, to pick one per call
+        self.endpoints = EndpointSelector()
+        # Blocks fetched by get_block, reused across calls and sessions
+        self.block_cache = BlockCache()
+        # One eth_blockNumber poller per chain with recent readers
+        self.head_tracker = HeadTracker(self.provider_pool, endpoints=self.endpoints)
+
+    async def aclose(self) -> None:
+        """Stop the head pollers and disconnect the pooled RPC clients."""
+        await super().aclose()
+        await self.head_tracker.aclose()
+        await self.provider_pool.aclose()
+
     @property
     def name(self) -> str:
         """Return the name of the plugin."""
@@ -36,10 +71,40 @@ class EvmRpcPlugin(BasePlugin):
 This plugin provides tools for interacting with Ethereum Virtual Machine (EVM) compatible blockchains
 using their JSON-RPC interfaces. It allows querying blockchain data such as blocks and transactions.
 
+RPC calls use `AsyncWeb3`, so a slow node never blocks other tool calls running on the same
+event loop (see `benchmarks/evm_rpc_concurrency.py`). Clients are pooled per `(rpc_url, is_poa)` to
+keep HTTP connections alive; the pool holds up to `EVM_RPC_POOL_SIZE` clients (default 32), closes
+clients idle for `EVM_RPC_POOL_IDLE_TIMEOUT` seconds (default 300) and is closed by
+`await plugin.aclose()`.
+
 ## Tools
 
-- `get_block_number`: Retrieves the current block number from an EVM blockchain
-- `get_block`: Retrieves detailed information about a specific block
+- `get_block_number`: Retrieves the current block number from an EVM blockchain. One poller per
+  chain (and custom `rpc_url`) refreshes the head every `EVM_RPC_HEAD_POLL_INTERVAL` seconds
+  (default 1) while it has readers, and calls are answered from memory if the head is at most
+  `EVM_RPC_HEAD_MAX_STALENESS` seconds old (default 2). Polling stops after
+  `EVM_RPC_HEAD_IDLE_TIMEOUT` seconds without reads (default 30).
+- `get_block`: Retrieves detailed information about a specific block. Blocks at or below the
+  chain's finalized height are cached without expiry (`EVM_RPC_BLOCK_CACHE_SIZE` blocks, default
+  2048), and also on disk if `LOMEN_BLOCK_CACHE_DIR` is set; newer blocks are reused for
+  `EVM_RPC_BLOCK_CACHE_RECENT_TTL` seconds (default 3). Calls with an explicit `rpc_url` bypass the
+  cache. `plugin.block_cache.stats()` reports hits.
+- `get_blocks`: Retrieves a range of blocks (up to 1000) using JSON-RPC batch requests of
+  `EVM_RPC_BATCH_SIZE` blocks (default 50), with up to `EVM_RPC_BATCH_CONCURRENCY` batches
+  (default 4) in flight
+
+`rpc_url` and `is_poa` are optional for chains known to the blockchain plugin's `chains.json`;
+they default to the chain's metadata. The tools' `arun` methods take keyword arguments only, so
+positional calls in the old `arun(rpc_url, chain_id, ...)` order raise a `TypeError`.
+
+A chain's `rpc_urls` entry in `chains.json` lists its endpoints in order of preference (chains
+with only an `rpc` URL have a single endpoint). Calls without an explicit `rpc_url` go to the
+endpoint with the lowest recent latency, weighted by its error rate (both exponentially weighted
+moving averages), and fail over to the next endpoint on errors; endpoints
+failing repeatedly are only used as a last resort for 30 seconds. With `EVM_RPC_HEDGE=1`, a
+single-block read that is slower than the endpoint's `EVM_RPC_HEDGE_PERCENTILE` latency (default
+95th percentile) is also sent to the next endpoint and the first answer wins.
+`plugin.endpoints.stats()` reports per-endpoint latency, error rate and health.
 
 ## Usage
 
@@ -58,7 +123,11 @@ print(f"Current block number: {result['block_number']}")
 ```
 """
 
-    @property
-    def tools(self) -> List[BaseTool]:
-        """Return the tools provided by the plugin."""
-        return [GetBlockNumber(), GetBlock()]
+    def create_tools(self) -> List[BaseTool]:
+        """Create the tools provided by the plugin."""
+        shared = {"provider_pool": self.provider_pool, "endpoints": self.endpoints}
+        return [
+            GetBlockNumber(head_tracker=self.head_tracker, **shared),
+            GetBlock(block_cache=self.block_cache, **shared),
+            GetBlocks(**shared),
+        ]
@@ -0,0 +1,239 @@
+"""Finality-aware cache of serialized blocks, with an optional on-disk tier."""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+BLOCK_CACHE_SIZE_ENV = "EVM_RPC_BLOCK_CACHE_SIZE"
+BLOCK_CACHE_RECENT_TTL_ENV = "EVM_RPC_BLOCK_CACHE_RECENT_TTL"
+BLOCK_CACHE_DIR_ENV = "LOMEN_BLOCK_CACHE_DIR"
+
+DEFAULT_BLOCK_CACHE_SIZE = 2048
+DEFAULT_RECENT_TTL = 3.0  # seconds; about a block on fast chains, so reorgs age out
+# How long a chain's finalized height is trusted before it is looked up again
+DEFAULT_FINALITY_REFRESH = 12.0  # seconds
+# Depth treated as final on nodes that do not support the "finalized" block tag
+FALLBACK_CONFIRMATIONS = 64
+
+# (chain_id, block_number, full_transactions, is_poa)
+BlockKey = Tuple[int, int, bool, bool]
+
+_MISSING = object()
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the web3 types left inside full transactions (HexBytes, AttributeDict)."""
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+class BlockCache:
+    """
+    Bounded LRU cache of serialized blocks keyed by
+    ``(chain_id, number, full_tx, is_poa)``; POA blocks are shaped differently.
+
+    Blocks at or below the chain's finalized height can never change and are kept
+    without expiry (until evicted by the LRU bound); when a cache directory is
+    configured they are also written to disk, so historical lookups survive
+    restarts. Blocks above the finalized height may still be reorganized away and
+    only live for ``recent_ttl`` seconds in memory.
+
+    The cache also remembers each chain's latest known finalized height, which
+    only ever increases.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        recent_ttl: Optional[float] = None,
+        directory: Optional[str] = None,
+        finality_refresh: float = DEFAULT_FINALITY_REFRESH,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of blocks kept in memory (defaults to
+                ``EVM_RPC_BLOCK_CACHE_SIZE`` or 2048; 0 disables the memory tier).
+            recent_ttl: Seconds a not-yet-finalized block may be reused (defaults
+                to ``EVM_RPC_BLOCK_CACHE_RECENT_TTL`` or 3).
+            directory: Directory for the on-disk tier of finalized blocks
+                (defaults to ``LOMEN_BLOCK_CACHE_DIR``; disabled if unset).
+            finality_refresh: Seconds a known finalized height is considered
+                current.
+        """
+        if maxsize is None:
+            maxsize = int(
+                os.environ.get(BLOCK_CACHE_SIZE_ENV, DEFAULT_BLOCK_CACHE_SIZE)
+            )
+        if recent_ttl is None:
+            recent_ttl = float(
+                os.environ.get(BLOCK_CACHE_RECENT_TTL_ENV, DEFAULT_RECENT_TTL)
+            )
+        self.maxsize = maxsize
+        self.recent_ttl = recent_ttl
+        self.directory = directory or os.environ.get(BLOCK_CACHE_DIR_ENV) or None
+        self.finality_refresh = finality_refresh
+        # value: (expires_at or None if finalized, block)
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], dict]]" = (
+            OrderedDict()
+        )
+        # chain_id -> (finalized height, monotonic time it was learned)
+        self._finalized: Dict[int, Tuple[int, float]] = {}
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # -- finality -- #
+
+    def finalized_height(self, chain_id: int) -> Optional[int]:
+        """Latest known finalized block number of a chain, if any."""
+        known = self._finalized.get(chain_id)
+        return known[0] if known else None
+
+    def is_finalized(self, chain_id: int, block_number: int) -> Optional[bool]:
+        """
+        Whether a block is known to be final.
+
+        Returns:
+            True if the block is at or below the known finalized height, False if
+            it is above a recently learned height, and None if the finalized
+            height is unknown or stale and should be looked up.
+        """
+        known = self._finalized.get(chain_id)
+        if known is None:
+            return None
+        height, learned_at = known
+        if block_number <= height:
+            return True
+        if time.monotonic() - learned_at < self.finality_refresh:
+            return False
+        return None
+
+    def set_finalized_height(self, chain_id: int, height: int) -> None:
+        """Record a chain's finalized height (lower values than known are ignored)."""
+        known = self._finalized.get(chain_id)
+        self._finalized[chain_id] = (
+            max(height, known[0]) if known else height,
+            time.monotonic(),
+        )
+
+    # -- blocks -- #
+
+    def _disk_path(self, key: BlockKey) -> str:
+        chain_id, block_number, full_transactions, is_poa = key
+        suffix = (".poa" if is_poa else "") + (
+            ".full.json" if full_transactions else ".json"
+        )
+        return os.path.join(self.directory, str(chain_id), f"{block_number}{suffix}")
+
+    def _read_disk(self, key: BlockKey) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._disk_path(key), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: BlockKey, block: Dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(block, f, default=_json_default)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            # The disk tier is best effort; the block is still cached in memory
+            print(f"Warning: Could not write block cache file {path}: {e}")
+
+    def _store(
+        self, key: BlockKey, block: Dict[str, Any], expires_at: Optional[float]
+    ) -> None:
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (expires_at, block)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    async def get(self, key: BlockKey) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached block for ``key`` from memory or disk, or None.
+
+        Args:
+            key: ``(chain_id, block_number, full_transactions, is_poa)``.
+        """
+        entry = self._data.get(key, _MISSING)
+        if entry is not _MISSING:
+            expires_at, block = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                self._hits += 1
+                return block
+            del self._data[key]
+
+        if self.directory:
+            block = await asyncio.to_thread(self._read_disk, key)
+            if block is not None:
+                self._store(key, block, None)
+                self._disk_hits += 1
+                return block
+
+        self._misses += 1
+        return None
+
+    async def set(self, key: BlockKey, block: Dict[str, Any], finalized: bool) -> None:
+        """
+        Cache a serialized block.
+
+        Args:
+            key: ``(chain_id, block_number, full_transactions, is_poa)``.
+            block: The serialized block.
+            finalized: Whether the block is at or below the finalized height.
+        """
+        if finalized:
+            self._store(key, block, None)
+            if self.directory:
+                await asyncio.to_thread(self._write_disk, key, block)
+        elif self.recent_ttl > 0:
+            self._store(key, block, time.monotonic() + self.recent_ttl)
+
+    def clear(self) -> None:
+        """Drop all in-memory blocks and known finalized heights."""
+        self._data.clear()
+        self._finalized.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache metrics.
+
+        Returns:
+            Dictionary with current size, capacity, memory and disk hits, misses,
+            evictions and whether the disk tier is enabled.
+        """
+        lookups = self._hits + self._disk_hits + self._misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self._hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_ratio": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "disk": bool(self.directory),
+        }
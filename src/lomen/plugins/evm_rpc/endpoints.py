@@ -0,0 +1,346 @@
+"""Latency- and error-aware selection of a chain's RPC endpoints."""
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
+from lomen import tracing
+from lomen.metrics import metrics
+
+HEDGE_ENV = "EVM_RPC_HEDGE"
+HEDGE_PERCENTILE_ENV = "EVM_RPC_HEDGE_PERCENTILE"
+
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_EWMA_ALPHA = 0.2
+DEFAULT_COOLDOWN = 30.0  # seconds a failing endpoint is tried only as a last resort
+FAILURES_BEFORE_COOLDOWN = 3  # consecutive failures that put an endpoint on cooldown
+ERROR_PENALTY = 4.0  # an endpoint failing every request ranks as 5x slower
+LATENCY_WINDOW = 100  # latency samples kept per endpoint for percentiles
+MIN_HEDGE_SAMPLES = 20  # samples needed before a hedge delay is trusted
+MIN_HEDGE_DELAY = 0.05  # seconds
+
+T = TypeVar("T")
+
+
+class _EndpointHealth:
+    __slots__ = (
+        "latency",
+        "error_rate",
+        "samples",
+        "requests",
+        "failures",
+        "consecutive_failures",
+        "down_until",
+        "last_error",
+    )
+
+    def __init__(self):
+        self.latency: Optional[float] = None  # EWMA, seconds
+        self.error_rate = 0.0  # EWMA of failures
+        self.samples: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+        self.last_error: Optional[str] = None
+
+
+def _percentile(samples: Sequence[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = math.ceil(percentile / 100 * len(ordered)) - 1
+    return ordered[min(max(index, 0), len(ordered) - 1)]
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class EndpointSelector:
+    """
+    Routes RPC calls to the best of a chain's endpoints, with failover and hedging.
+
+    Every endpoint keeps an exponentially weighted moving average (EWMA) of its
+    latency and error rate. Calls go to the endpoint with the lowest
+    error-weighted latency (endpoints not yet measured are tried first, in their
+    configured order) and fail over to the next one on errors. Endpoints with
+    several consecutive failures are put on cooldown and only used if everything
+    else failed.
+
+    With hedging enabled, a read that takes longer than the chosen endpoint's
+    ``hedge_percentile`` latency is also sent to the next endpoint, and whichever
+    answers first wins. All EVM RPC tool calls are reads, so this is safe.
+    """
+
+    def __init__(
+        self,
+        hedge: Optional[bool] = None,
+        hedge_percentile: Optional[float] = None,
+        alpha: float = DEFAULT_EWMA_ALPHA,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ):
+        """
+        Args:
+            hedge: Whether to hedge slow requests. Defaults to ``EVM_RPC_HEDGE``
+                (off unless set to a true value).
+            hedge_percentile: Latency percentile of the chosen endpoint after which
+                a hedged request is sent. Defaults to ``EVM_RPC_HEDGE_PERCENTILE``
+                or 95.
+            alpha: Weight of the newest observation in the moving averages.
+            cooldown: Seconds a repeatedly failing endpoint is deprioritized.
+        """
+        if hedge is None:
+            hedge = _env_flag(HEDGE_ENV)
+        if hedge_percentile is None:
+            hedge_percentile = float(
+                os.environ.get(HEDGE_PERCENTILE_ENV, DEFAULT_HEDGE_PERCENTILE)
+            )
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self._endpoints: Dict[str, _EndpointHealth] = {}
+        self._failovers = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    def _health(self, rpc_url: str) -> _EndpointHealth:
+        health = self._endpoints.get(rpc_url)
+        if health is None:
+            health = _EndpointHealth()
+            self._endpoints[rpc_url] = health
+        return health
+
+    def _observe_latency(self, health: _EndpointHealth, latency: float) -> None:
+        if health.latency is None:
+            health.latency = latency
+        else:
+            health.latency += self.alpha * (latency - health.latency)
+
+    def record(
+        self, rpc_url: str, latency: float, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Record the outcome of a request to an endpoint.
+
+        Args:
+            rpc_url: The endpoint.
+            latency: Seconds the request took.
+            error: The exception if the request failed.
+        """
+        health = self._health(rpc_url)
+        health.requests += 1
+        if error is None:
+            self._observe_latency(health, latency)
+            health.samples.append(latency)
+            health.error_rate -= self.alpha * health.error_rate
+            health.consecutive_failures = 0
+            health.down_until = 0.0
+            return
+        health.error_rate += self.alpha * (1.0 - health.error_rate)
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.last_error = str(error)
+        if health.consecutive_failures >= FAILURES_BEFORE_COOLDOWN:
+            health.down_until = time.monotonic() + self.cooldown
+
+    def rank(self, rpc_urls: Sequence[str]) -> List[str]:
+        """Order endpoints from most to least preferred."""
+        now = time.monotonic()
+
+        def score(item):
+            position, rpc_url = item
+            health = self._endpoints.get(rpc_url)
+            if health is None:
+                return (False, 0.0, position)
+            latency = health.latency
+            if latency is None:
+                # Only failures so far
+                latency = math.inf if health.failures else 0.0
+            return (
+                health.down_until > now,
+                latency * (1.0 + ERROR_PENALTY * health.error_rate),
+                position,
+            )
+
+        return [rpc_url for _, rpc_url in sorted(enumerate(rpc_urls), key=score)]
+
+    def hedge_delay(self, rpc_url: str) -> Optional[float]:
+        """
+        Seconds to wait for an endpoint before hedging, or None if unknown.
+
+        The delay is the endpoint's ``hedge_percentile`` latency over its recent
+        successful requests, once enough of them have been observed.
+        """
+        health = self._endpoints.get(rpc_url)
+        if health is None or len(health.samples) < MIN_HEDGE_SAMPLES:
+            return None
+        return max(MIN_HEDGE_DELAY, _percentile(health.samples, self.hedge_percentile))
+
+    async def _timed(
+        self,
+        rpc_url: str,
+        request: Callable[[str], Awaitable[T]],
+        chain_id: Optional[int] = None,
+        hedged: bool = False,
+    ) -> T:
+        # Only the host: URLs may embed API keys in their path
+        host = urlsplit(rpc_url).hostname or rpc_url
+        attributes = {
+            "server.address": host,
+            "lomen.chain_id": chain_id,
+            "lomen.rpc.hedge": hedged,
+        }
+        with tracing.span("evm_rpc request", attributes) as span:
+            started = time.monotonic()
+            try:
+                result = await request(rpc_url)
+            except asyncio.CancelledError:
+                # E.g. a hedge lost to a faster endpoint: it took at least this long
+                elapsed = time.monotonic() - started
+                health = self._health(rpc_url)
+                if health.latency is None or elapsed > health.latency:
+                    self._observe_latency(health, elapsed)
+                metrics.observe_upstream("evm_rpc", host, elapsed, "cancelled")
+                span.set_attribute("lomen.rpc.cancelled", True)
+                raise
+            except Exception as e:
+                elapsed = time.monotonic() - started
+                self.record(rpc_url, elapsed, e)
+                metrics.observe_upstream("evm_rpc", host, elapsed, type(e).__name__)
+                raise
+            elapsed = time.monotonic() - started
+            self.record(rpc_url, elapsed)
+            metrics.observe_upstream("evm_rpc", host, elapsed)
+            return result
+
+    async def call(
+        self,
+        rpc_urls: Sequence[str],
+        request: Callable[[str], Awaitable[T]],
+        hedge: Optional[bool] = None,
+        chain_id: Optional[int] = None,
+    ) -> T:
+        """
+        Run ``request(rpc_url)`` against the best endpoint, failing over on errors.
+
+        Args:
+            rpc_urls: The chain's endpoints, in configured order of preference.
+            request: Coroutine function performing the request on one endpoint.
+                It must be safe to run more than once (i.e. a read).
+            hedge: Override the selector's hedging setting for this call.
+            chain_id: The chain the endpoints serve, recorded on the request spans.
+
+        Returns:
+            The result of the first successful request.
+
+        Raises:
+            ValueError: If no endpoints are given.
+            Exception: The last error if every endpoint failed.
+        """
+        if not rpc_urls:
+            raise ValueError("No RPC endpoints given.")
+        if hedge is None:
+            hedge = self.hedge
+        ranked = self.rank(rpc_urls)
+        candidates = iter(ranked)
+        pending: Dict[asyncio.Future, str] = {}
+
+        def launch(hedged: bool = False) -> Optional[str]:
+            rpc_url = next(candidates, None)
+            if rpc_url is not None:
+                task = asyncio.ensure_future(
+                    self._timed(rpc_url, request, chain_id, hedged)
+                )
+                pending[task] = rpc_url
+            return rpc_url
+
+        launch()
+        hedge_delay = self.hedge_delay(ranked[0]) if hedge and len(ranked) > 1 else None
+        hedge_url: Optional[str] = None
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # The first endpoint is unusually slow: race the next one
+                    hedge_delay = None
+                    hedge_url = launch(hedged=True)
+                    self._hedges += 1
+                    continue
+
+                winner = None
+                for task in done:
+                    rpc_url = pending.pop(task)
+                    error = task.exception()
+                    if error is None and winner is None:
+                        winner = (rpc_url, task.result())
+                    elif error is not None:
+                        last_error = error
+                if winner is not None:
+                    if winner[0] == hedge_url:
+                        self._hedge_wins += 1
+                    return winner[1]
+
+                if not pending:
+                    hedge_delay = None
+                    if launch() is None:
+                        break
+                    self._failovers += 1
+        finally:
+            for task in pending:
+                task.cancel()
+        raise last_error
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return per-endpoint health metrics.
+
+        Returns:
+            Dictionary with failover and hedge counters and, per endpoint, the
+            latency moving average and p50/p95 (in milliseconds), error rate,
+            request and failure counts, the last error and whether it is healthy.
+        """
+        now = time.monotonic()
+
+        def ms(seconds: Optional[float]) -> Optional[float]:
+            return None if seconds is None else round(seconds * 1000, 1)
+
+        return {
+            "hedge": self.hedge,
+            "failovers": self._failovers,
+            "hedges": self._hedges,
+            "hedge_wins": self._hedge_wins,
+            "endpoints": {
+                rpc_url: {
+                    "latency_ms": ms(health.latency),
+                    "p50_ms": ms(
+                        _percentile(health.samples, 50) if health.samples else None
+                    ),
+                    "p95_ms": ms(
+                        _percentile(health.samples, 95) if health.samples else None
+                    ),
+                    "error_rate": round(health.error_rate, 3),
+                    "requests": health.requests,
+                    "failures": health.failures,
+                    "last_error": health.last_error,
+                    "healthy": health.down_until <= now,
+                }
+                for rpc_url, health in self._endpoints.items()
+            },
+        }
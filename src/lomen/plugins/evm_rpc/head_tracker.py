@@ -0,0 +1,222 @@
+"""Shared per-chain tracker of the latest block number."""
+
+import asyncio
+import contextvars
+import os
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from lomen import tracing
+from lomen.plugins.evm_rpc.endpoints import EndpointSelector
+from lomen.plugins.evm_rpc.provider_pool import Web3ProviderPool
+
+HEAD_MAX_STALENESS_ENV = "EVM_RPC_HEAD_MAX_STALENESS"
+HEAD_POLL_INTERVAL_ENV = "EVM_RPC_HEAD_POLL_INTERVAL"
+HEAD_IDLE_TIMEOUT_ENV = "EVM_RPC_HEAD_IDLE_TIMEOUT"
+
+DEFAULT_MAX_STALENESS = 2.0  # seconds
+DEFAULT_POLL_INTERVAL = 1.0  # seconds
+DEFAULT_IDLE_TIMEOUT = 30.0  # seconds without readers before polling stops
+
+# Heads are tracked per chain ID and RPC URLs
+_HeadKey = Tuple[int, Tuple[str, ...]]
+
+
+class _ChainHead:
+    __slots__ = (
+        "chain_id",
+        "rpc_urls",
+        "block_number",
+        "updated_at",
+        "last_read",
+        "refresh",
+        "poller",
+    )
+
+    def __init__(self, chain_id: int, rpc_urls: Tuple[str, ...]):
+        self.chain_id = chain_id
+        self.rpc_urls = rpc_urls
+        self.block_number: Optional[int] = None
+        self.updated_at = 0.0
+        self.last_read = time.monotonic()
+        self.refresh: Optional[asyncio.Future] = None
+        self.poller: Optional[asyncio.Task] = None
+
+
+class HeadTracker:
+    """
+    Serves ``eth_blockNumber`` per chain from memory, refreshed by one poller.
+
+    The first read for a chain fetches the head and starts a background poller
+    that refreshes it every ``poll_interval`` seconds. Reads are answered from
+    memory as long as the value is at most ``max_staleness`` seconds old;
+    otherwise the reader triggers a refresh that concurrent readers share. A
+    chain's poller stops once nobody has read it for ``idle_timeout`` seconds.
+    Heads are tracked per chain and set of RPC URLs, so a caller-supplied
+    endpoint (e.g. a fork) never changes the head other callers see.
+    """
+
+    def __init__(
+        self,
+        provider_pool: Optional[Web3ProviderPool] = None,
+        max_staleness: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        idle_timeout: Optional[float] = None,
+        endpoints: Optional[EndpointSelector] = None,
+    ):
+        """
+        Args:
+            provider_pool: Pool of RPC clients used for polling. A private one is
+                created if omitted.
+            max_staleness: Oldest head (in seconds) served from memory. Defaults
+                to ``EVM_RPC_HEAD_MAX_STALENESS`` or 2.
+            poll_interval: Seconds between background refreshes. Defaults to
+                ``EVM_RPC_HEAD_POLL_INTERVAL`` or 1.
+            idle_timeout: Seconds without reads after which a chain's poller
+                stops. Defaults to ``EVM_RPC_HEAD_IDLE_TIMEOUT`` or 30.
+            endpoints: Health tracking used to pick among a chain's RPC
+                endpoints. A private one is created if omitted.
+        """
+        if max_staleness is None:
+            max_staleness = float(
+                os.environ.get(HEAD_MAX_STALENESS_ENV, DEFAULT_MAX_STALENESS)
+            )
+        if poll_interval is None:
+            poll_interval = float(
+                os.environ.get(HEAD_POLL_INTERVAL_ENV, DEFAULT_POLL_INTERVAL)
+            )
+        if idle_timeout is None:
+            idle_timeout = float(
+                os.environ.get(HEAD_IDLE_TIMEOUT_ENV, DEFAULT_IDLE_TIMEOUT)
+            )
+        self.provider_pool = (
+            provider_pool if provider_pool is not None else Web3ProviderPool()
+        )
+        self.endpoints = endpoints if endpoints is not None else EndpointSelector()
+        self.max_staleness = max_staleness
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self._heads: Dict[_HeadKey, _ChainHead] = {}
+        self._reads = 0
+        self._fetches = 0
+        self._errors = 0
+
+    async def get_block_number(
+        self, rpc_urls: Union[str, Sequence[str]], chain_id: int
+    ) -> int:
+        """
+        Return the chain's latest block number, at most ``max_staleness`` old.
+
+        Args:
+            rpc_urls: The RPC URL(s) for the blockchain; each distinct set of
+                URLs has its own head and poller.
+            chain_id: The chain ID for the blockchain.
+
+        Returns:
+            The latest known block number.
+        """
+        rpc_urls = (rpc_urls,) if isinstance(rpc_urls, str) else tuple(rpc_urls)
+        key = (chain_id, rpc_urls)
+        head = self._heads.get(key)
+        if head is None:
+            head = _ChainHead(chain_id, rpc_urls)
+            self._heads[key] = head
+        head.last_read = time.monotonic()
+        self._reads += 1
+
+        self._ensure_poller(key, head)
+        fresh = (
+            head.block_number is not None
+            and head.last_read - head.updated_at <= self.max_staleness
+        )
+        tracing.set_attribute("lomen.cache.hit", fresh)
+        if fresh:
+            return head.block_number
+        return await self._refresh(head)
+
+    async def _fetch_from(self, rpc_url: str) -> int:
+        async with self.provider_pool.client(rpc_url) as web3:
+            return await web3.eth.block_number
+
+    async def _fetch(self, head: _ChainHead) -> int:
+        self._fetches += 1
+        block_number = await self.endpoints.call(
+            head.rpc_urls, self._fetch_from, chain_id=head.chain_id
+        )
+        if head.block_number is None or block_number >= head.block_number:
+            head.block_number = block_number
+        head.updated_at = time.monotonic()
+        return head.block_number
+
+    async def _refresh(self, head: _ChainHead) -> int:
+        """Fetch the head, sharing one request among concurrent callers."""
+        loop = asyncio.get_running_loop()
+        if head.refresh is None or head.refresh.get_loop() is not loop:
+            head.refresh = loop.create_task(self._fetch(head))
+            head.refresh.add_done_callback(
+                lambda task, head=head: self._refresh_done(head, task)
+            )
+        return await asyncio.shield(head.refresh)
+
+    def _refresh_done(self, head: _ChainHead, task: asyncio.Future) -> None:
+        if head.refresh is task:
+            head.refresh = None
+        if not task.cancelled() and task.exception() is not None:
+            self._errors += 1
+
+    def _ensure_poller(self, key: _HeadKey, head: _ChainHead) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            head.poller is None
+            or head.poller.done()
+            or head.poller.get_loop() is not loop
+        ):
+            # Started in an empty context, so the polls' spans are not attributed
+            # to the tool call that happened to start the poller
+            head.poller = contextvars.Context().run(
+                loop.create_task, self._poll(key, head)
+            )
+
+    async def _poll(self, key: _HeadKey, head: _ChainHead) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if time.monotonic() - head.last_read >= self.idle_timeout:
+                # Nobody is reading this chain any more
+                if self._heads.get(key) is head:
+                    del self._heads[key]
+                return
+            try:
+                await self._refresh(head)
+            except Exception:
+                # Counted in _refresh_done; the next read or poll retries
+                pass
+
+    async def aclose(self) -> None:
+        """Stop all pollers."""
+        loop = asyncio.get_running_loop()
+        heads = list(self._heads.values())
+        self._heads.clear()
+        # Pollers of another (finished) loop can no longer run and are just dropped
+        pollers = [
+            head.poller
+            for head in heads
+            if head.poller is not None and head.poller.get_loop() is loop
+        ]
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return tracker metrics.
+
+        Returns:
+            Dictionary with the chains being polled, reads served, upstream
+            ``eth_blockNumber`` fetches and failed fetches.
+        """
+        return {
+            "chains": sorted({chain_id for chain_id, _ in self._heads}),
+            "reads": self._reads,
+            "fetches": self._fetches,
+            "errors": self._errors,
+        }
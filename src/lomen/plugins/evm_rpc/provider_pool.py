@@ -0,0 +1,192 @@
+"""Pool of configured AsyncWeb3 clients shared by the EVM RPC tools."""
+
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from web3 import AsyncWeb3
+from web3.middleware import ExtraDataToPOAMiddleware
+
+POOL_SIZE_ENV = "EVM_RPC_POOL_SIZE"
+POOL_IDLE_TIMEOUT_ENV = "EVM_RPC_POOL_IDLE_TIMEOUT"
+
+DEFAULT_POOL_SIZE = 32
+DEFAULT_IDLE_TIMEOUT = 300.0  # seconds
+
+# (rpc_url, is_poa, slot); slot is None for shared clients and an index for
+# exclusively leased ones
+PoolKey = Tuple[str, bool, Optional[int]]
+
+
+class _PooledClient:
+    __slots__ = ("web3", "in_use", "last_used", "retired")
+
+    def __init__(self, web3: AsyncWeb3):
+        self.web3 = web3
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.retired = False
+
+
+async def _disconnect(web3: AsyncWeb3) -> None:
+    """Close the provider's HTTP session(s)."""
+    disconnect = getattr(web3.provider, "disconnect", None)
+    if disconnect is not None:
+        await disconnect()
+
+
+class Web3ProviderPool:
+    """
+    Reuses one configured ``AsyncWeb3`` client per ``(rpc_url, is_poa)``.
+
+    Reusing the client keeps its HTTP keep-alive connections and injects the POA
+    middleware only once. The pool holds at most ``max_size`` clients; beyond that
+    the least recently used one is evicted, and clients unused for
+    ``idle_timeout`` seconds are evicted as well. A client still serving a request
+    is only disconnected once that request has finished.
+
+    JSON-RPC batching switches the whole provider into batch mode until the batch
+    response arrives, so batches lease a client exclusively (``exclusive=True``);
+    concurrent exclusive leases for one endpoint get separate pooled clients.
+    """
+
+    def __init__(
+        self, max_size: Optional[int] = None, idle_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            max_size: Maximum number of pooled clients. Defaults to
+                ``EVM_RPC_POOL_SIZE`` or 32.
+            idle_timeout: Seconds after which an unused client is evicted.
+                Defaults to ``EVM_RPC_POOL_IDLE_TIMEOUT`` or 300.
+        """
+        if max_size is None:
+            max_size = int(os.environ.get(POOL_SIZE_ENV, DEFAULT_POOL_SIZE))
+        if idle_timeout is None:
+            idle_timeout = float(
+                os.environ.get(POOL_IDLE_TIMEOUT_ENV, DEFAULT_IDLE_TIMEOUT)
+            )
+        if max_size < 1:
+            raise ValueError("Provider pool size must be at least 1.")
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._clients: "OrderedDict[PoolKey, _PooledClient]" = OrderedDict()
+        self._created = 0
+        self._reused = 0
+        self._evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def _create(self, rpc_url: str, is_poa: bool) -> AsyncWeb3:
+        web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        if is_poa:
+            web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        return web3
+
+    def _collect_evictions(self) -> List[_PooledClient]:
+        """Remove idle and over-capacity clients; return those safe to disconnect."""
+        now = time.monotonic()
+        evicted = [
+            key
+            for key, entry in self._clients.items()
+            if entry.in_use == 0 and now - entry.last_used >= self.idle_timeout
+        ]
+        overflow = len(self._clients) - len(evicted) - self.max_size
+        for key in self._clients:
+            if overflow <= 0:
+                break
+            if key not in evicted:
+                evicted.append(key)
+                overflow -= 1
+
+        to_close = []
+        for key in evicted:
+            entry = self._clients.pop(key)
+            self._evicted += 1
+            if entry.in_use:
+                entry.retired = True  # disconnected when its last request ends
+            else:
+                to_close.append(entry)
+        return to_close
+
+    def _exclusive_key(self, rpc_url: str, is_poa: bool) -> PoolKey:
+        """Key of the first exclusive client for the endpoint that is not leased."""
+        slot = 0
+        while True:
+            key = (rpc_url, is_poa, slot)
+            entry = self._clients.get(key)
+            if entry is None or entry.in_use == 0:
+                return key
+            slot += 1
+
+    @asynccontextmanager
+    async def client(
+        self, rpc_url: str, is_poa: bool = False, exclusive: bool = False
+    ) -> AsyncIterator[AsyncWeb3]:
+        """
+        Lease the pooled client for an RPC endpoint, creating it on first use.
+
+        Args:
+            rpc_url: The RPC URL for the blockchain.
+            is_poa: Whether to inject the POA ``extraData`` middleware.
+            exclusive: Lease a client nobody else uses until it is released,
+                e.g. for ``batch_requests()``.
+
+        Yields:
+            A configured ``AsyncWeb3`` instance. Do not disconnect it yourself.
+        """
+        if exclusive:
+            key = self._exclusive_key(rpc_url, is_poa)
+        else:
+            key = (rpc_url, is_poa, None)
+        entry = self._clients.get(key)
+        if entry is None:
+            entry = _PooledClient(self._create(rpc_url, is_poa))
+            self._clients[key] = entry
+            self._created += 1
+        else:
+            self._clients.move_to_end(key)
+            self._reused += 1
+        entry.in_use += 1
+
+        # The leased client is now the most recently used, so it is never evicted here
+        for stale in self._collect_evictions():
+            await _disconnect(stale.web3)
+
+        try:
+            yield entry.web3
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            if entry.retired and entry.in_use == 0:
+                await _disconnect(entry.web3)
+
+    async def aclose(self) -> None:
+        """Disconnect every pooled client."""
+        entries = list(self._clients.values())
+        self._clients.clear()
+        for entry in entries:
+            if entry.in_use:
+                entry.retired = True
+            else:
+                await _disconnect(entry.web3)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return pool metrics.
+
+        Returns:
+            Dictionary with the number of pooled clients, the capacity, clients
+            currently serving requests, and created/reused/evicted counters.
+        """
+        return {
+            "size": len(self._clients),
+            "max_size": self.max_size,
+            "in_use": sum(1 for entry in self._clients.values() if entry.in_use),
+            "created": self._created,
+            "reused": self._reused,
+            "evicted": self._evicted,
+        }
@@ -1,20 +1,31 @@
 """Get block tool for EVM RPC plugin."""
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
-from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
 
+from lomen import tracing
 from lomen.plugins.base import BaseTool
+from lomen.plugins.evm_rpc.block_cache import FALLBACK_CONFIRMATIONS, BlockCache
+from lomen.plugins.evm_rpc.endpoints import EndpointSelector
+from lomen.plugins.evm_rpc.provider_pool import Web3ProviderPool
+from lomen.plugins.evm_rpc.utils import resolve_rpc, serialize_block
 
 
 class GetBlockParams(BaseModel):
-    rpc_url: str = Field(..., description="The RPC URL for the blockchain")
+    rpc_url: Optional[str] = Field(
+        None,
+        description="The RPC URL (defaults to the chain's known RPC URL)",
+    )
     chain_id: int = Field(..., description="The chain ID for the blockchain")
     block_number: int = Field(..., description="The block number to fetch")
     full_transactions: bool = Field(
         False, description="Whether to include full transactions"
     )
-    is_poa: bool = Field(False, description="Whether the chain is a POA chain")
+    is_poa: Optional[bool] = Field(
+        None,
+        description="Whether the chain is a POA chain (defaults to its metadata)",
+    )
 
 
 class GetBlock(BaseTool):
@@ -22,6 +33,43 @@ class GetBlock(BaseTool):
     Fetch block information from the specified EVM blockchain.
     """
 
+    def __init__(
+        self,
+        provider_pool: Optional[Web3ProviderPool] = None,
+        block_cache: Optional[BlockCache] = None,
+        endpoints: Optional[EndpointSelector] = None,
+    ):
+        """
+        Initializes the tool.
+
+        Args:
+            provider_pool: Shared pool of RPC clients. A private one is created if
+                omitted.
+            block_cache: Cache of fetched blocks. Blocks are not cached if omitted.
+            endpoints: Shared health tracking of RPC endpoints. A private one is
+                created if omitted.
+        """
+        self.provider_pool = (
+            provider_pool if provider_pool is not None else Web3ProviderPool()
+        )
+        self.block_cache = block_cache
+        self.endpoints = endpoints if endpoints is not None else EndpointSelector()
+
+    async def _is_finalized(self, web3, chain_id: int, block_number: int) -> bool:
+        """Whether a block can no longer be reorganized; looks up finality if stale."""
+        finalized = self.block_cache.is_finalized(chain_id, block_number)
+        if finalized is not None:
+            return finalized
+        try:
+            height = (await web3.eth.get_block("finalized"))["number"]
+        except Exception:
+            try:
+                height = (await web3.eth.block_number) - FALLBACK_CONFIRMATIONS
+            except Exception:
+                return False
+        self.block_cache.set_finalized_height(chain_id, height)
+        return block_number <= height
+
     @property
     def name(self) -> str:
         """Name of the tool."""
@@ -34,56 +82,64 @@ class GetBlock(BaseTool):
 
     async def arun(
         self,
-        rpc_url: str,
+        *,
         chain_id: int,
         block_number: int,
         full_transactions: bool = False,
-        is_poa: bool = False,
+        rpc_url: Optional[str] = None,
+        is_poa: Optional[bool] = None,
     ):
         """
         Asynchronously fetch block information from the specified EVM blockchain.
-        (Note: Internally uses synchronous web3 calls)
 
         Args:
-            params: Tool parameters including block_number, full_transactions, rpc_url,
-            and chain_id
-            credentials: Dictionary of credentials (not used for this tool)
+            chain_id: The chain ID for the blockchain
+            block_number: The block number to fetch
+            full_transactions: Whether to include full transactions
+            rpc_url: The RPC URL for the blockchain (defaults to the chain's known one)
+            is_poa: Whether the chain is a POA chain (defaults to the chain's metadata)
 
         Returns:
             Dictionary containing block information
         """
-        # This logic remains synchronous as web3 is sync
         try:
-            # Get a Web3 instance for the specified RPC URL and chain ID
-            # rpc_url = rpc_url # This line is redundant
-            web3 = Web3(Web3.HTTPProvider(rpc_url))
+            rpc_urls, is_poa_resolved = resolve_rpc(chain_id, rpc_url, is_poa)
+        except Exception as e:
+            raise Exception(f"Failed to get block: {str(e)}")
 
-            if is_poa:
-                web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        # Blocks from an explicit endpoint are neither served from nor written to
+        # the shared cache, and do not move the chain's known finalized height
+        block_cache = self.block_cache if rpc_url is None else None
+        key = (chain_id, block_number, full_transactions, is_poa_resolved)
+        if block_cache is not None:
+            cached = await block_cache.get(key)
+            tracing.set_attribute("lomen.cache.hit", cached is not None)
+            if cached is not None:
+                return dict(cached)
+
+        async def fetch(url: str):
+            async with self.provider_pool.client(url, is_poa_resolved) as web3:
+                # Get block information
+                block = await web3.eth.get_block(
+                    block_number, full_transactions=full_transactions
+                )
+                finalized = block_cache is not None and await self._is_finalized(
+                    web3, chain_id, block_number
+                )
+            return block, finalized
 
-            # Get block information
-            block = web3.eth.get_block(
-                block_number, full_transactions=full_transactions
+        try:
+            block, finalized = await self.endpoints.call(
+                rpc_urls, fetch, chain_id=chain_id
             )
-
-            # Convert block attributes to dict and handle any Web3.py specific types
-            block_dict = dict(block)
-            for key, value in block_dict.items():
-                if isinstance(value, (bytes, bytearray)):
-                    block_dict[key] = value.hex()
-                elif (
-                    isinstance(value, list)
-                    and value
-                    and isinstance(value[0], (bytes, bytearray))
-                ):
-                    block_dict[key] = [
-                        item.hex() if isinstance(item, (bytes, bytearray)) else item
-                        for item in value
-                    ]
-
-            return block_dict
+            block_dict = serialize_block(block)
         except Exception as e:
             raise Exception(f"Failed to get block: {str(e)}")
 
+        if block_cache is not None:
+            # Finalized blocks are kept indefinitely, recent ones only briefly
+            await block_cache.set(key, dict(block_dict), finalized)
+        return block_dict
+
     def get_params(self):
         return GetBlockParams
@@ -1,14 +1,22 @@
 """Get block number tool for EVM RPC plugin."""
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
-from web3 import Web3
 
 from lomen.plugins.base import BaseTool
+from lomen.plugins.evm_rpc.endpoints import EndpointSelector
+from lomen.plugins.evm_rpc.head_tracker import HeadTracker
+from lomen.plugins.evm_rpc.provider_pool import Web3ProviderPool
+from lomen.plugins.evm_rpc.utils import resolve_rpc
 
 
 class GetBlockNumberParams(BaseModel):
-    rpc_url: str = Field(..., description="The RPC URL for the blockchain")
     chain_id: int = Field(..., description="The chain ID for the blockchain")
+    rpc_url: Optional[str] = Field(
+        None,
+        description="The RPC URL (defaults to the chain's known RPC URL)",
+    )
 
 
 class GetBlockNumber(BaseTool):
@@ -16,6 +24,29 @@ class GetBlockNumber(BaseTool):
     Fetch the current block number from the specified EVM blockchain.
     """
 
+    def __init__(
+        self,
+        provider_pool: Optional[Web3ProviderPool] = None,
+        head_tracker: Optional[HeadTracker] = None,
+        endpoints: Optional[EndpointSelector] = None,
+    ):
+        """
+        Initializes the tool.
+
+        Args:
+            provider_pool: Shared pool of RPC clients. A private one is created if
+                omitted.
+            head_tracker: Shared chain-head tracker to serve recent block numbers
+                from memory. Every call goes to the node if omitted.
+            endpoints: Shared health tracking of RPC endpoints. A private one is
+                created if omitted.
+        """
+        self.provider_pool = (
+            provider_pool if provider_pool is not None else Web3ProviderPool()
+        )
+        self.head_tracker = head_tracker
+        self.endpoints = endpoints if endpoints is not None else EndpointSelector()
+
     @property
     def name(self) -> str:
         """Name of the tool."""
@@ -30,31 +61,38 @@ class GetBlockNumber(BaseTool):
     # def run(self, *args, **kwargs):
     #     raise NotImplementedError("Use the asynchronous 'arun' method.")
 
-    async def arun(self, rpc_url: str, chain_id: int):
+    async def arun(self, *, chain_id: int, rpc_url: Optional[str] = None):
         """
         Asynchronously fetch the current block number from the specified EVM blockchain.
-        (Note: Internally uses synchronous web3 calls)
 
         Args:
-            rpc_url: The RPC URL for the blockchain
             chain_id: The chain ID for the blockchain
+            rpc_url: The RPC URL for the blockchain (defaults to the chain's known one)
 
         Returns:
             Dictionary containing the block number
         """
-        # This logic remains synchronous as web3 is sync
-        try:
-            # Get a Web3 instance for the specified RPC URL and chain ID
-            web3 = Web3(Web3.HTTPProvider(rpc_url))
 
-            # Get the current block number
-            block_number = web3.eth.block_number
+        async def fetch(url: str) -> int:
+            async with self.provider_pool.client(url) as web3:
+                # Get the current block number
+                return await web3.eth.block_number
+
+        try:
+            rpc_urls, _ = resolve_rpc(chain_id, rpc_url, is_poa=False)
+            if self.head_tracker is not None:
+                block_number = await self.head_tracker.get_block_number(
+                    rpc_urls, chain_id
+                )
+            else:
+                block_number = await self.endpoints.call(
+                    rpc_urls, fetch, chain_id=chain_id
+                )
 
             return {
                 "block_number": block_number,
             }
         except Exception as e:
-            # Wrap synchronous exceptions if needed, though direct raise is often fine
             raise Exception(f"Failed to get block number: {str(e)}")
 
     def get_params(self):
@@ -0,0 +1,74 @@
+"""Helpers shared by the EVM RPC tools."""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from lomen.plugins.blockchain.chains import chain_index
+
+
+def serialize_block(block: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a web3 block into a JSON-serializable dictionary.
+
+    Byte values (hashes, ``extraData``, transaction hashes, ...) are converted to
+    hex strings.
+
+    Args:
+        block: Block as returned by ``eth.get_block``.
+
+    Returns:
+        Dictionary containing the block information.
+    """
+    block_dict = dict(block)
+    for key, value in block_dict.items():
+        if isinstance(value, (bytes, bytearray)):
+            block_dict[key] = value.hex()
+        elif (
+            isinstance(value, list)
+            and value
+            and isinstance(value[0], (bytes, bytearray))
+        ):
+            block_dict[key] = [
+                item.hex() if isinstance(item, (bytes, bytearray)) else item
+                for item in value
+            ]
+    return block_dict
+
+
+def resolve_rpc(
+    chain_id: int, rpc_url: Optional[str] = None, is_poa: Optional[bool] = None
+) -> Tuple[List[str], bool]:
+    """
+    Fill in the RPC endpoints and POA flag of a chain from the shared chain index.
+
+    A chain's endpoints come from its ``rpc_urls`` metadata, in order of preference,
+    falling back to its primary ``rpc`` URL.
+
+    Args:
+        chain_id: The chain ID for the blockchain.
+        rpc_url: Explicit RPC URL, used as the only endpoint; looked up if omitted.
+        is_poa: Explicit POA flag; looked up if omitted (False for unknown chains).
+
+    Returns:
+        Tuple of the RPC URLs (in configured order) and POA flag.
+
+    Raises:
+        ValueError: If no RPC URL was given and the chain is unknown.
+    """
+    if rpc_url is not None and is_poa is not None:
+        return [rpc_url], is_poa
+    chain = chain_index.get(chain_id) or {}
+    if rpc_url is not None:
+        rpc_urls = [rpc_url]
+    else:
+        # rpc_urls lists the chain's endpoints in order of preference; rpc
+        # alone is its primary URL
+        rpc_urls = list(chain.get("rpc_urls") or ())
+        if not rpc_urls and chain.get("rpc"):
+            rpc_urls = [chain["rpc"]]
+        if not rpc_urls:
+            raise ValueError(
+                f"No RPC URL known for chain ID {chain_id}; please provide rpc_url."
+            )
+    if is_poa is None:
+        is_poa = bool(chain.get("is_poa", False))
+    return rpc_urls, is_poa
@@ -1,6 +1,7 @@
 """Example plugin implementation demonstrating description functions."""
 
-from typing import List, Dict, Any
+from typing import Any, Dict, List
+
 from .base import BasePlugin, BaseTool
 
 
@@ -108,6 +109,5 @@ print(result)  # Outputs: HELLO
 ```
 """
 
-    @property
-    def tools(self) -> List[BaseTool]:
+    def create_tools(self) -> List[BaseTool]:
         return [ExampleTool(), AnotherExampleTool()]
@@ -0,0 +1,457 @@
+"""Static plugin manifests and lazily loaded plugins.
+
+A manifest (``manifest.json`` next to a plugin package's ``__init__.py``) lists
+the plugin's tools with their descriptions and JSON parameter schemas, so tools
+can be listed and registered without importing the plugin. The implementation
+(and dependencies such as web3 or aiohttp) is imported on the first tool call.
+
+Plugins are found through the ``lomen.plugins`` entry point group and by
+scanning the bundled ``lomen.plugins`` package. Regenerate the bundled
+manifests after changing a tool with::
+
+    python -m lomen.plugins.manifest
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import pkgutil
+import sys
+import types
+from importlib.metadata import entry_points
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from lomen.plugins.base import PARTIAL_RESULT_KWARG, BasePlugin, BaseTool
+
+MANIFEST_FILE = "manifest.json"
+ENTRY_POINT_GROUP = "lomen.plugins"
+DEFAULT_PACKAGE = "lomen.plugins"
+
+_JSON_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    set: "array",
+    dict: "object",
+    type(None): "null",
+}
+_PYTHON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+# -- JSON schemas -- #
+
+
+def _annotation_schema(annotation: Any) -> Dict[str, Any]:
+    """JSON schema of a type annotation (``{}`` for anything not expressible)."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union or origin is types.UnionType:
+        return {"anyOf": [_annotation_schema(arg) for arg in args]}
+    if origin is Literal:
+        return {"enum": list(args)}
+    if origin in (list, set) and args:
+        return {"type": "array", "items": _annotation_schema(args[0])}
+    json_type = _JSON_TYPES.get(origin or annotation)
+    return {"type": json_type} if json_type else {}
+
+
+def _schema_annotation(schema: Dict[str, Any]) -> Any:
+    """Type annotation for a JSON schema produced by ``_annotation_schema``."""
+    if "anyOf" in schema:
+        options = tuple(_schema_annotation(option) for option in schema["anyOf"])
+        return Union[options]
+    if "enum" in schema:
+        return Literal[tuple(schema["enum"])]
+    if schema.get("type") == "array" and "items" in schema:
+        return List[_schema_annotation(schema["items"])]
+    return _PYTHON_TYPES.get(schema.get("type"), Any)
+
+
+def signature_from_schema(
+    parameters: Dict[str, Any], streaming: bool = False
+) -> inspect.Signature:
+    """
+    Build a keyword-only call signature from a tool's JSON parameter schema.
+
+    Parameter descriptions are attached with ``Annotated[..., Field(...)]``, so
+    schema generators such as FastMCP's reproduce them.
+
+    Args:
+        parameters: JSON schema of the tool's arguments.
+        streaming: Whether to add the optional partial-result callback.
+
+    Returns:
+        The signature.
+    """
+    from pydantic import Field
+
+    required = set(parameters.get("required", ()))
+    signature_parameters = []
+    for name, schema in parameters.get("properties", {}).items():
+        annotation = _schema_annotation(schema)
+        if "description" in schema:
+            field = Field(description=schema["description"])
+            annotation = Annotated[annotation, field]
+        signature_parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=(
+                    inspect.Parameter.empty
+                    if name in required
+                    else schema.get("default")
+                ),
+                annotation=annotation,
+            )
+        )
+    if streaming:
+        signature_parameters.append(
+            inspect.Parameter(
+                PARTIAL_RESULT_KWARG, inspect.Parameter.KEYWORD_ONLY, default=None
+            )
+        )
+    return inspect.Signature(signature_parameters)
+
+
+# -- Building manifests -- #
+
+
+def tool_manifest(tool: BaseTool, plugin: BasePlugin) -> Dict[str, Any]:
+    """
+    Describe a tool: name, description, ``arun`` docstring and argument schema.
+
+    The argument schema follows ``arun``'s signature; parameter descriptions are
+    taken from the tool's ``get_params()`` schema.
+    """
+    arun = tool.arun
+    signature = inspect.signature(arun)
+    hints = get_type_hints(arun)
+    described = plugin._get_serializable_params(tool).get("properties", {})
+
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for name, param in signature.parameters.items():
+        if name == PARTIAL_RESULT_KWARG or param.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            continue
+        schema = _annotation_schema(hints.get(name, Any))
+        if "description" in described.get(name, {}):
+            schema["description"] = described[name]["description"]
+        if param.default is inspect.Parameter.empty:
+            required.append(name)
+        else:
+            schema["default"] = param.default
+        properties[name] = schema
+
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "doc": inspect.cleandoc(arun.__doc__) if arun.__doc__ else "",
+        "streaming": PARTIAL_RESULT_KWARG in signature.parameters,
+        "parameters": {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+        },
+    }
+
+
+def build_manifest(plugin: BasePlugin) -> Dict[str, Any]:
+    """Build the manifest of an instantiated plugin."""
+    plugin_class = type(plugin)
+    return {
+        "name": plugin.name,
+        "description": plugin.description,
+        "plugin": f"{plugin_class.__module__}:{plugin_class.__qualname__}",
+        "required_env": list(plugin_class.required_env),
+        "tools": [tool_manifest(tool, plugin) for tool in plugin.tools],
+    }
+
+
+def write_manifest(plugin: BasePlugin) -> str:
+    """Write a plugin's manifest next to its package and return the path."""
+    module = sys.modules[type(plugin).__module__]
+    path = os.path.join(os.path.dirname(module.__file__), MANIFEST_FILE)
+    with open(path, "w") as f:
+        json.dump(build_manifest(plugin), f, indent=2)
+        f.write("\n")
+    return path
+
+
+# -- Finding manifests -- #
+
+
+def _import_object(reference: str) -> Any:
+    """Resolve a ``module:attribute`` reference."""
+    module_name, _, attribute = reference.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def read_manifest(module_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the manifest of a plugin package without importing the package.
+
+    Returns:
+        The manifest, or None if the package has none.
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    for location in spec.submodule_search_locations:
+        path = os.path.join(location, MANIFEST_FILE)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                return json.load(f)
+    return None
+
+
+def find_manifests(package_name: str = DEFAULT_PACKAGE) -> Dict[str, Dict[str, Any]]:
+    """
+    Find plugin manifests without importing the plugins.
+
+    Plugins registered in the ``lomen.plugins`` entry point group come first;
+    those shipping no manifest are described only by name and class, and are
+    imported when instantiated. Subpackages of ``package_name`` with a manifest
+    are added after them.
+
+    Args:
+        package_name: Package whose subpackages are scanned for manifests.
+
+    Returns:
+        Manifests keyed by plugin name.
+    """
+    manifests: Dict[str, Dict[str, Any]] = {}
+    modules = set()
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        module_name = entry_point.value.partition(":")[0]
+        manifest = read_manifest(module_name) or {
+            "name": entry_point.name,
+            "plugin": entry_point.value,
+        }
+        manifests.setdefault(manifest["name"], manifest)
+        modules.add(module_name)
+
+    package = importlib.import_module(package_name)
+    for _, name, is_pkg in pkgutil.iter_modules(
+        package.__path__, package.__name__ + "."
+    ):
+        if not is_pkg or name in modules:
+            continue
+        manifest = read_manifest(name)
+        if manifest is not None:
+            manifests.setdefault(manifest["name"], manifest)
+    return manifests
+
+
+def create_plugin(manifest: Dict[str, Any], lazy: bool = True) -> BasePlugin:
+    """
+    Instantiate the plugin described by a manifest.
+
+    Args:
+        manifest: The plugin manifest.
+        lazy: Return a ``LazyPlugin`` if the manifest lists the tools.
+
+    Returns:
+        The plugin.
+    """
+    if lazy and manifest.get("tools") is not None:
+        return LazyPlugin(manifest)
+    return _import_object(manifest["plugin"])()
+
+
+# -- Lazy plugins -- #
+
+
+class LazyTool(BaseTool):
+    """
+    Stand-in for a tool described by a manifest.
+
+    ``arun`` has the signature and docstring recorded in the manifest; the first
+    call loads the plugin and every call is forwarded to the real tool.
+    """
+
+    def __init__(self, plugin: "LazyPlugin", manifest: Dict[str, Any]):
+        self.plugin = plugin
+        self.manifest = manifest
+
+        async def arun(**kwargs):
+            tool = await self.plugin.load_tool(self.name)
+            return await tool.arun(**kwargs)
+
+        arun.__name__ = "arun"
+        arun.__qualname__ = f"{type(self).__name__}.arun"
+        arun.__doc__ = manifest.get("doc", "")
+        arun.__signature__ = signature_from_schema(
+            manifest["parameters"], streaming=manifest.get("streaming", False)
+        )
+        self.arun = arun
+
+    @property
+    def name(self) -> str:
+        """Name of the tool."""
+        return self.manifest["name"]
+
+    @property
+    def description(self) -> str:
+        """Description of what the tool does."""
+        return self.manifest["description"]
+
+    def get_params(self) -> Dict[str, Any]:
+        """JSON schema of the tool's arguments, from the manifest."""
+        return self.manifest["parameters"]
+
+
+class LazyPlugin(BasePlugin):
+    """
+    Plugin served from its manifest until one of its tools is called.
+
+    The plugin module is imported (off the event loop) and the real plugin
+    instantiated and started on the first tool call; its tools then handle all
+    calls.
+    """
+
+    def __init__(self, manifest: Dict[str, Any]):
+        """
+        Args:
+            manifest: The plugin manifest.
+
+        Raises:
+            ValueError: If an environment variable the plugin requires is unset.
+        """
+        super().__init__()
+        missing = [
+            env for env in manifest.get("required_env", ()) if not os.environ.get(env)
+        ]
+        if missing:
+            raise ValueError(
+                f"Plugin '{manifest['name']}' requires the environment variable(s): "
+                f"{', '.join(missing)}"
+            )
+        self.manifest = manifest
+        self._plugin: Optional[BasePlugin] = None
+        self._started = False
+        self._tools_by_name: Dict[str, BaseTool] = {}
+        self._lock = asyncio.Lock()
+        self._tools = [LazyTool(self, tool) for tool in manifest["tools"]]
+
+    @property
+    def name(self) -> str:
+        """Return the name of the plugin."""
+        return self.manifest["name"]
+
+    @property
+    def description(self) -> str:
+        """Description of what the plugin does."""
+        return self.manifest["description"]
+
+    @property
+    def readme(self) -> str:
+        """Detailed documentation for the plugin (loads the plugin)."""
+        return self.load().readme
+
+    @property
+    def tools(self) -> List[BaseTool]:
+        """Return the tools provided by the plugin."""
+        return list(self._tools)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the plugin implementation has been loaded."""
+        return self._plugin is not None
+
+    def _instantiate(self) -> BasePlugin:
+        plugin = _import_object(self.manifest["plugin"])()
+        self._tools_by_name = {tool.name: tool for tool in plugin.tools}
+        self._plugin = plugin
+        return plugin
+
+    def load(self) -> BasePlugin:
+        """Import and instantiate the plugin if that has not happened yet."""
+        if self._plugin is None:
+            self._instantiate()
+        return self._plugin
+
+    async def aload(self) -> BasePlugin:
+        """
+        Like ``load``, but imports the plugin module in a worker thread and starts
+        the plugin.
+        """
+        if not self._started:
+            async with self._lock:
+                if self._plugin is None:
+                    module_name = self.manifest["plugin"].partition(":")[0]
+                    await asyncio.to_thread(importlib.import_module, module_name)
+                    self._instantiate()
+                if not self._started:
+                    await self._plugin.startup()
+                    self._started = True
+        return self._plugin
+
+    async def load_tool(self, name: str) -> BaseTool:
+        """Return the real tool called ``name``, loading the plugin if needed."""
+        await self.aload()
+        tool = self._tools_by_name.get(name)
+        if tool is None:
+            raise Exception(
+                f"Tool '{name}' is listed in the manifest of plugin '{self.name}' "
+                "but not provided by it; regenerate the manifest."
+            )
+        return tool
+
+    async def startup(self) -> None:
+        """Nothing to prepare until the plugin is loaded by its first call."""
+
+    async def aclose(self) -> None:
+        """Close the real plugin, if it was loaded."""
+        self._started = False
+        aclose = getattr(self._plugin, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Regenerate the manifests of the bundled (or the named) plugins."""
+    names = argv if argv is not None else sys.argv[1:]
+    for manifest in find_manifests().values():
+        if names and manifest["name"] not in names:
+            continue
+        plugin_class = _import_object(manifest["plugin"])
+        # Generating a manifest makes no API calls, so a placeholder is enough
+        for env in plugin_class.required_env:
+            os.environ.setdefault(env, "manifest")
+        print(f"Wrote {write_manifest(plugin_class())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,21 @@
 """1inch plugin for Lomen."""
 
 import os
-from typing import List
+from typing import Dict, List, Optional
 
 from lomen.plugins.base import BasePlugin, BaseTool
 
+from .client import OneInchClient
+from .session import OneInchSession
+
 # Import tools after they are defined to avoid circular imports
 # (We will create these files next)
 from .tools.get_address_from_domain import GetAddressFromDomain
-from .tools.get_token_info import GetTokenInfoBySymbol, GetTokenInfoByAddress
+from .tools.get_nfts import GetNFTsForAddress
 from .tools.get_portfolio import GetPortfolio, GetPortfolioAllChains
 from .tools.get_profit_and_loss import GetProfitAndLoss
 from .tools.get_protocol_investments import GetProtocolInvestments
-from .tools.get_nfts import GetNFTsForAddress
+from .tools.get_token_info import GetTokenInfoByAddress, GetTokenInfoBySymbol
 
 
 class OneInchPlugin(BasePlugin):
@@ -24,15 +27,61 @@ class OneInchPlugin(BasePlugin):
     """
 
     API_KEY_ENV = "ONEINCH_API_KEY"
-
-    def __init__(self):
-        """Initializes the plugin by retrieving the API key from environment."""
-        self.api_key = os.environ.get(self.API_KEY_ENV)
+    required_env = (API_KEY_ENV,)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        connection_limit: Optional[int] = None,
+        dns_cache_ttl: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        cache_size: Optional[int] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initializes the plugin.
+
+        Args:
+            api_key: 1inch API key. Defaults to the ONEINCH_API_KEY environment
+                variable.
+            connection_limit: Maximum simultaneous connections in the shared pool
+                (defaults to ONEINCH_CONNECTION_LIMIT or 100).
+            dns_cache_ttl: Seconds to cache DNS lookups (defaults to
+                ONEINCH_DNS_CACHE_TTL or 300).
+            rate_limit: Requests per second allowed for this API key (defaults to
+                ONEINCH_RATE_LIMIT_RPS or 10; 0 disables client-side limiting).
+            rate_limit_burst: Requests that may be sent back-to-back (defaults to
+                ONEINCH_RATE_LIMIT_BURST or 10).
+            cache_size: Maximum number of cached portfolio responses (defaults to
+                ONEINCH_CACHE_SIZE or 1024; 0 disables the cache).
+            cache_ttls: Per-endpoint TTLs in seconds for ``balances``, ``pnl``,
+                ``protocols`` and ``nfts`` (defaults to ONEINCH_CACHE_TTL_<ENDPOINT>).
+        """
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV)
         if not self.api_key:
             raise ValueError(
-                f"{self.API_KEY_ENV} environment variable must be set for 1inch plugin."
+                f"1inch API key must be provided or the {self.API_KEY_ENV} "
+                "environment variable must be set."
             )
         super().__init__()  # Call parent initializer if needed, though BasePlugin's is empty
+        # One API client (and keep-alive connection pool) shared by every tool
+        self.client = OneInchClient(
+            self.api_key,
+            session=OneInchSession(
+                connection_limit=connection_limit, dns_cache_ttl=dns_cache_ttl
+            ),
+            # The token bucket is shared with every other client using the same key
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
+            cache_size=cache_size,
+            cache_ttls=cache_ttls,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared API client and its connection pool."""
+        await super().aclose()
+        await self.client.aclose()
 
     @property
     def name(self) -> str:
@@ -66,13 +115,44 @@ To use this plugin, you must set the `ONEINCH_API_KEY` environment variable with
 export ONEINCH_API_KEY=your_api_key_here
 ```
 
+All tools call the API through one client, which retries rate-limited (429) and
+transient 5xx responses with jittered exponential backoff and honours `Retry-After`.
+Requests are paced by a token bucket shared by everything using the same API key,
+configured with `ONEINCH_RATE_LIMIT_RPS` (default 10, 0 disables) and
+`ONEINCH_RATE_LIMIT_BURST` (default 10); `lomen.plugins.oneinch.ratelimit.rate_limiter_stats()`
+reports queue depth and wait times.
+Portfolio balances, PnL, protocol and NFT responses are cached in-process for
+30/60/60/120 seconds respectively (override with `ONEINCH_CACHE_TTL_BALANCES`, etc.;
+size with `ONEINCH_CACHE_SIZE`). Pass `refresh_cache=True` to refetch and update the
+cache, or `bypass_cache=True` to skip it; `plugin.client.cache.stats()` reports hits
+and misses.
+Requests share one keep-alive connection pool to api.1inch.dev, tuned with
+`ONEINCH_CONNECTION_LIMIT` (default 100) and `ONEINCH_DNS_CACHE_TTL` (seconds, default 300),
+and is closed by `await plugin.aclose()`. Set `ONEINCH_BASE_URL` to send the requests to
+another API root, e.g. a local stand-in.
+
+Symbol lookups are served from local token lists (`{chain_id}.json` in
+`LOMEN_TOKENS_DIR`, by default the plugin package's `tokens` directory) before falling
+back to the search API. Build or refresh them with:
+
+```bash
+lomen tokens sync                 # all supported chains
+lomen tokens sync --chains 1,137  # selected chains
+```
+
+Refreshes are conditional on the previous ETag / Last-Modified, so unchanged lists are
+not downloaded again (`--force` overrides), and files are replaced atomically.
+
 ## Tools
 
 - `get_address_from_domain`: Resolves blockchain domains to wallet addresses
 - `get_token_info_by_symbol`: Gets token information by its symbol
 - `get_token_info_by_address`: Gets token information by its contract address
 - `get_portfolio`: Gets portfolio data for a wallet on a specific chain
-- `get_portfolio_all_chains`: Gets portfolio data for a wallet across all supported chains
+- `get_portfolio_all_chains`: Gets portfolio data for a wallet across all supported chains.
+  Chains are queried in parallel with a per-chain timeout (`ONEINCH_CHAIN_TIMEOUT`, default 8s)
+  and an overall deadline (`ONEINCH_ALL_CHAINS_DEADLINE`, default 15s); chains still pending
+  at the deadline are reported with status `timed_out`. `astream()` yields chains as they finish.
 - `get_profit_and_loss`: Gets profit/loss information for a wallet
 - `get_protocol_investments`: Gets protocol investment data for a wallet
 - `get_nfts_for_address`: Gets NFTs owned by a wallet
@@ -91,17 +171,19 @@ print(f"Address: {result}")
 ```
 """
 
-    @property
-    def tools(self) -> List[BaseTool]:
-        """Return the tools provided by the plugin."""
-        # Each tool will get its own API key from environment
+    def create_tools(self) -> List[BaseTool]:
+        """Create the tools provided by the plugin."""
+        # All tools share the plugin's API key and client
+        shared = {"api_key": self.api_key, "client": self.client}
+        portfolio = GetPortfolio(**shared)
         return [
-            GetAddressFromDomain(),
-            GetTokenInfoBySymbol(),
-            GetTokenInfoByAddress(),
-            GetPortfolio(),
-            GetPortfolioAllChains(),
-            GetProfitAndLoss(),
-            GetProtocolInvestments(),
-            GetNFTsForAddress(),
+            GetAddressFromDomain(**shared),
+            GetTokenInfoBySymbol(**shared),
+            GetTokenInfoByAddress(**shared),
+            portfolio,
+            # Queries every chain through the single-chain tool above
+            GetPortfolioAllChains(portfolio_tool=portfolio, **shared),
+            GetProfitAndLoss(**shared),
+            GetProtocolInvestments(**shared),
+            GetNFTsForAddress(**shared),
         ]
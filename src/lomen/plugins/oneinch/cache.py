@@ -0,0 +1,124 @@
+"""In-process TTL + LRU response cache for the 1inch API."""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+CACHE_SIZE_ENV = "ONEINCH_CACHE_SIZE"
+CACHE_TTL_ENV_PREFIX = "ONEINCH_CACHE_TTL_"
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Seconds each portfolio endpoint's response may be reused within a conversation
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "balances": 30.0,
+    "pnl": 60.0,
+    "protocols": 60.0,
+    "nfts": 120.0,
+}
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire after a per-entry time-to-live.
+
+    When full, the least recently used entry is evicted. Hit, miss, eviction and
+    expiration counters are kept for ``stats``.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            maxsize: Maximum number of entries kept; 0 disables caching.
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for ``key``, marked recently used, or ``default``."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self._misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._expirations += 1
+            self._misses += 1
+            return default
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache metrics.
+
+        Returns:
+            Dictionary with current size, capacity and hit/miss/eviction/expiration
+            counters.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+
+def default_cache_size() -> int:
+    """Cache capacity from ``ONEINCH_CACHE_SIZE`` (default 1024)."""
+    return int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+
+
+def default_cache_ttls(
+    overrides: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    Per-endpoint TTLs, from defaults, ``ONEINCH_CACHE_TTL_<ENDPOINT>`` and overrides.
+
+    Args:
+        overrides: Explicit TTLs by endpoint name (e.g. ``{"balances": 10}``).
+
+    Returns:
+        Mapping of endpoint name to TTL in seconds.
+    """
+    ttls = dict(DEFAULT_CACHE_TTLS)
+    for endpoint in ttls:
+        value = os.environ.get(f"{CACHE_TTL_ENV_PREFIX}{endpoint.upper()}")
+        if value is not None:
+            ttls[endpoint] = float(value)
+    ttls.update(overrides or {})
+    return ttls
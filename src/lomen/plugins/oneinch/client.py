@@ -0,0 +1,346 @@
+"""HTTP client shared by all 1inch tools."""
+
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Hashable, Mapping, NamedTuple, Optional
+
+import aiohttp
+
+from lomen import tracing
+from lomen.metrics import metrics
+from lomen.plugins.oneinch.cache import (
+    TTLCache,
+    default_cache_size,
+    default_cache_ttls,
+)
+from lomen.plugins.oneinch.ratelimit import (
+    TokenBucket,
+    configure_rate_limiter,
+    get_rate_limiter,
+)
+from lomen.plugins.oneinch.session import OneInchSession
+from lomen.plugins.oneinch.singleflight import SingleFlight
+
+API_BASE_URL = "https://api.1inch.dev"
+BASE_URL_ENV = "ONEINCH_BASE_URL"
+
+# Statuses worth retrying: rate limiting and transient upstream failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.3  # seconds
+DEFAULT_BACKOFF_MAX = 5.0  # seconds
+DEFAULT_MAX_RETRY_AFTER = 30.0  # seconds
+
+_NOT_CACHED = object()
+
+
+class OneInchAPIError(Exception):
+    """Raised when the 1inch API answers with an unexpected status code."""
+
+    def __init__(self, status: int, message: str):
+        self.status = status
+        self.message = message
+        super().__init__(f"1inch API error (Status {status}): {message}")
+
+
+class OneInchResponse(NamedTuple):
+    """Successful (200) or not-modified (304) response returned by ``fetch``."""
+
+    status: int
+    data: Any  # decoded JSON body, None for 304
+    headers: Mapping[str, str]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date.
+
+    Returns:
+        The number of seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def request_key(path: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+    """
+    Canonical identity of a GET request, used to coalesce duplicate calls.
+
+    Hex addresses in the path are case-insensitive and lower-cased; query
+    parameters are order-independent.
+    """
+    segments = tuple(
+        segment.lower() if segment.startswith("0x") else segment
+        for segment in path.split("/")
+    )
+    query = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return segments, query
+
+
+def _span_attributes(path: str) -> Dict[str, Any]:
+    """Trace attributes of a request: its path, API family and chain ID."""
+    segments = path.lstrip("/").split("/")
+    # Chain-specific paths look like /{api}/{version}/{chain_id}/...
+    chain_id = segments[2] if len(segments) > 2 and segments[2].isdigit() else None
+    return {
+        "url.path": path,
+        "lomen.oneinch.api": segments[0],
+        "lomen.chain_id": int(chain_id) if chain_id else None,
+    }
+
+
+class OneInchClient:
+    """
+    Authenticated client for the 1inch Developer Portal API.
+
+    Every tool goes through ``get`` so that status handling, retries and error
+    mapping are identical across tools. Each request attempt (including retries)
+    first takes a token from the API key's shared rate limiter. Concurrent calls
+    for the same canonical request share a single upstream request and result,
+    and responses of cacheable endpoints are reused for a per-endpoint TTL.
+
+    Errors are mapped as follows:
+
+    - 401 raises ``PermissionError``
+    - 400 raises ``ValueError`` with the API's error description
+    - 429 and 5xx are retried with jittered exponential backoff, honouring
+      ``Retry-After``; once retries are exhausted ``OneInchAPIError`` is raised
+    - any other non-200 status raises ``OneInchAPIError``
+    - network errors and timeouts are retried, then re-raised
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[OneInchSession] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        cache_size: Optional[int] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+        base_url: Optional[str] = None,
+    ):
+        """
+        Args:
+            api_key: 1inch Developer Portal API key.
+            session: Connection pool to send requests through. A private one is
+                created if omitted.
+            rate_limit: Requests per second for ``api_key``'s shared token bucket
+                (see ``configure_rate_limiter``); 0 disables client-side limiting.
+            rate_limit_burst: Burst size of the shared token bucket.
+            cache_size: Maximum number of cached responses (defaults to
+                ``ONEINCH_CACHE_SIZE`` or 1024; 0 disables the cache).
+            cache_ttls: Per-endpoint TTL overrides in seconds, keyed by endpoint
+                name (``balances``, ``pnl``, ``protocols``, ``nfts``).
+            max_retries: Number of retries after the first attempt.
+            backoff_base: Delay in seconds before the first retry; doubles per retry.
+            backoff_max: Upper bound for a single backoff delay.
+            max_retry_after: Longest ``Retry-After`` the client is willing to wait;
+                longer waits fail immediately instead.
+            base_url: API root (defaults to ``ONEINCH_BASE_URL`` or the public API),
+                e.g. a local stand-in for testing and benchmarks.
+        """
+        self.api_key = api_key
+        self.session = session or OneInchSession()
+        self.rate_limiter: Optional[TokenBucket]
+        if rate_limit is None and rate_limit_burst is None:
+            self.rate_limiter = get_rate_limiter(api_key)
+        else:
+            # Explicit limits apply to every client sharing the key's bucket
+            self.rate_limiter = configure_rate_limiter(
+                api_key, rate=rate_limit, burst=rate_limit_burst
+            )
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.base_url = (
+            base_url or os.environ.get(BASE_URL_ENV) or API_BASE_URL
+        ).rstrip("/")
+        self.singleflight = SingleFlight()
+        self.cache = TTLCache(
+            default_cache_size() if cache_size is None else cache_size
+        )
+        self.cache_ttls = default_cache_ttls(cache_ttls)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Jittered exponential backoff for the given (zero-based) retry."""
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(delay / 2, delay)
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_endpoint: Optional[str] = None,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False,
+    ) -> Any:
+        """
+        Send a GET request to the 1inch API and return the decoded JSON body.
+
+        Args:
+            path: API path starting with ``/``, e.g. ``/portfolio/v3/1/balances/0x..``.
+            params: Optional query parameters.
+            cache_endpoint: Name of the endpoint in ``cache_ttls`` whose TTL applies;
+                responses are only cached when this is set.
+            bypass_cache: Neither read from nor write to the cache.
+            refresh_cache: Skip the cached value but store the fresh response.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            PermissionError: If the API key is invalid.
+            ValueError: If the API rejects the request parameters.
+            OneInchAPIError: For other non-success responses.
+            aiohttp.ClientError: For network errors after all retries.
+        """
+        key = request_key(path, params)
+        ttl = None
+        if cache_endpoint is not None and not bypass_cache:
+            ttl = self.cache_ttls.get(cache_endpoint)
+
+        with tracing.span("oneinch get", _span_attributes(path)) as span:
+            if ttl and not refresh_cache:
+                cached = self.cache.get(key, _NOT_CACHED)
+                span.set_attribute("lomen.cache.hit", cached is not _NOT_CACHED)
+                if cached is not _NOT_CACHED:
+                    return cached
+
+            result = await self.singleflight.do(key, lambda: self._get(path, params))
+            if ttl:
+                self.cache.set(key, result, ttl)
+            return result
+
+    async def fetch(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> OneInchResponse:
+        """
+        Send a GET request with extra headers and return status, body and headers.
+
+        Unlike ``get`` this bypasses the response cache and request coalescing, and
+        treats ``304 Not Modified`` as success, which makes it suitable for
+        conditional requests (``If-None-Match`` / ``If-Modified-Since``). Rate
+        limiting, retries and error mapping are the same as for ``get``.
+
+        Args:
+            path: API path starting with ``/``.
+            params: Optional query parameters.
+            headers: Extra request headers.
+
+        Returns:
+            OneInchResponse with the status (200 or 304), decoded body and headers.
+        """
+        return await self._request(path, params, headers)
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]]) -> Any:
+        """Perform the request and return only the decoded body."""
+        response = await self._request(path, params)
+        return response.data
+
+    async def _request(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> OneInchResponse:
+        """Perform the request with rate limiting, retries and error mapping."""
+        url = f"{self.base_url}{path}"
+        headers = {"Authorization": f"Bearer {self.api_key}", **(extra_headers or {})}
+        attributes = _span_attributes(path)
+        # Metrics are kept per API family (e.g. "portfolio"): paths hold addresses
+        target = attributes["lomen.oneinch.api"]
+
+        attempt = 0
+        while True:
+            retry_delay = None
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            span = tracing.start_span(
+                "oneinch request", {**attributes, "lomen.retry.attempt": attempt}
+            )
+            started = time.monotonic()
+            outcome = "error"
+            try:
+                session = self.session.get()
+                async with session.get(url, headers=headers, params=params) as response:
+                    status = response.status
+                    outcome = str(status)
+                    if status == 200:
+                        data = await response.json()
+                        return OneInchResponse(status, data, response.headers)
+                    if status == 304:
+                        return OneInchResponse(status, None, response.headers)
+                    if status == 401:
+                        raise PermissionError("Invalid or missing 1inch API key.")
+
+                    error_text = await response.text()
+                    if status == 400:
+                        try:
+                            error_message = json.loads(error_text).get(
+                                "description", error_text
+                            )
+                        except (ValueError, AttributeError):
+                            error_message = error_text
+                        raise ValueError(f"1inch API error: {error_message}")
+
+                    error = OneInchAPIError(status, error_text)
+                    if status not in RETRY_STATUSES or attempt >= self.max_retries:
+                        raise error
+                    if status in (429, 503):
+                        retry_delay = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        if (
+                            retry_delay is not None
+                            and retry_delay > self.max_retry_after
+                        ):
+                            raise error
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                outcome = type(e).__name__
+                if attempt >= self.max_retries:
+                    raise
+            finally:
+                metrics.observe_upstream(
+                    "oneinch", target, time.monotonic() - started, outcome
+                )
+                if outcome.isdigit():
+                    span.set_attribute("http.response.status_code", int(outcome))
+                tracing.end_span(span, None if outcome in ("200", "304") else outcome)
+
+            if retry_delay is None:
+                retry_delay = self._backoff_delay(attempt)
+            attempt += 1
+            await asyncio.sleep(retry_delay)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.session.aclose()
@@ -0,0 +1,202 @@
+"""Client-side token-bucket rate limiting for the 1inch API."""
+
+import asyncio
+import hashlib
+import os
+import time
+from typing import Any, Dict, Optional
+
+RATE_LIMIT_ENV = "ONEINCH_RATE_LIMIT_RPS"
+RATE_LIMIT_BURST_ENV = "ONEINCH_RATE_LIMIT_BURST"
+
+DEFAULT_RATE = 10.0  # requests per second
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """
+    Async token bucket shared by everything that sends requests with one API key.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each request
+    takes one token; when the bucket is empty callers queue in FIFO order until a
+    token becomes available. Queue wait times are recorded for ``stats``.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Sustained requests per second.
+            burst: Maximum number of requests that may be sent back-to-back.
+        """
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive.")
+        if burst < 1:
+            raise ValueError("Rate limit burst must be at least 1.")
+        self.rate = float(rate)
+        self.burst = int(burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Metrics
+        self._waiting = 0
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def configure(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        """Change the rate and/or burst of an existing bucket."""
+        self._refill()
+        if rate is not None:
+            if rate <= 0:
+                raise ValueError("Rate limit must be positive.")
+            self.rate = float(rate)
+        if burst is not None:
+            if burst < 1:
+                raise ValueError("Rate limit burst must be at least 1.")
+            self.burst = int(burst)
+            self._tokens = min(self._tokens, self.burst)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio.Lock binds to the loop it is first contended on, so keep one per loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request may be sent and consume one token.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        start = time.monotonic()
+        self._waiting += 1
+        try:
+            async with self._get_lock():
+                self._refill()
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - start
+        self._acquired += 1
+        self._total_wait += waited
+        if waited > 0.001:
+            self._throttled += 1
+        self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return queue metrics for this bucket.
+
+        Returns:
+            Dictionary with the configured rate/burst, the number of currently
+            queued callers, total acquisitions, how many of them had to wait, and
+            total/average/maximum wait time in seconds.
+        """
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "waiting": self._waiting,
+            "acquired": self._acquired,
+            "throttled": self._throttled,
+            "total_wait_seconds": self._total_wait,
+            "avg_wait_seconds": (
+                self._total_wait / self._acquired if self._acquired else 0.0
+            ),
+            "max_wait_seconds": self._max_wait,
+        }
+
+
+# One bucket per API key, shared by all plugins, tools and clients in the process
+_limiters: Dict[str, TokenBucket] = {}
+
+
+def _key_id(api_key: str) -> str:
+    """Short, non-reversible identifier for an API key (safe to expose in metrics)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+def get_rate_limiter(
+    api_key: str, rate: Optional[float] = None, burst: Optional[int] = None
+) -> Optional[TokenBucket]:
+    """
+    Return the shared token bucket for an API key, creating it on first use.
+
+    ``rate`` and ``burst`` only apply when the bucket is created; an existing
+    bucket is returned unchanged (see ``configure_rate_limiter``).
+
+    Args:
+        api_key: The 1inch API key the quota belongs to.
+        rate: Requests per second. Defaults to ``ONEINCH_RATE_LIMIT_RPS`` or 10.
+            A rate of 0 disables client-side rate limiting.
+        burst: Bucket size. Defaults to ``ONEINCH_RATE_LIMIT_BURST`` or 10.
+
+    Returns:
+        The shared TokenBucket, or None if rate limiting is disabled.
+    """
+    if rate is not None and rate <= 0:
+        return None
+    key = _key_id(api_key)
+    limiter = _limiters.get(key)
+    if limiter is not None:
+        return limiter
+
+    if rate is None:
+        rate = float(os.environ.get(RATE_LIMIT_ENV, DEFAULT_RATE))
+    if burst is None:
+        burst = int(os.environ.get(RATE_LIMIT_BURST_ENV, DEFAULT_BURST))
+    if rate <= 0:
+        return None
+
+    limiter = TokenBucket(rate=rate, burst=burst)
+    _limiters[key] = limiter
+    return limiter
+
+
+def configure_rate_limiter(
+    api_key: str, rate: Optional[float] = None, burst: Optional[int] = None
+) -> Optional[TokenBucket]:
+    """
+    Set the rate and/or burst of an API key's shared token bucket.
+
+    The change applies to everything already sharing the bucket. The bucket is
+    created if it does not exist yet.
+
+    Args:
+        api_key: The 1inch API key the quota belongs to.
+        rate: Requests per second; 0 disables client-side rate limiting for the
+            caller without changing the bucket.
+        burst: Bucket size.
+
+    Returns:
+        The shared TokenBucket, or None if rate limiting is disabled.
+    """
+    limiter = get_rate_limiter(api_key, rate=rate, burst=burst)
+    if limiter is not None:
+        limiter.configure(rate=rate, burst=burst)
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget every API key's bucket, e.g. between tests."""
+    _limiters.clear()
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Return ``stats()`` for every API key's bucket, keyed by a hash of the key."""
+    return {key: limiter.stats() for key, limiter in _limiters.items()}
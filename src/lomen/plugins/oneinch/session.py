@@ -0,0 +1,120 @@
+"""Shared keep-alive HTTP connection pool for the 1inch tools."""
+
+import asyncio
+import os
+from typing import Optional
+
+import aiohttp
+
+CONNECTION_LIMIT_ENV = "ONEINCH_CONNECTION_LIMIT"
+DNS_CACHE_TTL_ENV = "ONEINCH_DNS_CACHE_TTL"
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_DNS_CACHE_TTL = 300  # seconds
+DEFAULT_KEEPALIVE_TIMEOUT = 30  # seconds
+DEFAULT_REQUEST_TIMEOUT = 30  # seconds
+
+
+class OneInchSession:
+    """
+    Long-lived ``aiohttp.ClientSession`` shared by all tools of a OneInchPlugin.
+
+    The session (and its TCP connector) is created lazily on first use, because an
+    aiohttp session is bound to the event loop it was created on. If the running
+    loop changes (e.g. the CLI prints the tool list with ``asyncio.run`` before the
+    server loop starts), the old session is closed and a fresh one is created for
+    the new loop.
+    """
+
+    def __init__(
+        self,
+        connection_limit: Optional[int] = None,
+        dns_cache_ttl: Optional[int] = None,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ):
+        """
+        Args:
+            connection_limit: Maximum number of simultaneous connections in the pool.
+                Defaults to ``ONEINCH_CONNECTION_LIMIT`` or 100.
+            dns_cache_ttl: Seconds to cache DNS lookups for api.1inch.dev.
+                Defaults to ``ONEINCH_DNS_CACHE_TTL`` or 300.
+            keepalive_timeout: Seconds an idle connection is kept open for reuse.
+            request_timeout: Total timeout in seconds for a single request.
+        """
+        if connection_limit is None:
+            connection_limit = int(
+                os.environ.get(CONNECTION_LIMIT_ENV, DEFAULT_CONNECTION_LIMIT)
+            )
+        if dns_cache_ttl is None:
+            dns_cache_ttl = int(
+                os.environ.get(DNS_CACHE_TTL_ENV, DEFAULT_DNS_CACHE_TTL)
+            )
+
+        self.connection_limit = connection_limit
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether there is currently no open session."""
+        return self._session is None or self._session.closed
+
+    def get(self) -> aiohttp.ClientSession:
+        """
+        Return the pooled session, creating it on the running loop if needed.
+
+        Must be called from within a coroutine.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and not self._session.closed:
+                self._close_stale(self._session, self._loop)
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+            self._loop = loop
+        return self._session
+
+    @staticmethod
+    def _close_stale(
+        session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Close a session bound to another event loop than the running one."""
+        if loop.is_running():
+            # Still serving on another thread: close it there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # Nothing can await the close on a stopped loop; detach the connector so
+        # the session counts as closed, and drop its keep-alive connections
+        connector = session.connector
+        session.detach()
+        if connector is None or loop.is_closed():
+            return
+        try:
+            connector.close()
+        except RuntimeError:
+            pass
+
+    async def aclose(self) -> None:
+        """Close the pooled session and all of its keep-alive connections."""
+        session, self._session = self._session, None
+        loop, self._loop = self._loop, None
+        if session is None or session.closed:
+            return
+        if loop is not asyncio.get_running_loop():
+            # The session belongs to another loop and cannot be awaited from here
+            self._close_stale(session, loop)
+            return
+        await session.close()
@@ -0,0 +1,67 @@
+"""Coalescing of identical in-flight requests ("single flight")."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among all concurrent callers with the same key.
+
+    The first caller for a key starts the work; callers arriving while it is still
+    running await the same task and receive the same result (or exception). Once
+    the task finishes the key is forgotten, so later calls start fresh and nothing
+    is served stale.
+
+    Cancelling one caller does not cancel the shared work for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._started = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Hashable identity of the call (e.g. method, path and params).
+            fn: Zero-argument coroutine function performing the actual work.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+            self._started += 1
+        else:
+            self._shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return coalescing metrics.
+
+        Returns:
+            Dictionary with the number of calls that started upstream work, the
+            number that joined an in-flight call instead, and calls in flight now.
+        """
+        return {
+            "started": self._started,
+            "shared": self._shared,
+            "in_flight": len(self._inflight),
+        }
@@ -0,0 +1,96 @@
+"""Local token list cache used to resolve token symbols without calling the API."""
+
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+TOKENS_DIR_ENV = "LOMEN_TOKENS_DIR"
+
+# src/lomen/plugins/tokens
+DEFAULT_TOKENS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tokens"
+)
+
+
+def tokens_dir() -> str:
+    """Directory of the ``{chain_id}.json`` token lists (or ``LOMEN_TOKENS_DIR``)."""
+    return os.environ.get(TOKENS_DIR_ENV) or DEFAULT_TOKENS_DIR
+
+
+def token_file_path(chain_id: int, directory: Optional[str] = None) -> str:
+    """Path of the token list for ``chain_id``."""
+    return os.path.join(directory or tokens_dir(), f"{chain_id}.json")
+
+
+class TokenSymbolIndex:
+    """
+    Case-insensitive symbol -> token index over the per-chain token list files.
+
+    Each chain's file is parsed once and indexed by upper-cased symbol. A lookup
+    only ``stat``s the file; the index is rebuilt when the file's mtime (or size)
+    changes, e.g. after ``lomen tokens sync``. When several tokens share a symbol
+    the first one in the file wins.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Directory of token lists. Defaults to ``tokens_dir()``,
+                resolved on every lookup.
+        """
+        self.directory = directory
+        self._indexes: Dict[str, Tuple[Tuple[int, int], Dict[str, dict]]] = {}
+
+    def _load(self, path: str) -> Dict[str, dict]:
+        try:
+            with open(path, "r") as f:
+                tokens_data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            # Log or handle error reading local file if necessary, but proceed to API
+            print(f"Warning: Error reading local token file {path}: {e}")
+            return {}
+
+        tokens = tokens_data.values() if isinstance(tokens_data, dict) else tokens_data
+        index: Dict[str, dict] = {}
+        for token_info in tokens:
+            if not isinstance(token_info, dict):
+                continue
+            symbol = token_info.get("symbol")
+            if symbol:
+                index.setdefault(symbol.upper(), token_info)
+        return index
+
+    def get_index(self, chain_id: int) -> Dict[str, dict]:
+        """Return the (possibly reloaded) symbol index for ``chain_id``."""
+        path = token_file_path(chain_id, self.directory)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._indexes.pop(path, None)
+            return {}
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._indexes.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        index = self._load(path)
+        self._indexes[path] = (version, index)
+        return index
+
+    def lookup(self, symbol: str, chain_id: int) -> Optional[dict]:
+        """Return the cached token with ``symbol`` (any case) on ``chain_id``."""
+        if not symbol:
+            return None
+        return self.get_index(chain_id).get(symbol.upper())
+
+    def invalidate(self, chain_id: Optional[int] = None) -> None:
+        """Drop the index for one chain, or for all chains."""
+        if chain_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(token_file_path(chain_id, self.directory), None)
+
+
+# Shared by all GetTokenInfoBySymbol instances in the process
+symbol_index = TokenSymbolIndex()
@@ -0,0 +1,144 @@
+"""Download the 1inch token lists into the local token cache."""
+
+import asyncio
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional
+
+from lomen.plugins.oneinch.client import OneInchClient
+from lomen.plugins.oneinch.token_cache import token_file_path, tokens_dir
+from lomen.plugins.oneinch.tools.get_portfolio import INCH1_SUPPORTED_CHAIN_IDS
+
+
+def meta_file_path(chain_id: int, directory: Optional[str] = None) -> str:
+    """Path of the sidecar with a token list's validators (ETag, Last-Modified)."""
+    return os.path.join(directory or tokens_dir(), f"{chain_id}.meta.json")
+
+
+def _read_meta(path: str) -> Dict[str, str]:
+    try:
+        with open(path, "r") as f:
+            meta = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Write ``data`` as JSON to ``path`` so that readers never see a partial file.
+
+    The JSON is written to a temporary file in the same directory, flushed to disk
+    and then renamed over ``path``.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+async def sync_chain(
+    client: OneInchClient,
+    chain_id: int,
+    directory: Optional[str] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Refresh the token list of one chain.
+
+    The request is conditional on the ETag / Last-Modified of the previous sync,
+    so an unchanged list costs a ``304 Not Modified`` and no rewrite.
+
+    Args:
+        client: 1inch API client.
+        chain_id: Chain to download.
+        directory: Token cache directory. Defaults to ``tokens_dir()``.
+        force: Download the full list even if it is unchanged.
+
+    Returns:
+        Dictionary with ``chain_id``, ``status`` (``updated``, ``unchanged`` or
+        ``error``) and either the number of ``tokens`` or an ``error`` message.
+    """
+    path = token_file_path(chain_id, directory)
+    meta_path = meta_file_path(chain_id, directory)
+
+    headers = {}
+    if not force and os.path.exists(path):
+        meta = _read_meta(meta_path)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = await client.fetch(f"/token/v1.2/{chain_id}", headers=headers)
+    except Exception as e:
+        return {"chain_id": chain_id, "status": "error", "error": str(e)}
+
+    if response.status == 304:
+        return {"chain_id": chain_id, "status": "unchanged"}
+
+    tokens = response.data
+    if not isinstance(tokens, (dict, list)):
+        return {
+            "chain_id": chain_id,
+            "status": "error",
+            "error": "Unexpected token list format.",
+        }
+
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    # Write the list before its validators so a crash never pairs old data with new ones
+    await asyncio.to_thread(write_json_atomic, path, tokens)
+    await asyncio.to_thread(
+        write_json_atomic,
+        meta_path,
+        {key: value for key, value in meta.items() if isinstance(value, str)},
+    )
+    return {"chain_id": chain_id, "status": "updated", "tokens": len(tokens)}
+
+
+async def sync_tokens(
+    client: OneInchClient,
+    chain_ids: Optional[Iterable[int]] = None,
+    directory: Optional[str] = None,
+    force: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Refresh the local token lists of several chains concurrently.
+
+    Args:
+        client: 1inch API client.
+        chain_ids: Chains to download. Defaults to every chain supported by 1inch.
+        directory: Token cache directory. Defaults to ``tokens_dir()``.
+        force: Download full lists even if unchanged.
+
+    Returns:
+        One ``sync_chain`` result per chain, in the order requested.
+    """
+    if chain_ids is None:
+        chain_ids = [chain["id"] for chain in INCH1_SUPPORTED_CHAIN_IDS]
+    return list(
+        await asyncio.gather(
+            *(
+                sync_chain(client, chain_id, directory=directory, force=force)
+                for chain_id in chain_ids
+            )
+        )
+    )
@@ -1,10 +1,11 @@
-import asyncio
 import os
+from typing import Optional, Type
+
 import aiohttp
 from pydantic import BaseModel, Field
-from typing import Type
 
 from lomen.plugins.base import BaseTool
+from lomen.plugins.oneinch.client import OneInchClient
 
 
 # --- Pydantic Schema ---
@@ -34,11 +35,14 @@ class GetAddressFromDomain(BaseTool):
         """Description of what the tool does."""
         return "Resolves a blockchain domain name (like ENS, Lens) to its associated wallet address using the 1inch API."
 
-    def __init__(self):
-        """Initializes the tool by retrieving the API key from environment."""
-        self.api_key = os.environ.get(self.API_KEY_ENV)
+    def __init__(
+        self, api_key: Optional[str] = None, client: Optional[OneInchClient] = None
+    ):
+        """Initializes the tool with its API key and shared 1inch API client."""
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV)
         if not self.api_key:
             raise ValueError(f"{self.API_KEY_ENV} environment variable must be set.")
+        self.client = client or OneInchClient(self.api_key)
 
     def get_params(self) -> Type[BaseModel]:
         """Returns the Pydantic schema for the tool's arguments."""
@@ -49,23 +53,11 @@ class GetAddressFromDomain(BaseTool):
         if not domain:
             raise ValueError("Domain name must be provided.")
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        endpoint = f"https://api.1inch.dev/domains/v2.0/lookup?name={domain}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status == 401:
-                    raise PermissionError("Invalid or missing 1inch API key.")
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"1inch API error (Status {response.status}): {error_text}"
-                    )
-                data = await response.json()
-                # Assuming the API returns {"result": "0x..."} or similar on success
-                return data.get(
-                    "result", data
-                )  # Return result field or full data if 'result' not present
+        data = await self.client.get("/domains/v2.0/lookup", params={"name": domain})
+        # Assuming the API returns {"result": "0x..."} or similar on success
+        return data.get(
+            "result", data
+        )  # Return result field or full data if 'result' not present
 
     # Keep a basic run method for potential sync-only adapters, though MCP will use arun
     def run(self, *args, **kwargs):
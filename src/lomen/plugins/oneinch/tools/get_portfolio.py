@@ -1,10 +1,21 @@
 import asyncio
 import os
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+)
+
 import aiohttp
 from pydantic import BaseModel, Field
-from typing import Type, List, Dict, Any, Optional
 
 from lomen.plugins.base import BaseTool
+from lomen.plugins.oneinch.client import OneInchClient
 
 # Define supported chains (as provided in the original code context, assuming INCH1_SUPPORTED_CHAIN_IDS exists)
 # In a real scenario, this might be loaded from a config file or defined more robustly.
@@ -23,6 +34,12 @@ INCH1_SUPPORTED_CHAIN_IDS = [
 ]
 SUPPORTED_CHAIN_IDS_SET = {chain["id"] for chain in INCH1_SUPPORTED_CHAIN_IDS}
 
+# Time budget for get_portfolio_all_chains
+CHAIN_TIMEOUT_ENV = "ONEINCH_CHAIN_TIMEOUT"
+DEADLINE_ENV = "ONEINCH_ALL_CHAINS_DEADLINE"
+DEFAULT_CHAIN_TIMEOUT = 8.0  # seconds per chain
+DEFAULT_DEADLINE = 15.0  # seconds for the whole fan-out
+
 
 # --- Pydantic Schemas ---
 class GetPortfolioParams(BaseModel):
@@ -36,6 +53,16 @@ class GetPortfolioParams(BaseModel):
         description="The chain ID where the portfolio should be retrieved. Common values: 1 (Ethereum), 137 (Polygon), 56 (BNB Chain), 42161 (Arbitrum), 10 (Optimism), etc.",
         title="Chain ID",
     )
+    bypass_cache: bool = Field(
+        False,
+        description="Fetch fresh data without reading or updating the response cache.",
+        title="Bypass Cache",
+    )
+    refresh_cache: bool = Field(
+        False,
+        description="Fetch fresh data and replace the cached response.",
+        title="Refresh Cache",
+    )
 
 
 class GetPortfolioAllChainsParams(BaseModel):
@@ -44,6 +71,16 @@ class GetPortfolioAllChainsParams(BaseModel):
         description="The wallet address to get portfolio data for across all chains.",
         title="Wallet Address",
     )
+    bypass_cache: bool = Field(
+        False,
+        description="Fetch fresh data without reading or updating the response cache.",
+        title="Bypass Cache",
+    )
+    refresh_cache: bool = Field(
+        False,
+        description="Fetch fresh data and replace the cached response.",
+        title="Refresh Cache",
+    )
 
 
 # --- Tool Implementations ---
@@ -64,58 +101,59 @@ class GetPortfolio(BaseTool):
         """Description of what the tool does."""
         return "Fetches portfolio information (token balances, value, etc.) for a specific address on a single blockchain chain."
 
-    def __init__(self):
-        """Initializes the tool by retrieving the API key from environment."""
-        self.api_key = os.environ.get(self.API_KEY_ENV)
+    def __init__(
+        self, api_key: Optional[str] = None, client: Optional[OneInchClient] = None
+    ):
+        """Initializes the tool with its API key and shared 1inch API client."""
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV)
         if not self.api_key:
             raise ValueError(f"{self.API_KEY_ENV} environment variable must be set.")
+        self.client = client or OneInchClient(self.api_key)
 
     def get_params(self) -> Type[BaseModel]:
         """Returns the Pydantic schema for the tool's arguments."""
         return GetPortfolioParams
 
-    async def _call_api(self, address: str, chain_id: int):
+    async def _call_api(
+        self,
+        address: str,
+        chain_id: int,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False,
+    ):
         """Internal async method to call the 1inch API using the stored key."""
         if not address:
             raise ValueError("Wallet address must be provided.")
         if not chain_id:
             raise ValueError("Chain ID must be provided.")
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        endpoint = f"https://api.1inch.dev/portfolio/v3/{chain_id}/balances/{address}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status == 401:
-                    raise PermissionError("Invalid or missing 1inch API key.")
-                if response.status == 400:
-                    error_text = await response.text()
-                    try:
-                        error_data = await response.json()
-                        error_message = error_data.get("description", error_text)
-                        raise ValueError(f"1inch API error: {error_message}")
-                    except:
-                        raise ValueError(f"1inch API error: {error_text}")
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"1inch API error (Status {response.status}): {error_text}"
-                    )
-                data = await response.json()
-                return data
+        return await self.client.get(
+            f"/portfolio/v3/{chain_id}/balances/{address}",
+            cache_endpoint="balances",
+            bypass_cache=bypass_cache,
+            refresh_cache=refresh_cache,
+        )
 
     # Keep a basic run method for potential sync-only adapters
     def run(self, *args, **kwargs):
         """Synchronous execution is not recommended for this I/O-bound tool. Use arun."""
         raise NotImplementedError("Use the asynchronous 'arun' method for this tool.")
 
-    async def arun(self, address: str, chain_id: int):
+    async def arun(
+        self,
+        address: str,
+        chain_id: int,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False,
+    ):
         """
         Asynchronously fetches portfolio information for a specific address on a single chain.
 
         Args:
             address: The wallet address to query.
             chain_id: The chain ID to query.
+            bypass_cache: Skip the response cache entirely.
+            refresh_cache: Ignore any cached response and cache the fresh one.
 
         Returns:
             A dictionary containing detailed portfolio information including token balances.
@@ -126,7 +164,12 @@ class GetPortfolio(BaseTool):
             Exception: For API or network errors.
         """
         try:
-            result = await self._call_api(address=address, chain_id=chain_id)
+            result = await self._call_api(
+                address=address,
+                chain_id=chain_id,
+                bypass_cache=bypass_cache,
+                refresh_cache=refresh_cache,
+            )
 
             # Process the response to make it more useful
             processed_result = {
@@ -179,11 +222,46 @@ class GetPortfolioAllChains(BaseTool):
         """Description of what the tool does."""
         return "Fetches portfolio information (token balances, value) for a specific address across all supported blockchain chains."
 
-    def __init__(self):
-        """Initializes the tool by retrieving the API key from environment."""
-        self.api_key = os.environ.get(self.API_KEY_ENV)
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[OneInchClient] = None,
+        per_chain_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        portfolio_tool: Optional[GetPortfolio] = None,
+    ):
+        """
+        Initializes the tool with its API key and shared 1inch API client.
+
+        Args:
+            api_key: 1inch API key. Defaults to the ONEINCH_API_KEY environment
+                variable.
+            client: Shared 1inch API client.
+            per_chain_timeout: Seconds to wait for a single chain (defaults to
+                ONEINCH_CHAIN_TIMEOUT or 8).
+            deadline: Seconds to wait for all chains before returning partial
+                results (defaults to ONEINCH_ALL_CHAINS_DEADLINE or 15).
+            portfolio_tool: Single-chain tool to query each chain with (the
+                plugin's own, so both share its state).
+        """
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV)
         if not self.api_key:
             raise ValueError(f"{self.API_KEY_ENV} environment variable must be set.")
+        self.client = client or OneInchClient(self.api_key)
+        self.per_chain_timeout = (
+            per_chain_timeout
+            if per_chain_timeout is not None
+            else float(os.environ.get(CHAIN_TIMEOUT_ENV, DEFAULT_CHAIN_TIMEOUT))
+        )
+        self.deadline = (
+            deadline
+            if deadline is not None
+            else float(os.environ.get(DEADLINE_ENV, DEFAULT_DEADLINE))
+        )
+        # Reuse the single-chain tool (and its client) for every chain
+        self.portfolio_tool = portfolio_tool or GetPortfolio(
+            api_key=self.api_key, client=self.client
+        )
         # List of chain IDs supported by 1inch API
         self.supported_chains = [
             1,  # Ethereum
@@ -202,50 +280,131 @@ class GetPortfolioAllChains(BaseTool):
         """Returns the Pydantic schema for the tool's arguments."""
         return GetPortfolioAllChainsParams
 
-    async def _call_api(self, address: str, chain_ids: List[int]):
-        """Internal async method to call the 1inch API for multiple chains."""
+    async def _fetch_chain(
+        self, address: str, chain_id: int, bypass_cache: bool, refresh_cache: bool
+    ) -> Dict[str, Any]:
+        """Fetch one chain, turning errors and the per-chain timeout into a status."""
+        try:
+            chain_result = await asyncio.wait_for(
+                self.portfolio_tool.arun(
+                    address=address,
+                    chain_id=chain_id,
+                    bypass_cache=bypass_cache,
+                    refresh_cache=refresh_cache,
+                ),
+                timeout=self.per_chain_timeout,
+            )
+            return {**chain_result, "status": "ok"}
+        except asyncio.TimeoutError:
+            return {
+                "chain_id": chain_id,
+                "status": "timed_out",
+                "error": f"No response within {self.per_chain_timeout}s",
+            }
+        except Exception as e:
+            # For multi-chain queries, we don't want one failure to break everything
+            # Just note the error but continue with other chains
+            return {"chain_id": chain_id, "status": "error", "error": str(e)}
+
+    async def _call_api(
+        self,
+        address: str,
+        chain_ids: List[int],
+        bypass_cache: bool = False,
+        refresh_cache: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Internal async generator querying all chains in parallel.
+
+        Yields each chain's result as soon as it completes. When the overall
+        deadline passes, the remaining requests are cancelled and a ``timed_out``
+        entry is yielded for each unfinished chain.
+        """
         if not address:
             raise ValueError("Wallet address must be provided.")
         if not chain_ids:
             raise ValueError("At least one chain ID must be provided.")
 
-        # Create portfolio tool to reuse existing code
-        portfolio_tool = GetPortfolio()
-
-        # Use asyncio.gather to fetch all chains in parallel
-        tasks = []
-        for chain_id in chain_ids:
-            # Create task for each chain
-            task = asyncio.create_task(
-                portfolio_tool.arun(address=address, chain_id=chain_id)
-            )
-            tasks.append((chain_id, task))
-
-        # Wait for all tasks to complete and collect results
-        results = {}
-        for chain_id, task in tasks:
-            try:
-                # Get the result, suppress errors for individual chains
-                chain_result = await task
-                results[str(chain_id)] = chain_result
-            except Exception as e:
-                # For multi-chain queries, we don't want one failure to break everything
-                # Just note the error but continue with other chains
-                results[str(chain_id)] = {"error": str(e), "chain_id": chain_id}
-
-        return results
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + self.deadline
+        tasks = {
+            asyncio.create_task(
+                self._fetch_chain(address, chain_id, bypass_cache, refresh_cache)
+            ): chain_id
+            for chain_id in chain_ids
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = deadline_at - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+
+            for task in pending:
+                task.cancel()
+                yield {
+                    "chain_id": tasks[task],
+                    "status": "timed_out",
+                    "error": f"Overall deadline of {self.deadline}s exceeded",
+                }
+        finally:
+            # Also reached when the consumer stops iterating early
+            for task in pending:
+                task.cancel()
 
     # Keep a basic run method for potential sync-only adapters
     def run(self, *args, **kwargs):
         """Synchronous execution is not recommended for this I/O-bound tool. Use arun."""
         raise NotImplementedError("Use the asynchronous 'arun' method for this tool.")
 
-    async def arun(self, address: str):
+    async def astream(
+        self, address: str, bypass_cache: bool = False, refresh_cache: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously yields each chain's portfolio as soon as it is available.
+
+        Args:
+            address: The wallet address to query.
+            bypass_cache: Skip the response cache entirely.
+            refresh_cache: Ignore any cached responses and cache the fresh ones.
+
+        Yields:
+            Per-chain dictionaries with a ``status`` of ``ok``, ``error`` or
+            ``timed_out``, in completion order.
+        """
+        async for chain_result in self._call_api(
+            address=address,
+            chain_ids=self.supported_chains,
+            bypass_cache=bypass_cache,
+            refresh_cache=refresh_cache,
+        ):
+            yield chain_result
+
+    async def arun(
+        self,
+        address: str,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False,
+        on_partial_result: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ):
         """
         Asynchronously fetches portfolio information for a specific address across all supported chains.
 
+        Chains are collected as they finish. If the overall deadline passes, the
+        chains fetched so far are returned and every unfinished chain is marked
+        with status ``timed_out``.
+
         Args:
             address: The wallet address to query.
+            bypass_cache: Skip the response cache entirely.
+            refresh_cache: Ignore any cached responses and cache the fresh ones.
+            on_partial_result: Optional coroutine called with each chain's result
+                as it arrives (used by adapters that can stream).
 
         Returns:
             A dictionary containing portfolio information mapped by chain ID.
@@ -256,10 +415,22 @@ class GetPortfolioAllChains(BaseTool):
             Exception: For API or network errors.
         """
         try:
-            # Call API with all supported chains
-            results = await self._call_api(
-                address=address, chain_ids=self.supported_chains
-            )
+            completed = {}
+            async for chain_result in self.astream(
+                address=address,
+                bypass_cache=bypass_cache,
+                refresh_cache=refresh_cache,
+            ):
+                completed[chain_result["chain_id"]] = chain_result
+                if on_partial_result is not None:
+                    await on_partial_result(chain_result)
+
+            # Report chains in the configured order, not completion order
+            results = {
+                str(chain_id): completed[chain_id]
+                for chain_id in self.supported_chains
+                if chain_id in completed
+            }
 
             # Calculate total portfolio value across all chains
             total_portfolio_value = 0
@@ -271,12 +442,20 @@ class GetPortfolioAllChains(BaseTool):
                     if chain_data["total_usd_value"] > 0:
                         chains_with_assets += 1
 
+            timed_out = [
+                int(chain_id)
+                for chain_id, chain_data in results.items()
+                if chain_data.get("status") == "timed_out"
+            ]
+
             # Add summary to the results
             summary = {
                 "address": address,
                 "total_value_usd": total_portfolio_value,
                 "chains_with_assets": chains_with_assets,
                 "chains_queried": len(self.supported_chains),
+                "chains_timed_out": timed_out,
+                "complete": not timed_out,
             }
 
             return {"summary": summary, "chains": results}
@@ -1,10 +1,11 @@
-import asyncio
 import os
+from typing import Optional, Type
+
 import aiohttp
 from pydantic import BaseModel, Field
-from typing import Type, List, Dict, Any, Optional
 
 from lomen.plugins.base import BaseTool
+from lomen.plugins.oneinch.client import OneInchClient
 
 
 # --- Pydantic Schema ---
@@ -19,6 +20,16 @@ class GetProtocolInvestmentsParams(BaseModel):
         description="The chain ID (e.g., 1 for Ethereum, 137 for Polygon) to analyze.",
         title="Chain ID",
     )
+    bypass_cache: bool = Field(
+        False,
+        description="Fetch fresh data without reading or updating the response cache.",
+        title="Bypass Cache",
+    )
+    refresh_cache: bool = Field(
+        False,
+        description="Fetch fresh data and replace the cached response.",
+        title="Refresh Cache",
+    )
 
 
 # --- Tool Implementation ---
@@ -39,57 +50,58 @@ class GetProtocolInvestments(BaseTool):
         """Description of what the tool does."""
         return "Fetches information about a wallet's investments in various DeFi protocols (e.g., Aave, Uniswap) on a blockchain."
 
-    def __init__(self):
-        """Initializes the tool by retrieving the API key from environment."""
-        self.api_key = os.environ.get(self.API_KEY_ENV)
+    def __init__(
+        self, api_key: Optional[str] = None, client: Optional[OneInchClient] = None
+    ):
+        """Initializes the tool with its API key and shared 1inch API client."""
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV)
         if not self.api_key:
             raise ValueError(f"{self.API_KEY_ENV} environment variable must be set.")
+        self.client = client or OneInchClient(self.api_key)
 
     def get_params(self) -> Type[BaseModel]:
         """Returns the Pydantic schema for the tool's arguments."""
         return GetProtocolInvestmentsParams
 
-    async def _call_api(self, address: str, chain_id: int):
+    async def _call_api(
+        self,
+        address: str,
+        chain_id: int,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False,
+    ):
         """Internal async method to call the 1inch API using the stored key."""
         if not address:
             raise ValueError("Wallet address must be provided.")
         if not chain_id:
             raise ValueError("Chain ID must be provided.")
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        endpoint = f"https://api.1inch.dev/portfolio/v3/{chain_id}/protocols/{address}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status == 401:
-                    raise PermissionError("Invalid or missing 1inch API key.")
-                if response.status == 400:
-                    error_text = await response.text()
-                    try:
-                        error_data = await response.json()
-                        error_message = error_data.get("description", error_text)
-                        raise ValueError(f"1inch API error: {error_message}")
-                    except:
-                        raise ValueError(f"1inch API error: {error_text}")
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"1inch API error (Status {response.status}): {error_text}"
-                    )
-                data = await response.json()
-                return data
+        return await self.client.get(
+            f"/portfolio/v3/{chain_id}/protocols/{address}",
+            cache_endpoint="protocols",
+            bypass_cache=bypass_cache,
+            refresh_cache=refresh_cache,
+        )
 
     def run(self, *args, **kwargs):
         """Synchronous execution is not recommended for this I/O-bound tool. Use arun."""
         raise NotImplementedError("Use the asynchronous 'arun' method for this tool.")
 
-    async def arun(self, address: str, chain_id: int):
+    async def arun(
+        self,
+        address: str,
+        chain_id: int,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False,
+    ):
         """
         Asynchronously retrieves protocol investment information for a wallet on a specific chain.
 
         Args:
             address: The wallet address to analyze.
             chain_id: The chain ID to analyze.
+            bypass_cache: Skip the response cache entirely.
+            refresh_cache: Ignore any cached response and cache the fresh one.
 
         Returns:
             A dictionary containing protocol investment information for the wallet.
@@ -100,7 +112,12 @@ class GetProtocolInvestments(BaseTool):
             Exception: For API or network errors.
         """
         try:
-            result = await self._call_api(address=address, chain_id=chain_id)
+            result = await self._call_api(
+                address=address,
+                chain_id=chain_id,
+                bypass_cache=bypass_cache,
+                refresh_cache=refresh_cache,
+            )
 
             # Process and enrich the response
             processed_result = {
@@ -1,11 +1,12 @@
-import asyncio
 import os
-import json
+from typing import Optional, Type
+
 import aiohttp
 from pydantic import BaseModel, Field
-from typing import Type, Optional
 
 from lomen.plugins.base import BaseTool
+from lomen.plugins.oneinch.client import OneInchAPIError, OneInchClient
+from lomen.plugins.oneinch.token_cache import symbol_index
 
 
 # --- Pydantic Schemas ---
@@ -40,40 +41,24 @@ class GetTokenInfoBySymbol(BaseTool):
             "Fetches detailed token information by its symbol on a specific blockchain."
         )
 
-    def __init__(self):
-        """Initializes the tool by retrieving the API key from environment."""
-        self.api_key = os.environ.get(self.API_KEY_ENV)
+    def __init__(
+        self, api_key: Optional[str] = None, client: Optional[OneInchClient] = None
+    ):
+        """Initializes the tool with its API key and shared 1inch API client."""
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV)
         if not self.api_key:
             raise ValueError(f"{self.API_KEY_ENV} environment variable must be set.")
+        self.client = client or OneInchClient(self.api_key)
+        # In-memory symbol index over the local token lists, shared process-wide
+        self.token_index = symbol_index
 
     def get_params(self) -> Type[BaseModel]:
         """Returns the Pydantic schema for the tool's arguments."""
         return GetTokenInfoBySymbolParams
 
     def _check_local_cache(self, symbol: str, chain_id: int) -> Optional[dict]:
-        """Checks the local JSON cache for the token."""
-        # Adjusted path relative to the 'src' directory
-        tokens_file_path = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(__file__))
-            ),  # Moves up three levels from tools/ -> oneinch/ -> plugins/
-            "tokens",
-            f"{chain_id}.json",
-        )
-        if os.path.exists(tokens_file_path):
-            try:
-                with open(tokens_file_path, "r") as f:
-                    tokens_data = json.load(f)
-                # Search case-insensitively
-                for token_info in tokens_data.values():
-                    if token_info.get("symbol", "").upper() == symbol.upper():
-                        return token_info
-            except (json.JSONDecodeError, IOError) as e:
-                # Log or handle error reading local file if necessary, but proceed to API
-                print(
-                    f"Warning: Error reading local token file {tokens_file_path}: {e}"
-                )
-        return None
+        """Checks the local token list cache for the token (case-insensitive)."""
+        return self.token_index.lookup(symbol=symbol, chain_id=chain_id)
 
     async def _call_api(self, symbol: str, chain_id: int):
         """Internal async method to call the 1inch API using the stored key."""
@@ -82,28 +67,22 @@ class GetTokenInfoBySymbol(BaseTool):
         if not chain_id:
             raise ValueError("Chain ID must be provided.")
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
         # Parameters from original code
-        only_positive_rating = True
-        country = "US"
-        endpoint = f"https://api.1inch.dev/token/v1.2/{chain_id}/search?query={symbol}&only_positive_rating={only_positive_rating}&limit=1&country={country}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status == 401:
-                    raise PermissionError("Invalid or missing 1inch API key.")
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"1inch API error (Status {response.status}): {error_text}"
-                    )
-                data = await response.json()
-                if not data:
-                    raise ValueError(
-                        f"Token symbol '{symbol}' not found on chain {chain_id} via 1inch API."
-                    )
-                # API returns a list, take the first element
-                return data[0]
+        data = await self.client.get(
+            f"/token/v1.2/{chain_id}/search",
+            params={
+                "query": symbol,
+                "only_positive_rating": "true",
+                "limit": 1,
+                "country": "US",
+            },
+        )
+        if not data:
+            raise ValueError(
+                f"Token symbol '{symbol}' not found on chain {chain_id} via 1inch API."
+            )
+        # API returns a list, take the first element
+        return data[0]
 
     # Keep a basic run method for potential sync-only adapters
     def run(self, *args, **kwargs):
@@ -167,11 +146,14 @@ class GetTokenInfoByAddress(BaseTool):
         """Description of what the tool does."""
         return "Fetches detailed token information by its contract address on a specific blockchain."
 
-    def __init__(self):
-        """Initializes the tool by retrieving the API key from environment."""
-        self.api_key = os.environ.get(self.API_KEY_ENV)
+    def __init__(
+        self, api_key: Optional[str] = None, client: Optional[OneInchClient] = None
+    ):
+        """Initializes the tool with its API key and shared 1inch API client."""
+        self.api_key = api_key or os.environ.get(self.API_KEY_ENV)
         if not self.api_key:
             raise ValueError(f"{self.API_KEY_ENV} environment variable must be set.")
+        self.client = client or OneInchClient(self.api_key)
 
     def get_params(self) -> Type[BaseModel]:
         """Returns the Pydantic schema for the tool's arguments."""
@@ -184,25 +166,18 @@ class GetTokenInfoByAddress(BaseTool):
         if not chain_id:
             raise ValueError("Chain ID must be provided.")
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        endpoint = f"https://api.1inch.dev/token/v1.2/{chain_id}/custom/{token_address}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status == 401:
-                    raise PermissionError("Invalid or missing 1inch API key.")
-                if response.status != 200:
-                    error_text = await response.text()
-                    # Check for specific 404 for better error message
-                    if response.status == 404:
-                        raise ValueError(
-                            f"Token address '{token_address}' not found on chain {chain_id} via 1inch API."
-                        )
-                    raise Exception(
-                        f"1inch API error (Status {response.status}): {error_text}"
-                    )
-                data = await response.json()
-                return data
+        try:
+            return await self.client.get(
+                f"/token/v1.2/{chain_id}/custom/{token_address}"
+            )
+        except OneInchAPIError as e:
+            # Check for specific 404 for better error message
+            if e.status == 404:
+                raise ValueError(
+                    f"Token address '{token_address}' not found on chain {chain_id} "
+                    "via 1inch API."
+                ) from e
+            raise
 
     # Keep a basic run method for potential sync-only adapters
     def run(self, *args, **kwargs):
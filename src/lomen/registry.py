@@ -2,30 +2,53 @@
 
 import importlib
 import pkgutil
-import inspect
-from typing import Dict, List, Type, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .plugins.base import BasePlugin
+from .plugins.base import BasePlugin, BaseTool, tool_parameters_schema
+from .plugins.manifest import create_plugin, find_manifests
 
 
 class PluginRegistry:
-    """Registry for discovering and accessing Lomen plugins."""
+    """Registry for discovering and accessing Lomen plugins.
+
+    Tool listings, plugin details and the tool index are built once from the
+    registered plugins and cached until another plugin is registered.
+    """
 
     def __init__(self):
         self._plugins: Dict[str, BasePlugin] = {}
+        self._catalog: Optional[Dict[str, Any]] = None
+
+    def discover_plugins(
+        self, package_name: str = "lomen.plugins", lazy: bool = True
+    ) -> None:
+        """Discover all plugins in the given package and installed entry points.
 
-    def discover_plugins(self, package_name: str = "lomen.plugins") -> None:
-        """Discover all plugins in the given package.
+        Plugins with a manifest are registered without importing them (unless
+        ``lazy`` is False); other subpackages are imported to find their plugin
+        classes.
 
         Args:
             package_name: The package to search for plugins
+            lazy: Serve plugins from their manifests until a tool is called
         """
+        manifests = find_manifests(package_name)
+        covered = set()
+        for manifest in manifests.values():
+            covered.add(manifest["plugin"].partition(":")[0])
+            try:
+                plugin_instance = create_plugin(manifest, lazy=lazy)
+                self.register_plugin(plugin_instance)
+            except (ImportError, AttributeError, ValueError):
+                # Skip plugins that can't be imported or lack required settings
+                continue
+
         package = importlib.import_module(package_name)
 
         for _, name, is_pkg in pkgutil.iter_modules(
             package.__path__, package.__name__ + "."
         ):
-            if is_pkg:
+            if is_pkg and name not in covered:
                 try:
                     module = importlib.import_module(name)
                     # Look for plugin classes in the module
@@ -38,8 +61,8 @@ class PluginRegistry:
                         ):
                             # Instantiate the plugin and add it to the registry
                             plugin_instance = attr()
-                            self._plugins[plugin_instance.name] = plugin_instance
-                except (ImportError, AttributeError) as e:
+                            self.register_plugin(plugin_instance)
+                except (ImportError, AttributeError):
                     # Skip modules that can't be imported or don't contain plugins
                     continue
 
@@ -50,6 +73,54 @@ class PluginRegistry:
             plugin: The plugin instance to register
         """
         self._plugins[plugin.name] = plugin
+        self._catalog = None
+
+    def _get_catalog(self) -> Dict[str, Any]:
+        """Build the tool catalog on first use.
+
+        Returns:
+            Dictionary with the tool listing, the name-to-tool index and the
+            details of every plugin (readmes are added when first requested)
+        """
+        if self._catalog is not None:
+            return self._catalog
+
+        tools: List[Dict[str, Any]] = []
+        index: Dict[str, Tuple[str, BaseTool]] = {}
+        plugins: Dict[str, Dict[str, Any]] = {}
+        for plugin_name, plugin in self._plugins.items():
+            plugin_tools = []
+            for tool in plugin.tools:
+                details = {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool_parameters_schema(tool),
+                }
+                plugin_tools.append(details)
+                tools.append({"plugin_name": plugin_name, **details})
+                if tool.name in index:
+                    print(
+                        f"Warning: Tool '{tool.name}' of plugin '{plugin_name}' "
+                        f"shadows the one of plugin '{index[tool.name][0]}'"
+                    )
+                index[tool.name] = (plugin_name, tool)
+            plugins[plugin_name] = {
+                "name": plugin.name,
+                "description": plugin.description,
+                "tools": plugin_tools,
+            }
+
+        self._catalog = {"tools": tools, "index": index, "plugins": plugins}
+        return self._catalog
+
+    def _get_plugin_entry(self, name: str) -> Optional[Dict[str, Any]]:
+        """Cached details of a plugin, including its readme."""
+        entry = self._get_catalog()["plugins"].get(name)
+        if entry is not None and "readme" not in entry:
+            # Readmes of lazily loaded plugins import the plugin, so only
+            # fetch them when asked for
+            entry["readme"] = self._plugins[name].readme
+        return entry
 
     def get_plugin(self, name: str) -> Optional[BasePlugin]:
         """Get a plugin by name.
@@ -68,15 +139,18 @@ class PluginRegistry:
         Returns:
             List of dictionaries containing plugin metadata
         """
-        return [
-            {
-                "name": plugin.name,
-                "description": plugin.description,
-                "readme": plugin.readme,
-                "tools_count": len(plugin.tools),
-            }
-            for plugin in self._plugins.values()
-        ]
+        plugins = []
+        for name in self._plugins:
+            entry = self._get_plugin_entry(name)
+            plugins.append(
+                {
+                    "name": entry["name"],
+                    "description": entry["description"],
+                    "readme": entry["readme"],
+                    "tools_count": len(entry["tools"]),
+                }
+            )
+        return plugins
 
     def get_plugin_details(self, name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a plugin.
@@ -87,64 +161,43 @@ class PluginRegistry:
         Returns:
             Dictionary containing plugin details or None if not found
         """
-        plugin = self.get_plugin(name)
-        if not plugin:
+        entry = self._get_plugin_entry(name)
+        if entry is None:
             return None
 
-        return {
-            "name": plugin.name,
-            "description": plugin.description,
-            "readme": plugin.readme,
-            "tools": plugin.get_tool_details(),
-        }
+        return dict(entry)
+
+    def list_all_tools(self) -> List[Dict[str, Any]]:
+        """List all tools from all plugins.
+
+        Returns:
+            List of dictionaries containing tool metadata
+        """
+        return list(self._get_catalog()["tools"])
 
-    def _get_serializable_params(self, tool) -> Dict[str, Any]:
-        """Get serializable parameter schema from a tool.
+    def get_tool(self, name: str) -> Optional[BaseTool]:
+        """Get a tool by name, from whichever plugin provides it.
 
         Args:
-            tool: The BaseTool instance
+            name: The name of the tool
 
         Returns:
-            A JSON-serializable dictionary of the tool's parameters
+            The tool instance or None if not found
         """
-        params = tool.get_params()
+        entry = self._get_catalog()["index"].get(name)
+        return entry[1] if entry else None
 
-        # Handle case where get_params returns a class (Pydantic model class)
-        if inspect.isclass(params):
-            try:
-                # Try to get schema from Pydantic (v1 or v2)
-                if hasattr(params, "schema"):
-                    return params.schema()
-                elif hasattr(params, "model_json_schema"):
-                    return params.model_json_schema()
-                else:
-                    # Fallback for non-Pydantic classes
-                    return {"type": "object", "properties": {}}
-            except Exception:
-                # If schema extraction fails, return empty schema
-                return {"type": "object", "properties": {}}
-
-        # Handle case where get_params returns a dict already
-        return params
+    def get_tool_plugin(self, name: str) -> Optional[BasePlugin]:
+        """Get the plugin providing a tool.
 
-    def list_all_tools(self) -> List[Dict[str, Any]]:
-        """List all tools from all plugins.
+        Args:
+            name: The name of the tool
 
         Returns:
-            List of dictionaries containing tool metadata
+            The plugin instance or None if no plugin provides the tool
         """
-        tools = []
-        for plugin_name, plugin in self._plugins.items():
-            for tool in plugin.tools:
-                tools.append(
-                    {
-                        "plugin_name": plugin_name,
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": self._get_serializable_params(tool),
-                    }
-                )
-        return tools
+        entry = self._get_catalog()["index"].get(name)
+        return self._plugins[entry[0]] if entry else None
 
 
 # Global registry instance
@@ -0,0 +1,183 @@
+"""Optional OpenTelemetry tracing of tool calls and upstream requests."""
+
+import functools
+import inspect
+import os
+from typing import Any, Callable, Dict, Optional
+
+TRACING_ENV = "LOMEN_TRACING"
+TRACER_NAME = "lomen"
+
+
+class _NoopSpan:
+    """Stands in for both a span and its context manager when tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+    def end(self) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# The OpenTelemetry tracer, resolved on first use; False when tracing is off
+_tracer: Any = None
+
+
+def _get_tracer():
+    global _tracer
+    if _tracer is None:
+        configure()
+    return _tracer or None
+
+
+def configure(enabled: Optional[bool] = None, tracer_provider: Any = None) -> bool:
+    """
+    Turn tracing on or off.
+
+    Tracing is off unless enabled here or with ``LOMEN_TRACING=1``, and needs
+    ``opentelemetry-api``; spans go to the globally configured tracer provider
+    (e.g. the OpenTelemetry SDK with an OTLP exporter) unless one is passed.
+    Tools registered while tracing is off are not traced.
+
+    Args:
+        enabled: Whether to trace; ``None`` reads ``LOMEN_TRACING``.
+        tracer_provider: OpenTelemetry tracer provider to use instead of the
+            global one.
+
+    Returns:
+        Whether tracing is on.
+    """
+    global _tracer
+    if enabled is None:
+        enabled = os.environ.get(TRACING_ENV, "").lower() in ("1", "true", "yes", "on")
+    _tracer = False
+    if enabled:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            print(
+                "Warning: Tracing needs opentelemetry-api "
+                "(pip install 'lomen[tracing]'); tracing is disabled."
+            )
+        else:
+            _tracer = trace.get_tracer(TRACER_NAME, tracer_provider=tracer_provider)
+    return bool(_tracer)
+
+
+def is_enabled() -> bool:
+    """Whether spans are recorded."""
+    return _get_tracer() is not None
+
+
+def _attributes(attributes: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # OpenTelemetry rejects None values
+    if not attributes:
+        return None
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """
+    Context manager running its block in a new span, child of the current one.
+
+    Exceptions leaving the block are recorded on the span and mark it failed.
+
+    Args:
+        name: The span name.
+        attributes: Initial span attributes; ``None`` values are skipped.
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.start_as_current_span(name, attributes=_attributes(attributes))
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """
+    Start a span without making it current; finish it with ``end_span``.
+
+    Suits leaf spans whose start and end are far apart in the code, such as one
+    attempt of a retried request.
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.start_span(name, attributes=_attributes(attributes))
+
+
+def end_span(span: Any, error_type: Optional[str] = None) -> None:
+    """
+    End a span from ``start_span``.
+
+    Args:
+        span: The span.
+        error_type: If the operation failed, an HTTP status code or exception
+            type; recorded as ``error.type`` and marks the span failed.
+    """
+    if not span.is_recording():
+        return
+    if error_type is not None:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.set_attribute("error.type", error_type)
+        span.set_status(Status(StatusCode.ERROR))
+    span.end()
+
+
+def set_attribute(key: str, value: Any) -> None:
+    """Set an attribute on the current span, e.g. a cache hit inside a tool."""
+    if _get_tracer() is None or value is None:
+        return
+    from opentelemetry import trace
+
+    trace.get_current_span().set_attribute(key, value)
+
+
+def trace_tool(tool_name: str, func: Callable) -> Callable:
+    """
+    Wrap a tool function so every call runs in a ``tool <name>`` span.
+
+    The span is the parent of the call's upstream request spans and carries the
+    tool name and, if passed, the ``chain_id`` argument. Returns ``func``
+    unchanged when tracing is off.
+
+    Args:
+        tool_name: The tool name.
+        func: The tool's ``arun`` (or ``run``) or a wrapper of it.
+    """
+    if not is_enabled():
+        return func
+
+    def attributes(kwargs):
+        chain_id = kwargs.get("chain_id")
+        return {
+            "lomen.tool.name": tool_name,
+            "lomen.chain_id": chain_id if isinstance(chain_id, int) else None,
+        }
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def traced(*args, **kwargs):
+            with span(f"tool {tool_name}", attributes(kwargs)):
+                return await func(*args, **kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            with span(f"tool {tool_name}", attributes(kwargs)):
+                return func(*args, **kwargs)
+
+    return traced
@@ -7,6 +7,15 @@ from web3 import Web3
 
 from lomen.plugins.blockchain import BlockchainPlugin
 from lomen.plugins.evm_rpc import EvmRpcPlugin
+from lomen.plugins.oneinch.ratelimit import reset_rate_limiters
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiters():
+    """Start every test with full 1inch token buckets."""
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
 
 
 @pytest.fixture
@@ -52,5 +61,5 @@ def sample_block_data():
         "gasUsed": 1234567,
         "timestamp": 1234567890,
         "transactions": [],
-        "uncles": []
-    }
\ No newline at end of file
+        "uncles": [],
+    }
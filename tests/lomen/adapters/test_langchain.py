@@ -1,7 +1,9 @@
 """Tests for the LangChain adapter."""
 
+import asyncio
 from unittest.mock import MagicMock
 
+import pytest
 from langchain_core.tools import StructuredTool
 
 from lomen.adapters.langchain import register_langchain_tools
@@ -10,34 +12,34 @@ from lomen.plugins.base import BasePlugin, BaseTool
 
 class MockTool(BaseTool):
     """Mock tool implementation for testing."""
-    
+
     name = "test_tool"
-    
+
     def run(self, param1: str, param2: int):
         """Test tool that does nothing."""
         return {"result": f"{param1}_{param2}"}
-    
+
     def get_params(self):
         """Return parameters for the tool."""
         return {
             "param1": {"title": "Param1", "type": "string"},
-            "param2": {"title": "Param2", "type": "integer"}
+            "param2": {"title": "Param2", "type": "integer"},
         }
 
 
 class MockPlugin(BasePlugin):
     """Test plugin implementation."""
-    
+
     # Override __init__ to avoid the warning
     def __init__(self):
         # No need to call super().__init__() since it's a pass in the base class
         pass
-    
+
     @property
     def name(self) -> str:
         """Return the name of the plugin."""
         return "test"
-    
+
     @property
     def tools(self):
         """Return the tools provided by the plugin."""
@@ -48,15 +50,15 @@ def test_register_langchain_tools():
     """Test registering tools with LangChain."""
     # Create a test plugin
     plugin = MockPlugin()
-    
+
     # Register the plugin with LangChain
     tools = register_langchain_tools([plugin])
-    
+
     # Verify the tools were registered correctly
     assert len(tools) == 1
     assert isinstance(tools[0], StructuredTool)
     assert tools[0].name == "test_tool"
-    
+
     # Test calling the tool
     result = tools[0].invoke({"param1": "test", "param2": 123})
     assert result == {"result": "test_123"}
@@ -72,7 +74,7 @@ def test_register_langchain_tools_multiple_plugins():
     tool1.get_params.return_value = {"param": {"type": "string"}}
     tool1.run.return_value = "tool1_result"
     plugin1.tools = [tool1]
-    
+
     plugin2 = MagicMock(spec=BasePlugin)
     tool2 = MagicMock(spec=BaseTool)
     tool2.name = "tool2"
@@ -80,11 +82,74 @@ def test_register_langchain_tools_multiple_plugins():
     tool2.get_params.return_value = {"param": {"type": "string"}}
     tool2.run.return_value = "tool2_result"
     plugin2.tools = [tool2]
-    
+
     # Register the plugins with LangChain
     tools = register_langchain_tools([plugin1, plugin2])
-    
+
     # Verify the tools were registered correctly
     assert len(tools) == 2
     assert tools[0].name == "tool1"
-    assert tools[1].name == "tool2"
\ No newline at end of file
+    assert tools[1].name == "tool2"
+
+
+class AsyncTool(BaseTool):
+    """Mock async-only tool recording the loop of every call."""
+
+    name = "async_tool"
+
+    def __init__(self):
+        self.loops = []
+
+    async def arun(self, value: int):
+        """Async tool that doubles the value."""
+        self.loops.append(asyncio.get_running_loop())
+        return value * 2
+
+    def get_params(self):
+        return {"value": {"title": "Value", "type": "integer"}}
+
+
+class AsyncPlugin(BasePlugin):
+    """Plugin providing one async tool."""
+
+    name = "async"
+
+    def __init__(self):
+        self.tool = AsyncTool()
+
+    def create_tools(self):
+        return [self.tool]
+
+
+@pytest.mark.asyncio
+async def test_async_tool_runs_on_callers_loop():
+    """Test arun is registered as the coroutine and awaited on the caller's loop."""
+    plugin = AsyncPlugin()
+    (tool,) = register_langchain_tools([plugin])
+
+    assert tool.coroutine is not None
+    assert tool.description == "Async tool that doubles the value."
+    assert await tool.ainvoke({"value": 2}) == 4
+    assert plugin.tool.loops == [asyncio.get_running_loop()]
+
+
+def test_sync_invoke_reuses_background_loop():
+    """Test synchronous calls of async tools share one persistent event loop."""
+    plugin = AsyncPlugin()
+    (tool,) = register_langchain_tools([plugin])
+
+    assert tool.invoke({"value": 1}) == 2
+    assert tool.invoke({"value": 3}) == 6
+
+    first, second = plugin.tool.loops
+    assert first is second
+    assert first.is_running()
+
+
+def test_builtin_tools_are_async():
+    """Test tools whose run is not supported are called through arun."""
+    from lomen.plugins.blockchain import BlockchainPlugin
+
+    (tool,) = register_langchain_tools([BlockchainPlugin()])
+
+    assert tool.coroutine is not None
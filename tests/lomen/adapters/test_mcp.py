@@ -1,8 +1,19 @@
 """Tests for the MCP adapter."""
 
-from unittest.mock import MagicMock, AsyncMock
+import asyncio
+import inspect
+from unittest.mock import AsyncMock, MagicMock
 
-from lomen.adapters.mcp import register_mcp_tools
+import pytest
+from mcp.server.fastmcp import Context, FastMCP
+
+from lomen.adapters.mcp import (
+    ToolBusyError,
+    ToolExecutor,
+    plugins_lifespan,
+    register_mcp_tools,
+)
+from lomen.metrics import MetricsRegistry
 from lomen.plugins.base import BasePlugin, BaseTool
 
 
@@ -92,3 +103,231 @@ def test_register_mcp_tools_multiple_plugins():
     assert callable(call2_args.args[0])
     assert call2_args.kwargs.get("name") == "tool2"
     assert call2_args.kwargs.get("description") == "Tool 2 description"
+
+
+class StreamingTool(BaseTool):
+    """Mock tool that reports partial results."""
+
+    name = "streaming_tool"
+
+    async def arun(self, address: str, on_partial_result=None):
+        """Streams two partial results."""
+        for chain_id in (1, 2):
+            if on_partial_result is not None:
+                await on_partial_result({"chain_id": chain_id})
+        return {"address": address}
+
+    def get_params(self):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_register_mcp_tools_streaming_tool():
+    """Test that partial results are forwarded to the MCP context."""
+    mock_server = MagicMock()
+
+    class StreamingPlugin(BasePlugin):
+        name = "streaming_plugin"
+        tools = [StreamingTool()]
+
+    register_mcp_tools(mock_server, [StreamingPlugin()])
+
+    handler = mock_server.add_tool.call_args.args[0]
+    params = inspect.signature(handler).parameters
+    assert "on_partial_result" not in params
+    assert params["ctx"].annotation is Context
+
+    ctx = MagicMock()
+    ctx.report_progress = AsyncMock()
+    ctx.info = AsyncMock()
+    result = await handler(address="0xabc", ctx=ctx)
+
+    assert result == {"address": "0xabc"}
+    assert ctx.report_progress.await_count == 2
+    ctx.info.assert_any_await('{"chain_id": 1}')
+
+
+@pytest.mark.asyncio
+async def test_streaming_tool_schema_hides_context():
+    """Test FastMCP injects the context instead of asking clients for it."""
+
+    class StreamingPlugin(BasePlugin):
+        name = "streaming_plugin"
+        tools = [StreamingTool()]
+
+    server = register_mcp_tools(FastMCP(), [StreamingPlugin()])
+
+    (tool,) = await server.list_tools()
+    assert set(tool.inputSchema["properties"]) == {"address"}
+    assert tool.inputSchema["required"] == ["address"]
+
+
+@pytest.mark.asyncio
+async def test_plugins_lifespan_starts_and_closes_plugins(capsys, caplog):
+    """Test plugins are started before serving and closed on shutdown."""
+    plugins = [MagicMock(spec=BasePlugin), MagicMock(spec=BasePlugin)]
+    for plugin in plugins:
+        plugin.name = "mock_plugin"
+    plugins[0].startup.side_effect = Exception("boom")
+
+    async with plugins_lifespan(plugins)(MagicMock()):
+        for plugin in plugins:
+            plugin.startup.assert_awaited_once()
+            plugin.aclose.assert_not_awaited()
+
+    for plugin in plugins:
+        plugin.aclose.assert_awaited_once()
+    # stdout carries the stdio transport's protocol messages
+    assert capsys.readouterr().out == ""
+    assert "Error starting plugin 'mock_plugin'" in caplog.text
+
+
+class BlockingTool(BaseTool):
+    """Mock tool whose calls wait until released."""
+
+    name = "blocking_tool"
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.running = 0
+
+    async def arun(self, value: int):
+        """Returns the value once released."""
+        self.running += 1
+        try:
+            await self.release.wait()
+            return value
+        finally:
+            self.running -= 1
+
+    def get_params(self):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_register_mcp_tools_limits_tool_concurrency():
+    """Test registered handlers run through the executor's per-tool limit."""
+    mock_server = MagicMock()
+    tool = BlockingTool()
+
+    class BlockingPlugin(BasePlugin):
+        name = "blocking_plugin"
+        tools = [tool]
+
+    executor = ToolExecutor(max_concurrency=10, max_tool_concurrency=1)
+    register_mcp_tools(mock_server, [BlockingPlugin()], executor=executor)
+    handler = mock_server.add_tool.call_args.args[0]
+    assert list(inspect.signature(handler).parameters) == ["value"]
+
+    calls = [asyncio.create_task(handler(value=i)) for i in range(3)]
+    await asyncio.sleep(0)
+
+    assert tool.running == 1
+    stats = executor.stats()
+    assert stats["running"] == 1
+    assert stats["waiting"] == 2
+    assert stats["tools"]["blocking_tool"]["waiting"] == 2
+
+    tool.release.set()
+    assert await asyncio.gather(*calls) == [0, 1, 2]
+    stats = executor.stats()
+    assert stats["calls"] == 3
+    assert stats["queued"] == 2
+    assert stats["running"] == stats["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_global_limit_spans_tools():
+    """Test the global cap applies across different tools."""
+    executor = ToolExecutor(max_concurrency=1, max_queue=0)
+
+    async with executor.slot("a"):
+        with pytest.raises(ToolBusyError) as excinfo:
+            async with executor.slot("b"):
+                pass
+
+    assert "tool 'b'" in str(excinfo.value)
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["tools"]["b"]["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_when_queue_is_full():
+    """Test calls fail fast once the wait queue is full."""
+    executor = ToolExecutor(max_concurrency=1, max_queue=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with executor.slot("tool"):
+            await release.wait()
+
+    running = asyncio.create_task(hold())
+    queued = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    with pytest.raises(ToolBusyError):
+        async with executor.slot("tool"):
+            pass
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert executor.stats()["max_waiting"] == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_queue_timeout():
+    """Test a call waiting longer than the queue timeout is rejected."""
+    executor = ToolExecutor(max_concurrency=1, queue_timeout=0.01)
+
+    async with executor.slot("tool"):
+        with pytest.raises(ToolBusyError, match="no free slot"):
+            async with executor.slot("tool"):
+                pass
+
+    stats = executor.stats()
+    assert stats["timed_out"] == 1
+    assert stats["waiting"] == 0
+
+    # The rejected call did not leak a slot
+    async with executor.slot("tool"):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_executor_reports_to_metrics_registry():
+    """Test queue waits, rejections and running calls reach the registry."""
+    registry = MetricsRegistry()
+    executor = ToolExecutor(max_concurrency=1, max_queue=0, registry=registry)
+    registry.track_executor(executor)
+
+    async with executor.slot("a"):
+        running = registry.snapshot()["executor"]
+        with pytest.raises(ToolBusyError):
+            async with executor.slot("b"):
+                pass
+
+    assert running["running"] == 1
+    assert running["tools"]["a"]["running"] == 1
+    stats = registry.snapshot()["executor"]
+    assert stats["running"] == 0
+    assert stats["rejected"] == 1
+    assert stats["timed_out"] == 0
+    assert stats["tools"]["a"]["queue_wait_seconds"]["count"] == 1
+    assert stats["tools"]["b"]["rejected"] == 1
+    text = registry.render_prometheus()
+    assert "# TYPE lomen_tool_calls_running gauge" in text
+    assert 'lomen_tool_rejections_total{tool="b",reason="queue_full"} 1' in text
+    assert 'lomen_tool_queue_wait_seconds_count{tool="a"} 1' in text
+
+
+def test_executor_limits_from_env(monkeypatch):
+    """Test limits default to the environment."""
+    monkeypatch.setenv("LOMEN_MAX_CONCURRENCY", "8")
+    monkeypatch.setenv("LOMEN_TOOL_CONCURRENCY", "get_blocks=2, get_block=3")
+    monkeypatch.setenv("LOMEN_MAX_QUEUE", "5")
+
+    executor = ToolExecutor()
+
+    assert executor.max_concurrency == 8
+    assert executor.tool_limits == {"get_blocks": 2, "get_block": 3}
+    assert executor.max_queue == 5
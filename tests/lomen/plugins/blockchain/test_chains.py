@@ -0,0 +1,118 @@
+"""Tests for the chain metadata index."""
+
+import json
+import os
+
+import pytest
+
+from lomen.plugins.blockchain.chains import DEFAULT_CHAINS_FILE, ChainIndex, thaw
+
+
+@pytest.fixture
+def chains_file(tmp_path):
+    """Temporary chains file with a single chain."""
+    path = tmp_path / "chains.json"
+    path.write_text(json.dumps({"1": {"name": "Ethereum Mainnet", "tags": ["l1"]}}))
+    return path
+
+
+def bump_mtime(path):
+    """Move the file's modification time forward so a change is detected."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_index_parses_file_once(chains_file, mocker):
+    """Test repeated lookups are served from memory."""
+    index = ChainIndex(str(chains_file), refresh_interval=60)
+    spy = mocker.spy(index, "_load")
+
+    assert index.get(1)["name"] == "Ethereum Mainnet"
+    assert index.get("1")["name"] == "Ethereum Mainnet"
+    assert index.get(2) is None
+
+    assert spy.call_count == 1
+
+
+def test_index_is_read_only(chains_file):
+    """Test entries cannot be modified through the index."""
+    index = ChainIndex(str(chains_file))
+    chain = index.get(1)
+
+    with pytest.raises(TypeError):
+        chain["name"] = "changed"
+    with pytest.raises(TypeError):
+        index.chains()[2] = {}
+    assert chain["tags"] == ("l1",)
+
+
+def test_thaw_returns_mutable_copy(chains_file):
+    """Test thaw converts frozen metadata back to plain dicts and lists."""
+    chain = thaw(ChainIndex(str(chains_file)).get(1))
+
+    assert chain == {"name": "Ethereum Mainnet", "tags": ["l1"]}
+    chain["name"] = "changed"
+
+
+def test_index_refreshes_when_file_changes(chains_file):
+    """Test a modified file is picked up once the refresh interval passed."""
+    index = ChainIndex(str(chains_file), refresh_interval=0)
+    assert index.get(10) is None
+
+    chains_file.write_text(json.dumps({"10": {"name": "OP Mainnet"}}))
+    bump_mtime(chains_file)
+
+    assert index.get(10)["name"] == "OP Mainnet"
+    assert index.get(1) is None
+
+
+def test_index_does_not_check_file_within_refresh_interval(chains_file):
+    """Test the file is not re-checked before the refresh interval passed."""
+    index = ChainIndex(str(chains_file), refresh_interval=60)
+    index.chains()
+
+    chains_file.write_text(json.dumps({"10": {"name": "OP Mainnet"}}))
+    bump_mtime(chains_file)
+
+    assert index.get(10) is None
+    index.reload()
+    assert index.get(10)["name"] == "OP Mainnet"
+
+
+def test_index_keeps_previous_data_on_invalid_file(chains_file, capsys):
+    """Test a failed refresh keeps serving the last good index."""
+    index = ChainIndex(str(chains_file), refresh_interval=0)
+    index.chains()
+
+    chains_file.write_text("{")
+    bump_mtime(chains_file)
+
+    assert index.get(1)["name"] == "Ethereum Mainnet"
+    assert "Warning" in capsys.readouterr().out
+
+
+def test_index_uses_env_path(chains_file, monkeypatch):
+    """Test the chains file can be overridden through LOMEN_CHAINS_FILE."""
+    monkeypatch.setenv("LOMEN_CHAINS_FILE", str(chains_file))
+
+    assert ChainIndex().path == str(chains_file)
+
+
+def test_index_missing_file_raises(tmp_path):
+    """Test the first load reports a missing file."""
+    index = ChainIndex(str(tmp_path / "missing.json"))
+
+    with pytest.raises(FileNotFoundError):
+        index.chains()
+
+
+def test_bundled_chains_have_a_primary_rpc_url():
+    """Test every bundled chain's rpc is one URL, listed first in rpc_urls."""
+    chains = ChainIndex(DEFAULT_CHAINS_FILE).chains()
+
+    for chain in chains.values():
+        assert isinstance(chain["rpc"], str)
+        rpc_urls = chain.get("rpc_urls")
+        if rpc_urls is not None:
+            assert rpc_urls[0] == chain["rpc"]
+            assert all(isinstance(url, str) for url in rpc_urls)
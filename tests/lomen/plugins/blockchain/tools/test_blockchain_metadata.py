@@ -1,17 +1,28 @@
 """Tests for the Blockchain Metadata tool."""
 
 import json
-from unittest.mock import mock_open, patch
 
 import pytest
-import pytest_asyncio  # Import for async fixtures if needed, good practice
 
+from lomen.plugins.blockchain.chains import ChainIndex
 from lomen.plugins.blockchain.tools.blockchain_metadata import (
     GetBlockchainMetadata,
     GetBlockchainMetadataParams,
 )
 
 
+@pytest.fixture
+def chains_file(tmp_path):
+    """Path of a temporary chains file."""
+    return tmp_path / "chains.json"
+
+
+def make_tool(chains_file, chains):
+    """Write ``chains`` to the chains file and return a tool reading it."""
+    chains_file.write_text(json.dumps(chains) if isinstance(chains, dict) else chains)
+    return GetBlockchainMetadata(chains=ChainIndex(str(chains_file)))
+
+
 def test_get_blockchain_metadata_params():
     """Test the parameters for the GetBlockchainMetadata tool."""
     params = GetBlockchainMetadataParams(chain_id=1)
@@ -26,17 +37,10 @@ def test_get_blockchain_metadata_init():
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open", new_callable=mock_open)
-async def test_get_blockchain_metadata_run_ethereum(
-    mock_file, mock_path, blockchain_plugin
-):
+async def test_get_blockchain_metadata_run_ethereum(chains_file):
     """Test running the GetBlockchainMetadata tool with Ethereum Mainnet."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file with test data for Ethereum
-    mock_file.return_value.__enter__.return_value.read.return_value = json.dumps(
+    tool = make_tool(
+        chains_file,
         {
             "1": {
                 "name": "Ethereum Mainnet",
@@ -46,12 +50,9 @@ async def test_get_blockchain_metadata_run_ethereum(
                 "is_testnet": False,
                 "is_poa": False,
             }
-        }
+        },
     )
 
-    # Get the tool from the plugin
-    tool = blockchain_plugin.tools[0]
-
     # Run the tool (now using arun)
     result = await tool.arun(chain_id=1)
 
@@ -66,17 +67,10 @@ async def test_get_blockchain_metadata_run_ethereum(
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open", new_callable=mock_open)
-async def test_get_blockchain_metadata_run_base(
-    mock_file, mock_path, blockchain_plugin
-):
+async def test_get_blockchain_metadata_run_base(chains_file):
     """Test running the GetBlockchainMetadata tool with Base."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file with test data for Base
-    mock_file.return_value.__enter__.return_value.read.return_value = json.dumps(
+    tool = make_tool(
+        chains_file,
         {
             "8453": {
                 "name": "Base",
@@ -86,12 +80,9 @@ async def test_get_blockchain_metadata_run_base(
                 "is_testnet": False,
                 "is_poa": False,
             }
-        }
+        },
     )
 
-    # Get the tool from the plugin
-    tool = blockchain_plugin.tools[0]
-
     # Run the tool (now using arun)
     result = await tool.arun(chain_id=8453)
 
@@ -106,17 +97,10 @@ async def test_get_blockchain_metadata_run_base(
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open", new_callable=mock_open)
-async def test_get_blockchain_metadata_run_polygon(
-    mock_file, mock_path, blockchain_plugin
-):
+async def test_get_blockchain_metadata_run_polygon(chains_file):
     """Test running the GetBlockchainMetadata tool with Polygon."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file with test data for Polygon
-    mock_file.return_value.__enter__.return_value.read.return_value = json.dumps(
+    tool = make_tool(
+        chains_file,
         {
             "137": {
                 "name": "Polygon",
@@ -126,12 +110,9 @@ async def test_get_blockchain_metadata_run_polygon(
                 "is_testnet": False,
                 "is_poa": True,
             }
-        }
+        },
     )
 
-    # Get the tool from the plugin
-    tool = blockchain_plugin.tools[0]
-
     # Run the tool (now using arun)
     result = await tool.arun(chain_id=137)
 
@@ -146,17 +127,10 @@ async def test_get_blockchain_metadata_run_polygon(
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open", new_callable=mock_open)
-async def test_get_blockchain_metadata_run_celo(
-    mock_file, mock_path, blockchain_plugin
-):
+async def test_get_blockchain_metadata_run_celo(chains_file):
     """Test running the GetBlockchainMetadata tool with Celo."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file with test data for Celo
-    mock_file.return_value.__enter__.return_value.read.return_value = json.dumps(
+    tool = make_tool(
+        chains_file,
         {
             "42220": {
                 "name": "Celo",
@@ -166,12 +140,9 @@ async def test_get_blockchain_metadata_run_celo(
                 "is_testnet": False,
                 "is_poa": True,
             }
-        }
+        },
     )
 
-    # Get the tool from the plugin
-    tool = blockchain_plugin.tools[0]
-
     # Run the tool (now using arun)
     result = await tool.arun(chain_id=42220)
 
@@ -186,17 +157,10 @@ async def test_get_blockchain_metadata_run_celo(
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open", new_callable=mock_open)
-async def test_get_blockchain_metadata_run_optimism(
-    mock_file, mock_path, blockchain_plugin
-):
+async def test_get_blockchain_metadata_run_optimism(chains_file):
     """Test running the GetBlockchainMetadata tool with Optimism."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file with test data for Optimism
-    mock_file.return_value.__enter__.return_value.read.return_value = json.dumps(
+    tool = make_tool(
+        chains_file,
         {
             "10": {
                 "name": "Optimism",
@@ -206,12 +170,9 @@ async def test_get_blockchain_metadata_run_optimism(
                 "is_testnet": False,
                 "is_poa": False,
             }
-        }
+        },
     )
 
-    # Get the tool from the plugin
-    tool = blockchain_plugin.tools[0]
-
     # Run the tool (now using arun)
     result = await tool.arun(chain_id=10)
 
@@ -226,26 +187,18 @@ async def test_get_blockchain_metadata_run_optimism(
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open", new_callable=mock_open)
-async def test_get_blockchain_metadata_run_invalid_chain(mock_file, mock_path):
+async def test_get_blockchain_metadata_run_invalid_chain(chains_file):
     """Test running the GetBlockchainMetadata tool with invalid chain ID."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file with test data
-    mock_file.return_value.__enter__.return_value.read.return_value = json.dumps(
+    tool = make_tool(
+        chains_file,
         {
             "1": {
                 "name": "Ethereum Mainnet",
                 "rpc": "https://ethereum-rpc.publicnode.com",
             }
-        }
+        },
     )
 
-    # Create the tool
-    tool = GetBlockchainMetadata()
-
     # Run the tool with invalid chain ID and check for exception (now using arun)
     with pytest.raises(Exception) as excinfo:
         await tool.arun(chain_id=999)
@@ -256,18 +209,9 @@ async def test_get_blockchain_metadata_run_invalid_chain(mock_file, mock_path):
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open")
-async def test_get_blockchain_metadata_run_file_not_found(mock_file, mock_path):
+async def test_get_blockchain_metadata_run_file_not_found(chains_file):
     """Test running the GetBlockchainMetadata tool with missing chains file."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file to raise FileNotFoundError
-    mock_file.side_effect = FileNotFoundError
-
-    # Create the tool
-    tool = GetBlockchainMetadata()
+    tool = GetBlockchainMetadata(chains=ChainIndex(str(chains_file)))
 
     # Run the tool and check for exception (now using arun)
     with pytest.raises(Exception) as excinfo:
@@ -276,20 +220,33 @@ async def test_get_blockchain_metadata_run_file_not_found(mock_file, mock_path):
 
 
 @pytest.mark.asyncio
-@patch("os.path.join")
-@patch("builtins.open", new_callable=mock_open)
-async def test_get_blockchain_metadata_run_invalid_json(mock_file, mock_path):
+async def test_get_blockchain_metadata_run_invalid_json(chains_file):
     """Test running the GetBlockchainMetadata tool with invalid JSON."""
-    # Set up mock path
-    mock_path.return_value = "fake/path/chains.json"
-
-    # Set up mock file with invalid JSON
-    mock_file.return_value.__enter__.return_value.read.return_value = "{"
-
-    # Create the tool
-    tool = GetBlockchainMetadata()
+    tool = make_tool(chains_file, "{")
 
     # Run the tool and check for exception (now using arun)
     with pytest.raises(Exception) as excinfo:
         await tool.arun(chain_id=1)
     assert "Invalid chains data file format" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_get_blockchain_metadata_result_is_a_copy(chains_file):
+    """Test results can be modified without affecting the shared index."""
+    tool = make_tool(chains_file, {"1": {"name": "Ethereum Mainnet"}})
+
+    result = await tool.arun(chain_id=1)
+    result["name"] = "changed"
+
+    assert (await tool.arun(chain_id=1))["name"] == "Ethereum Mainnet"
+
+
+@pytest.mark.asyncio
+async def test_get_blockchain_metadata_bundled_chains(blockchain_plugin):
+    """Test the plugin's tool reads the bundled chains file."""
+    tool = blockchain_plugin.tools[0]
+
+    result = await tool.arun(chain_id=1)
+
+    assert result["name"] == "Ethereum Mainnet"
+    assert result["chain_id"] == 1
@@ -0,0 +1,90 @@
+"""Tests for the finality-aware block cache."""
+
+import json
+
+import pytest
+
+from lomen.plugins.evm_rpc.block_cache import BlockCache
+
+BLOCK = {"number": 100, "hash": "ab" * 32, "transactions": []}
+
+
+@pytest.mark.asyncio
+async def test_finalized_blocks_do_not_expire():
+    """Test finalized blocks are served even after the recent-block TTL."""
+    cache = BlockCache(maxsize=10, recent_ttl=0)
+
+    await cache.set((1, 100, False, False), BLOCK, finalized=True)
+
+    assert await cache.get((1, 100, False, False)) == BLOCK
+    assert await cache.get((1, 100, True, False)) is None
+    assert await cache.get((1, 100, False, True)) is None
+    assert await cache.get((137, 100, False, False)) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_recent_blocks_expire(mocker):
+    """Test non-finalized blocks are only reused for the recent TTL."""
+    clock = mocker.patch(
+        "lomen.plugins.evm_rpc.block_cache.time.monotonic", return_value=1000.0
+    )
+    cache = BlockCache(maxsize=10, recent_ttl=3)
+
+    await cache.set((1, 100, False, False), BLOCK, finalized=False)
+    clock.return_value = 1002.0
+    assert await cache.get((1, 100, False, False)) == BLOCK
+    clock.return_value = 1004.0
+    assert await cache.get((1, 100, False, False)) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded():
+    """Test the least recently used block is evicted when full."""
+    cache = BlockCache(maxsize=2, recent_ttl=3)
+
+    for number in (1, 2, 3):
+        await cache.set((1, number, False, False), {"number": number}, finalized=True)
+
+    assert len(cache) == 2
+    assert await cache.get((1, 1, False, False)) is None
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier(tmp_path):
+    """Test finalized blocks are written to disk and read back by a new cache."""
+    cache = BlockCache(maxsize=10, directory=str(tmp_path))
+    await cache.set((1, 100, False, False), BLOCK, finalized=True)
+    await cache.set((1, 101, False, False), {"number": 101}, finalized=False)
+
+    assert json.loads((tmp_path / "1" / "100.json").read_text()) == BLOCK
+    assert not (tmp_path / "1" / "101.json").exists()
+
+    restarted = BlockCache(maxsize=10, directory=str(tmp_path))
+    assert await restarted.get((1, 100, False, False)) == BLOCK
+    assert restarted.stats()["disk_hits"] == 1
+    # Now served from memory
+    assert await restarted.get((1, 100, False, False)) == BLOCK
+    assert restarted.stats()["hits"] == 1
+
+
+def test_finalized_height_tracking(mocker):
+    """Test finality answers and that the finalized height never decreases."""
+    clock = mocker.patch(
+        "lomen.plugins.evm_rpc.block_cache.time.monotonic", return_value=1000.0
+    )
+    cache = BlockCache(maxsize=10, finality_refresh=12)
+
+    assert cache.is_finalized(1, 100) is None
+    cache.set_finalized_height(1, 150)
+    cache.set_finalized_height(1, 120)
+
+    assert cache.finalized_height(1) == 150
+    assert cache.is_finalized(1, 150) is True
+    assert cache.is_finalized(1, 151) is False
+    clock.return_value = 1013.0
+    assert cache.is_finalized(1, 151) is None  # stale, look it up again
+    assert cache.is_finalized(1, 10) is True
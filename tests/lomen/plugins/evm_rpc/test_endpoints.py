@@ -0,0 +1,151 @@
+"""Tests for the RPC endpoint selector."""
+
+import asyncio
+
+import pytest
+
+from lomen.metrics import metrics
+from lomen.plugins.evm_rpc.endpoints import MIN_HEDGE_SAMPLES, EndpointSelector
+
+
+def make_request(responses, calls):
+    """Request function answering per endpoint after an optional delay."""
+
+    async def request(rpc_url):
+        calls.append(rpc_url)
+        delay, result = responses[rpc_url]
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return request
+
+
+def test_rank_prefers_fast_and_reliable_endpoints():
+    """Test ranking by latency, error rate and configured order."""
+    selector = EndpointSelector(hedge=False)
+    assert selector.rank(["https://a", "https://b"]) == ["https://a", "https://b"]
+
+    selector.record("https://a", 0.2)
+    selector.record("https://b", 0.1)
+    assert selector.rank(["https://a", "https://b", "https://c"]) == [
+        "https://c",  # not measured yet
+        "https://b",
+        "https://a",
+    ]
+
+    selector.record("https://b", 0.1, ConnectionError("down"))
+    selector.record("https://b", 0.1, ConnectionError("down"))
+    assert selector.rank(["https://a", "https://b"]) == ["https://a", "https://b"]
+
+
+@pytest.mark.asyncio
+async def test_call_fails_over_to_next_endpoint():
+    """Test an error on the preferred endpoint is retried on the next one."""
+    selector = EndpointSelector(hedge=False)
+    calls = []
+    request = make_request(
+        {"https://a": (0, ConnectionError("down")), "https://b": (0, 42)}, calls
+    )
+
+    assert await selector.call(["https://a", "https://b"], request) == 42
+
+    assert calls == ["https://a", "https://b"]
+    stats = selector.stats()
+    assert stats["failovers"] == 1
+    assert stats["endpoints"]["https://a"]["failures"] == 1
+    assert stats["endpoints"]["https://a"]["last_error"] == "down"
+    assert stats["endpoints"]["https://b"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_call_raises_last_error_when_all_endpoints_fail():
+    """Test the last error is raised once every endpoint failed."""
+    selector = EndpointSelector(hedge=False)
+    request = make_request(
+        {
+            "https://a": (0, ConnectionError("a down")),
+            "https://b": (0, ConnectionError("b down")),
+        },
+        [],
+    )
+
+    with pytest.raises(ConnectionError, match="b down"):
+        await selector.call(["https://a", "https://b"], request)
+
+
+@pytest.mark.asyncio
+async def test_repeatedly_failing_endpoint_is_put_on_cooldown():
+    """Test consecutive failures make an endpoint a last resort."""
+    selector = EndpointSelector(hedge=False)
+    for _ in range(3):
+        selector.record("https://a", 0.01, ConnectionError("down"))
+    selector.record("https://b", 5.0)
+
+    assert selector.rank(["https://a", "https://b"]) == ["https://b", "https://a"]
+    assert selector.stats()["endpoints"]["https://a"]["healthy"] is False
+
+    selector.record("https://a", 0.01)
+    assert selector.stats()["endpoints"]["https://a"]["healthy"] is True
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged():
+    """Test a request slower than the endpoint's usual latency is raced."""
+    selector = EndpointSelector(hedge=True, hedge_percentile=95)
+    for _ in range(MIN_HEDGE_SAMPLES):
+        selector.record("https://a", 0.01)
+    selector.record("https://b", 0.02)
+    calls = []
+    request = make_request({"https://a": (10, 1), "https://b": (0, 2)}, calls)
+
+    result = await asyncio.wait_for(
+        selector.call(["https://a", "https://b"], request), timeout=5
+    )
+
+    assert result == 2
+    assert calls == ["https://a", "https://b"]
+    stats = selector.stats()
+    assert stats["hedges"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_enough_samples():
+    """Test hedging waits until the endpoint's latency distribution is known."""
+    selector = EndpointSelector(hedge=True)
+    calls = []
+    request = make_request({"https://a": (0.1, 1), "https://b": (0, 2)}, calls)
+
+    assert await selector.call(["https://a", "https://b"], request) == 1
+    assert calls == ["https://a"]
+    assert selector.hedge_delay("https://a") is None
+
+
+@pytest.mark.asyncio
+async def test_call_without_endpoints():
+    """Test calling without endpoints is rejected."""
+    with pytest.raises(ValueError):
+        await EndpointSelector().call([], make_request({}, []))
+
+
+@pytest.mark.asyncio
+async def test_call_records_upstream_metrics():
+    """Test requests are recorded per RPC host, without the URL's path."""
+    metrics.reset()
+    selector = EndpointSelector(hedge=False)
+    request = make_request(
+        {
+            "https://a.example/v3/key": (0, ConnectionError("down")),
+            "https://b.example/v3/key": (0, 42),
+        },
+        [],
+    )
+
+    rpc_urls = ["https://a.example/v3/key", "https://b.example/v3/key"]
+    await selector.call(rpc_urls, request)
+
+    upstreams = metrics.snapshot()["upstreams"]["evm_rpc"]
+    assert upstreams["a.example"]["by_outcome"] == {"ConnectionError": 1}
+    assert upstreams["b.example"]["by_outcome"] == {"ok": 1}
@@ -0,0 +1,128 @@
+"""Tests for the chain-head tracker."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from lomen.plugins.evm_rpc.head_tracker import HeadTracker
+from lomen.plugins.evm_rpc.provider_pool import Web3ProviderPool
+
+
+@pytest.fixture
+def node(mocker):
+    """Patch AsyncWeb3 with a node whose head advances on every eth_blockNumber."""
+    state = {"head": 100, "calls": 0, "delay": 0.0, "fail": False}
+
+    class Eth:
+        @property
+        def block_number(self):
+            async def fetch():
+                state["calls"] += 1
+                await asyncio.sleep(state["delay"])
+                if state["fail"]:
+                    raise ConnectionError("node down")
+                state["head"] += 1
+                return state["head"]
+
+            return fetch()
+
+    def make_client(*args, **kwargs):
+        client = MagicMock()
+        client.eth = Eth()
+        client.provider.disconnect = AsyncMock()
+        return client
+
+    mocker.patch(
+        "lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", side_effect=make_client
+    )
+    return state
+
+
+@pytest_asyncio.fixture
+async def tracker():
+    tracker = HeadTracker(
+        Web3ProviderPool(), max_staleness=60, poll_interval=60, idle_timeout=60
+    )
+    yield tracker
+    await tracker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_memory(node, tracker):
+    """Test reads within the max staleness share one eth_blockNumber call."""
+    results = [await tracker.get_block_number("https://a", 1) for _ in range(5)]
+
+    assert results == [101] * 5
+    assert node["calls"] == 1
+    assert tracker.stats()["reads"] == 5
+    assert tracker.stats()["chains"] == [1]
+
+
+@pytest.mark.asyncio
+async def test_heads_are_tracked_per_rpc_urls(node, tracker):
+    """Test a caller-supplied endpoint does not change other callers' head."""
+    assert await tracker.get_block_number("https://a", 1) == 101
+    assert await tracker.get_block_number("https://fork", 1) == 102
+
+    assert await tracker.get_block_number("https://a", 1) == 101
+    assert await tracker.get_block_number("https://fork", 1) == 102
+    assert node["calls"] == 2
+    assert tracker.stats()["chains"] == [1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_are_coalesced(node, tracker):
+    """Test concurrent cold reads wait for a single upstream request."""
+    node["delay"] = 0.01
+
+    results = await asyncio.gather(
+        *(tracker.get_block_number("https://a", 1) for _ in range(10))
+    )
+
+    assert set(results) == {101}
+    assert node["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_head_is_refreshed(node):
+    """Test a head older than the max staleness is fetched again."""
+    tracker = HeadTracker(
+        Web3ProviderPool(), max_staleness=0, poll_interval=60, idle_timeout=60
+    )
+    try:
+        assert await tracker.get_block_number("https://a", 1) == 101
+        assert await tracker.get_block_number("https://a", 1) == 102
+    finally:
+        await tracker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_poller_refreshes_and_stops_when_idle(node):
+    """Test the background poller refreshes the head and stops without readers."""
+    tracker = HeadTracker(
+        Web3ProviderPool(), max_staleness=60, poll_interval=0.01, idle_timeout=0.05
+    )
+    try:
+        await tracker.get_block_number("https://a", 1)
+        await asyncio.sleep(0.03)
+        assert node["calls"] >= 2
+
+        await asyncio.sleep(0.1)
+        calls = node["calls"]
+        await asyncio.sleep(0.03)
+        assert node["calls"] == calls
+        assert tracker.stats()["chains"] == []
+    finally:
+        await tracker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_cold_readers(node, tracker):
+    """Test a failed fetch raises for readers without a cached head."""
+    node["fail"] = True
+
+    with pytest.raises(ConnectionError):
+        await tracker.get_block_number("https://a", 1)
+    assert tracker.stats()["errors"] == 1
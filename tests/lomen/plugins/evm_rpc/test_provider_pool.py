@@ -0,0 +1,127 @@
+"""Tests for the Web3 provider pool."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lomen.plugins.evm_rpc import EvmRpcPlugin
+from lomen.plugins.evm_rpc.provider_pool import Web3ProviderPool
+
+
+@pytest.fixture
+def mock_web3_class(mocker):
+    """Patch AsyncWeb3 so that every construction returns a fresh mock client."""
+
+    def make_client(*args, **kwargs):
+        client = MagicMock()
+        client.provider.disconnect = AsyncMock()
+        return client
+
+    mock_class = mocker.patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3")
+    mock_class.side_effect = make_client
+    return mock_class
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_per_url_and_poa(mock_web3_class):
+    """Test one client is created per (rpc_url, is_poa) and then reused."""
+    pool = Web3ProviderPool(max_size=4, idle_timeout=60)
+
+    async with pool.client("https://a", False) as first:
+        pass
+    async with pool.client("https://a", False) as again:
+        pass
+    async with pool.client("https://a", True) as poa:
+        pass
+
+    assert first is again
+    assert poa is not first
+    first.middleware_onion.inject.assert_not_called()
+    poa.middleware_onion.inject.assert_called_once()
+    assert pool.stats()["created"] == 2
+    assert pool.stats()["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_least_recently_used(mock_web3_class):
+    """Test the pool stays bounded and disconnects the evicted client."""
+    pool = Web3ProviderPool(max_size=2, idle_timeout=60)
+
+    async with pool.client("https://a") as a:
+        pass
+    async with pool.client("https://b"):
+        pass
+    async with pool.client("https://a"):
+        pass
+    async with pool.client("https://c"):
+        pass
+
+    assert len(pool) == 2
+    assert pool.stats()["evicted"] == 1
+    a.provider.disconnect.assert_not_awaited()
+    async with pool.client("https://b"):
+        pass
+    assert pool.stats()["created"] == 4  # b was evicted and recreated
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_idle_clients(mock_web3_class):
+    """Test clients unused for longer than the idle timeout are disconnected."""
+    pool = Web3ProviderPool(max_size=4, idle_timeout=0)
+
+    async with pool.client("https://a") as a:
+        pass
+    async with pool.client("https://b"):
+        pass
+
+    a.provider.disconnect.assert_awaited_once()
+    assert pool.stats()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_defers_disconnect_of_busy_client(mock_web3_class):
+    """Test an evicted client serving a request is closed only after it finishes."""
+    pool = Web3ProviderPool(max_size=1, idle_timeout=60)
+
+    async with pool.client("https://a") as a:
+        async with pool.client("https://b"):
+            pass
+        a.provider.disconnect.assert_not_awaited()
+
+    a.provider.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_plugin_shares_pool_and_closes_it(mock_web3_class):
+    """Test plugin tools share one pool that aclose disconnects."""
+    plugin = EvmRpcPlugin()
+    # The shared pool is still empty here, so it must not be mistaken for None
+    pools = {tool.provider_pool for tool in plugin.tools}
+    assert pools == {plugin.provider_pool}
+    assert plugin.head_tracker.provider_pool is plugin.provider_pool
+    endpoints = {tool.endpoints for tool in plugin.tools}
+    assert endpoints == {plugin.endpoints}
+    assert plugin.head_tracker.endpoints is plugin.endpoints
+
+    async with plugin.provider_pool.client("https://a") as a:
+        pass
+    await plugin.aclose()
+
+    a.provider.disconnect.assert_awaited_once()
+    assert len(plugin.provider_pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_exclusive_leases_do_not_share_clients(mock_web3_class):
+    """Test exclusive leases never share a client and are reused once released."""
+    pool = Web3ProviderPool(max_size=8, idle_timeout=60)
+
+    async with pool.client("https://a") as shared:
+        async with pool.client("https://a", exclusive=True) as first:
+            async with pool.client("https://a", exclusive=True) as second:
+                assert len({id(shared), id(first), id(second)}) == 3
+    async with pool.client("https://a", exclusive=True) as again:
+        pass
+
+    assert again is first
+    assert pool.stats()["created"] == 3
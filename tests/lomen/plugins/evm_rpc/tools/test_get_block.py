@@ -1,10 +1,11 @@
 """Tests for the GetBlock tool."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from web3.middleware import ExtraDataToPOAMiddleware
 
+from lomen.plugins.evm_rpc.block_cache import BlockCache
 from lomen.plugins.evm_rpc.tools.get_block import (
     GetBlock,
     GetBlockParams,
@@ -34,6 +35,14 @@ def test_get_block_init():
     assert tool.get_params() == GetBlockParams
 
 
+def make_async_web3():
+    """Build a mocked AsyncWeb3 instance with awaitable RPC methods."""
+    mock_web3 = MagicMock()
+    mock_web3.eth.get_block = AsyncMock()
+    mock_web3.provider.disconnect = AsyncMock()
+    return mock_web3
+
+
 @pytest.fixture
 def sample_block_data():
     """Sample block data for testing."""
@@ -60,15 +69,15 @@ def sample_block_data():
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_run_ethereum(mock_web3_class, sample_block_data):
     """Test running the GetBlock tool on Ethereum Mainnet."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.return_value = sample_block_data
 
@@ -90,14 +99,14 @@ async def test_get_block_run_ethereum(mock_web3_class, sample_block_data):
     assert result["extraData"] == sample_block_data["extraData"].hex()
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with(
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with(
         "https://ethereum-rpc.publicnode.com"
     )
-    mock_web3.eth.get_block.assert_called_once_with(17000000, full_transactions=True)
+    mock_web3.eth.get_block.assert_awaited_once_with(17000000, full_transactions=True)
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_run_base(mock_web3_class, sample_block_data):
     """Test running the GetBlock tool on Base."""
     # Modify sample data for Base
@@ -105,11 +114,11 @@ async def test_get_block_run_base(mock_web3_class, sample_block_data):
     base_block_data["number"] = 5230000
 
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.return_value = base_block_data
 
@@ -131,12 +140,14 @@ async def test_get_block_run_base(mock_web3_class, sample_block_data):
     assert result["parentHash"] == "0x0987654321fedcba"
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://mainnet.base.org")
-    mock_web3.eth.get_block.assert_called_once_with(5230000, full_transactions=False)
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with(
+        "https://mainnet.base.org"
+    )
+    mock_web3.eth.get_block.assert_awaited_once_with(5230000, full_transactions=False)
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_run_polygon(mock_web3_class, sample_block_data):
     """Test running the GetBlock tool on Polygon."""
     # Modify sample data for Polygon
@@ -144,11 +155,11 @@ async def test_get_block_run_polygon(mock_web3_class, sample_block_data):
     polygon_block_data["number"] = 50000000
 
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.return_value = polygon_block_data
 
@@ -170,14 +181,14 @@ async def test_get_block_run_polygon(mock_web3_class, sample_block_data):
     assert result["parentHash"] == "0x0987654321fedcba"
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://polygon-rpc.com")
-    mock_web3.eth.get_block.assert_called_once_with(50000000, full_transactions=False)
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with("https://polygon-rpc.com")
+    mock_web3.eth.get_block.assert_awaited_once_with(50000000, full_transactions=False)
     # Verify middleware was injected for PoA
     mock_web3.middleware_onion.inject.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_run_celo(mock_web3_class, sample_block_data):
     """Test running the GetBlock tool on Celo."""
     # Modify sample data for Celo
@@ -185,11 +196,11 @@ async def test_get_block_run_celo(mock_web3_class, sample_block_data):
     celo_block_data["number"] = 20920000
 
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.return_value = celo_block_data
 
@@ -211,14 +222,14 @@ async def test_get_block_run_celo(mock_web3_class, sample_block_data):
     assert result["parentHash"] == "0x0987654321fedcba"
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://forno.celo.org")
-    mock_web3.eth.get_block.assert_called_once_with(20920000, full_transactions=False)
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with("https://forno.celo.org")
+    mock_web3.eth.get_block.assert_awaited_once_with(20920000, full_transactions=False)
     # Verify middleware was injected for PoA
     mock_web3.middleware_onion.inject.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_run_optimism(mock_web3_class, sample_block_data):
     """Test running the GetBlock tool on Optimism."""
     # Modify sample data for Optimism
@@ -226,11 +237,11 @@ async def test_get_block_run_optimism(mock_web3_class, sample_block_data):
     optimism_block_data["number"] = 107000000
 
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.return_value = optimism_block_data
 
@@ -252,20 +263,22 @@ async def test_get_block_run_optimism(mock_web3_class, sample_block_data):
     assert result["parentHash"] == "0x0987654321fedcba"
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://mainnet.optimism.io")
-    mock_web3.eth.get_block.assert_called_once_with(107000000, full_transactions=True)
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with(
+        "https://mainnet.optimism.io"
+    )
+    mock_web3.eth.get_block.assert_awaited_once_with(107000000, full_transactions=True)
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_run_with_poa(mock_web3_class, sample_block_data):
     """Test running the GetBlock tool with POA chain."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.return_value = sample_block_data
 
@@ -288,19 +301,21 @@ async def test_get_block_run_with_poa(mock_web3_class, sample_block_data):
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
-async def test_get_block_with_byte_array_transactions(mock_web3_class, sample_block_data):
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
+async def test_get_block_with_byte_array_transactions(
+    mock_web3_class, sample_block_data
+):
     """Test running the GetBlock tool with byte array transactions."""
     # Create a modified sample data with byte array in the transactions list
     block_data_with_bytes = dict(sample_block_data)
     block_data_with_bytes["transactions"] = [b"\x12\x34", b"\x56\x78", "0x9abc"]
 
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.return_value = block_data_with_bytes
 
@@ -328,15 +343,15 @@ async def test_get_block_with_byte_array_transactions(mock_web3_class, sample_bl
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_run_with_exception(mock_web3_class):
     """Test running the GetBlock tool with an exception."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
     mock_web3.eth.get_block.side_effect = Exception("Block not found")
 
@@ -354,3 +369,82 @@ async def test_get_block_run_with_exception(mock_web3_class):
         )
     assert "Failed to get block" in str(excinfo.value)
     assert "Block not found" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
+async def test_get_block_reuses_pooled_client(mock_web3_class, sample_block_data):
+    """Test repeated calls reuse one client and inject the POA middleware once."""
+    mock_web3 = make_async_web3()
+    mock_web3_class.return_value = mock_web3
+    mock_web3.eth.get_block.return_value = sample_block_data
+
+    tool = GetBlock()
+    for block_number in (1, 2, 3):
+        await tool.arun(
+            rpc_url="https://polygon-rpc.com",
+            chain_id=137,
+            block_number=block_number,
+            is_poa=True,
+        )
+
+    mock_web3_class.assert_called_once()
+    mock_web3.middleware_onion.inject.assert_called_once_with(
+        ExtraDataToPOAMiddleware, layer=0
+    )
+    assert mock_web3.eth.get_block.await_count == 3
+    mock_web3.provider.disconnect.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
+async def test_get_block_serves_finalized_blocks_from_cache(
+    mock_web3_class, sample_block_data
+):
+    """Test finalized blocks are fetched once and recent ones are refetched."""
+    mock_web3 = make_async_web3()
+    mock_web3_class.return_value = mock_web3
+
+    async def get_block(block_identifier, full_transactions=False):
+        if block_identifier == "finalized":
+            return {"number": 16000000}
+        return dict(sample_block_data, number=block_identifier)
+
+    mock_web3.eth.get_block.side_effect = get_block
+    tool = GetBlock(block_cache=BlockCache(maxsize=10, recent_ttl=0))
+
+    for _ in range(3):
+        old = await tool.arun(chain_id=1, block_number=15000000)
+    for _ in range(2):
+        await tool.arun(chain_id=1, block_number=17000000)
+
+    assert old["number"] == 15000000
+    assert old["extraData"] == sample_block_data["extraData"].hex()
+    fetched = [call.args[0] for call in mock_web3.eth.get_block.await_args_list]
+    # The finalized height is looked up once, then trusted for a while
+    assert fetched == [15000000, "finalized", 17000000, 17000000]
+
+
+@pytest.mark.asyncio
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
+async def test_get_block_bypasses_cache_for_explicit_rpc_url(
+    mock_web3_class, sample_block_data
+):
+    """Test blocks from an explicit endpoint do not touch the shared cache."""
+    mock_web3 = make_async_web3()
+    mock_web3_class.return_value = mock_web3
+    mock_web3.eth.get_block.return_value = sample_block_data
+    block_cache = BlockCache(maxsize=10, recent_ttl=60)
+    tool = GetBlock(block_cache=block_cache)
+
+    for _ in range(2):
+        await tool.arun(
+            rpc_url="https://other-node.example",
+            chain_id=1,
+            block_number=15000000,
+        )
+
+    fetched = [call.args[0] for call in mock_web3.eth.get_block.await_args_list]
+    assert fetched == [15000000, 15000000]
+    assert len(block_cache) == 0
+    assert block_cache.finalized_height(1) is None
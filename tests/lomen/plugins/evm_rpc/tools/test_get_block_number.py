@@ -1,6 +1,6 @@
 """Tests for the GetBlockNumber tool."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -27,18 +27,30 @@ def test_get_block_number_init():
     assert tool.get_params() == GetBlockNumberParams
 
 
+async def awaitable(value):
+    """Stand-in for AsyncWeb3 properties, which return coroutines."""
+    return value
+
+
+def make_async_web3():
+    """Build a mocked AsyncWeb3 instance whose provider can be disconnected."""
+    mock_web3 = MagicMock()
+    mock_web3.provider.disconnect = AsyncMock()
+    return mock_web3
+
+
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block_number.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_number_run_ethereum(mock_web3_class):
     """Test running the GetBlockNumber tool on Ethereum Mainnet."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
-    mock_web3.eth.block_number = 17000000
+    mock_web3.eth.block_number = awaitable(17000000)
 
     # Create the tool
     tool = GetBlockNumber()
@@ -53,24 +65,24 @@ async def test_get_block_number_run_ethereum(mock_web3_class):
     assert result["block_number"] == 17000000
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with(
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with(
         "https://ethereum-rpc.publicnode.com"
     )
     mock_web3_class.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block_number.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_number_run_base(mock_web3_class):
     """Test running the GetBlockNumber tool on Base."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
-    mock_web3.eth.block_number = 5230000
+    mock_web3.eth.block_number = awaitable(5230000)
 
     # Create the tool
     tool = GetBlockNumber()
@@ -85,22 +97,24 @@ async def test_get_block_number_run_base(mock_web3_class):
     assert result["block_number"] == 5230000
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://mainnet.base.org")
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with(
+        "https://mainnet.base.org"
+    )
     mock_web3_class.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block_number.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_number_run_polygon(mock_web3_class):
     """Test running the GetBlockNumber tool on Polygon."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
-    mock_web3.eth.block_number = 50000000
+    mock_web3.eth.block_number = awaitable(50000000)
 
     # Create the tool
     tool = GetBlockNumber()
@@ -115,22 +129,22 @@ async def test_get_block_number_run_polygon(mock_web3_class):
     assert result["block_number"] == 50000000
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://polygon-rpc.com")
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with("https://polygon-rpc.com")
     mock_web3_class.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block_number.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_number_run_celo(mock_web3_class):
     """Test running the GetBlockNumber tool on Celo."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
-    mock_web3.eth.block_number = 20920000
+    mock_web3.eth.block_number = awaitable(20920000)
 
     # Create the tool
     tool = GetBlockNumber()
@@ -145,22 +159,22 @@ async def test_get_block_number_run_celo(mock_web3_class):
     assert result["block_number"] == 20920000
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://forno.celo.org")
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with("https://forno.celo.org")
     mock_web3_class.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("lomen.plugins.evm_rpc.tools.get_block_number.Web3", autospec=True)
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
 async def test_get_block_number_run_optimism(mock_web3_class):
     """Test running the GetBlockNumber tool on Optimism."""
     # Create mock instances
-    mock_web3 = MagicMock()
+    mock_web3 = make_async_web3()
     mock_provider = MagicMock()
 
     # Set up the mock hierarchy
-    mock_web3_class.HTTPProvider.return_value = mock_provider
+    mock_web3_class.AsyncHTTPProvider.return_value = mock_provider
     mock_web3_class.return_value = mock_web3
-    mock_web3.eth.block_number = 107000000
+    mock_web3.eth.block_number = awaitable(107000000)
 
     # Create the tool
     tool = GetBlockNumber()
@@ -175,7 +189,9 @@ async def test_get_block_number_run_optimism(mock_web3_class):
     assert result["block_number"] == 107000000
 
     # Verify the Web3 instance was created correctly
-    mock_web3_class.HTTPProvider.assert_called_once_with("https://mainnet.optimism.io")
+    mock_web3_class.AsyncHTTPProvider.assert_called_once_with(
+        "https://mainnet.optimism.io"
+    )
     mock_web3_class.assert_called_once()
 
 
@@ -183,7 +199,7 @@ async def test_get_block_number_run_optimism(mock_web3_class):
 async def test_get_block_number_run_with_exception():
     """Test running the GetBlockNumber tool with an exception."""
     # Create a patched version of Web3 that will raise an exception
-    with patch("lomen.plugins.evm_rpc.tools.get_block_number.Web3") as mock_web3_class:
+    with patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3") as mock_web3_class:
         # When Web3 is instantiated, it should raise an exception
         mock_web3_class.side_effect = Exception("Connection error")
 
@@ -200,3 +216,44 @@ async def test_get_block_number_run_with_exception():
         # Check the exception message
         assert "Failed to get block number" in str(excinfo.value)
         assert "Connection error" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_get_block_number_uses_head_tracker():
+    """Test the tool reads from the shared head tracker when one is given."""
+    head_tracker = MagicMock()
+    head_tracker.get_block_number = AsyncMock(return_value=17000000)
+    tool = GetBlockNumber(head_tracker=head_tracker)
+
+    result = await tool.arun(rpc_url="https://ethereum-rpc.publicnode.com", chain_id=1)
+
+    assert result == {"block_number": 17000000}
+    head_tracker.get_block_number.assert_awaited_once_with(
+        ["https://ethereum-rpc.publicnode.com"], 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_block_number_defaults_to_known_rpc_url():
+    """Test the chain's RPC URLs are looked up when none is given."""
+    head_tracker = MagicMock()
+    head_tracker.get_block_number = AsyncMock(return_value=17000000)
+    tool = GetBlockNumber(head_tracker=head_tracker)
+
+    await tool.arun(chain_id=1)
+
+    rpc_urls, chain_id = head_tracker.get_block_number.await_args.args
+    assert rpc_urls[0] == "https://ethereum-rpc.publicnode.com"
+    assert len(rpc_urls) > 1
+    assert chain_id == 1
+
+
+@pytest.mark.asyncio
+async def test_get_block_number_unknown_chain_requires_rpc_url():
+    """Test a chain without known metadata needs an explicit RPC URL."""
+    tool = GetBlockNumber(head_tracker=MagicMock())
+
+    with pytest.raises(Exception) as excinfo:
+        await tool.arun(chain_id=999999)
+
+    assert "No RPC URL known for chain ID 999999" in str(excinfo.value)
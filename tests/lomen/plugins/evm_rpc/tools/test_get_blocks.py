@@ -0,0 +1,143 @@
+"""Tests for the GetBlocks tool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lomen.plugins.evm_rpc.tools.get_blocks import (
+    MAX_BLOCK_RANGE,
+    GetBlocks,
+    GetBlocksParams,
+)
+
+
+def make_batching_web3(batch_sizes, fail_on=None):
+    """Build a mocked AsyncWeb3 whose batches return one block per queued call."""
+    mock_web3 = MagicMock()
+    mock_web3.provider.disconnect = AsyncMock()
+    mock_web3.eth.get_block.side_effect = lambda number, full_transactions: number
+
+    def batch_requests():
+        queued = []
+        batch = MagicMock()
+        batch.add.side_effect = queued.append
+
+        async def async_execute():
+            batch_sizes.append(len(queued))
+            await asyncio.sleep(0)
+            if fail_on is not None and fail_on in queued:
+                raise Exception(f"block {fail_on} unavailable")
+            return [
+                {"number": number, "hash": bytes([number % 256])} for number in queued
+            ]
+
+        batch.async_execute = async_execute
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=batch)
+        ctx.__aexit__ = AsyncMock(return_value=None)
+        return ctx
+
+    mock_web3.batch_requests.side_effect = batch_requests
+    return mock_web3
+
+
+def test_get_blocks_params():
+    """Test the parameters for the GetBlocks tool."""
+    params = GetBlocksParams(
+        rpc_url="https://ethereum-rpc.publicnode.com",
+        chain_id=1,
+        start_block=100,
+        end_block=200,
+    )
+    assert params.start_block == 100
+    assert params.end_block == 200
+    assert params.full_transactions is False
+    assert params.chunk_size is None
+
+
+def test_get_blocks_init():
+    """Test initializing the GetBlocks tool."""
+    tool = GetBlocks(chunk_size=10, max_concurrency=2)
+    assert tool.name == "get_blocks"
+    assert tool.get_params() == GetBlocksParams
+    assert tool.chunk_size == 10
+    assert tool.max_concurrency == 2
+
+
+@pytest.mark.asyncio
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
+async def test_get_blocks_batches_range_in_order(mock_web3_class):
+    """Test a range is fetched in chunks and returned in block order."""
+    batch_sizes = []
+    mock_web3_class.side_effect = lambda *args, **kwargs: make_batching_web3(
+        batch_sizes
+    )
+    tool = GetBlocks(chunk_size=4, max_concurrency=2)
+
+    result = await tool.arun(
+        rpc_url="https://ethereum-rpc.publicnode.com",
+        chain_id=1,
+        start_block=10,
+        end_block=19,
+    )
+
+    assert [block["number"] for block in result["blocks"]] == list(range(10, 20))
+    assert result["blocks"][0]["hash"] == bytes([10]).hex()
+    assert sorted(batch_sizes) == [2, 4, 4]
+    # At most two batches in flight, each on its own exclusively leased client
+    assert mock_web3_class.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
+async def test_get_blocks_chunk_size_override(mock_web3_class):
+    """Test the per-call chunk size overrides the tool default."""
+    batch_sizes = []
+    mock_web3_class.side_effect = lambda *args, **kwargs: make_batching_web3(
+        batch_sizes
+    )
+    tool = GetBlocks(chunk_size=4, max_concurrency=1)
+
+    await tool.arun(
+        rpc_url="https://ethereum-rpc.publicnode.com",
+        chain_id=1,
+        start_block=0,
+        end_block=9,
+        chunk_size=10,
+    )
+
+    assert batch_sizes == [10]
+
+
+@pytest.mark.asyncio
+async def test_get_blocks_invalid_range():
+    """Test reversed and oversized ranges are rejected."""
+    tool = GetBlocks()
+
+    with pytest.raises(ValueError):
+        await tool.arun(rpc_url="https://x", chain_id=1, start_block=5, end_block=4)
+    with pytest.raises(ValueError):
+        await tool.arun(
+            rpc_url="https://x", chain_id=1, start_block=0, end_block=MAX_BLOCK_RANGE
+        )
+
+
+@pytest.mark.asyncio
+@patch("lomen.plugins.evm_rpc.provider_pool.AsyncWeb3", autospec=True)
+async def test_get_blocks_run_with_exception(mock_web3_class):
+    """Test a failing batch fails the whole call."""
+    mock_web3_class.side_effect = lambda *args, **kwargs: make_batching_web3(
+        [], fail_on=7
+    )
+    tool = GetBlocks(chunk_size=5)
+
+    with pytest.raises(Exception) as excinfo:
+        await tool.arun(
+            rpc_url="https://ethereum-rpc.publicnode.com",
+            chain_id=1,
+            start_block=0,
+            end_block=9,
+        )
+    assert "Failed to get blocks" in str(excinfo.value)
+    assert "block 7 unavailable" in str(excinfo.value)
@@ -0,0 +1,117 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lomen.plugins.oneinch.cache import TTLCache, default_cache_ttls
+from lomen.plugins.oneinch.client import OneInchClient
+from lomen.plugins.oneinch.tools.get_portfolio import GetPortfolio
+
+
+def test_ttl_cache_hit_and_miss():
+    """Test that stored values are returned and counted as hits."""
+    cache = TTLCache(maxsize=2)
+
+    assert cache.get("a") is None
+    cache.set("a", 1, ttl=60)
+
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_ttl_cache_expiry(mocker):
+    """Test that entries expire after their TTL."""
+    now = mocker.patch("lomen.plugins.oneinch.cache.time.monotonic", return_value=100.0)
+    cache = TTLCache()
+    cache.set("a", 1, ttl=10)
+
+    now.return_value = 109.0
+    assert cache.get("a") == 1
+    now.return_value = 111.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_ttl_cache_lru_eviction():
+    """Test that the least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_default_cache_ttls(monkeypatch):
+    """Test TTL resolution from defaults, environment and overrides."""
+    monkeypatch.setenv("ONEINCH_CACHE_TTL_NFTS", "5")
+
+    ttls = default_cache_ttls({"pnl": 1})
+
+    assert ttls["balances"] == 30
+    assert ttls["nfts"] == 5
+    assert ttls["pnl"] == 1
+
+
+@pytest.fixture
+def client(mocker):
+    client = OneInchClient("test-api-key")
+    mocker.patch.object(client, "_get", new_callable=AsyncMock, return_value={"n": 1})
+    return client
+
+
+@pytest.mark.asyncio
+async def test_client_serves_cacheable_endpoint_from_cache(client):
+    """Test that a second call for a cached endpoint skips the upstream request."""
+    path = "/portfolio/v3/1/balances/0xabc"
+
+    first = await client.get(path, cache_endpoint="balances")
+    second = await client.get(path, cache_endpoint="balances")
+
+    assert first == second == {"n": 1}
+    assert client._get.await_count == 1
+    assert client.cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_does_not_cache_without_endpoint(client):
+    """Test that requests without a cache endpoint always go upstream."""
+    await client.get("/token/v1.2/1/search", params={"query": "USDC"})
+    await client.get("/token/v1.2/1/search", params={"query": "USDC"})
+
+    assert client._get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_client_refresh_and_bypass(client):
+    """Test that refresh refetches and stores, while bypass never touches the cache."""
+    path = "/portfolio/v3/1/pnl/0xabc"
+    await client.get(path, cache_endpoint="pnl")
+
+    client._get.return_value = {"n": 2}
+    assert await client.get(path, cache_endpoint="pnl", refresh_cache=True) == {"n": 2}
+    assert await client.get(path, cache_endpoint="pnl") == {"n": 2}
+
+    client._get.return_value = {"n": 3}
+    assert await client.get(path, cache_endpoint="pnl", bypass_cache=True) == {"n": 3}
+    assert await client.get(path, cache_endpoint="pnl") == {"n": 2}
+    assert client._get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_portfolio_tool_uses_cache(client):
+    """Test that repeated portfolio questions about one wallet cost one round trip."""
+    client._get.return_value = {"balances": []}
+    tool = GetPortfolio(api_key="test-api-key", client=client)
+
+    await tool.arun(address="0xabc", chain_id=1)
+    await tool.arun(address="0xABC", chain_id=1)
+
+    assert client._get.await_count == 1
@@ -0,0 +1,190 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from lomen.plugins.oneinch.client import (
+    OneInchAPIError,
+    OneInchClient,
+    parse_retry_after,
+)
+
+DUMMY_API_KEY = "test-api-key"
+
+
+def make_response(status, json_data=None, text="", headers=None):
+    """Build a mocked aiohttp response usable as an async context manager."""
+    mock_resp = AsyncMock()
+    mock_resp.status = status
+    mock_resp.json = AsyncMock(return_value=json_data)
+    mock_resp.text = AsyncMock(return_value=text)
+    mock_resp.headers = headers or {}
+    mock_ctx = MagicMock()
+    mock_ctx.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_ctx.__aexit__ = AsyncMock(return_value=None)
+    return mock_ctx
+
+
+@pytest.fixture
+def client():
+    return OneInchClient(DUMMY_API_KEY, max_retries=2)
+
+
+@pytest.fixture
+def mock_sleep(mocker):
+    return mocker.patch(
+        "lomen.plugins.oneinch.client.asyncio.sleep", new_callable=AsyncMock
+    )
+
+
+def test_parse_retry_after():
+    """Test parsing of seconds and HTTP-date Retry-After values."""
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("0.5") == 0.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_get_success(client, mocker):
+    """Test a successful request sends the bearer token and returns JSON."""
+    mock_get = mocker.patch(
+        "aiohttp.ClientSession.get", return_value=make_response(200, {"ok": True})
+    )
+
+    result = await client.get("/portfolio/v3/1/balances/0xabc", params={"a": 1})
+
+    assert result == {"ok": True}
+    args, kwargs = mock_get.call_args
+    assert args[0] == "https://api.1inch.dev/portfolio/v3/1/balances/0xabc"
+    assert kwargs["headers"]["Authorization"] == f"Bearer {DUMMY_API_KEY}"
+    assert kwargs["params"] == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_retries_rate_limit_with_retry_after(client, mocker, mock_sleep):
+    """Test that a 429 is retried after the server-provided Retry-After delay."""
+    mock_get = mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[
+            make_response(429, text="Too Many Requests", headers={"Retry-After": "1"}),
+            make_response(200, {"ok": True}),
+        ],
+    )
+
+    result = await client.get("/token/v1.2/1/search")
+
+    assert result == {"ok": True}
+    assert mock_get.call_count == 2
+    mock_sleep.assert_awaited_once_with(1.0)
+
+
+@pytest.mark.asyncio
+async def test_get_retries_server_error_with_backoff(client, mocker, mock_sleep):
+    """Test that 5xx responses are retried with jittered exponential backoff."""
+    mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[
+            make_response(502, text="Bad Gateway"),
+            make_response(503, text="Unavailable"),
+            make_response(200, [1, 2]),
+        ],
+    )
+
+    result = await client.get("/portfolio/v3/1/pnl/0xabc")
+
+    assert result == [1, 2]
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert 0.15 <= delays[0] <= 0.3
+    assert 0.3 <= delays[1] <= 0.6
+
+
+@pytest.mark.asyncio
+async def test_get_gives_up_after_max_retries(client, mocker, mock_sleep):
+    """Test that the last error is raised once retries are exhausted."""
+    mock_get = mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=lambda *a, **kw: make_response(500, text="Internal Server Error"),
+    )
+
+    with pytest.raises(OneInchAPIError) as excinfo:
+        await client.get("/portfolio/v3/1/balances/0xabc")
+
+    assert excinfo.value.status == 500
+    assert "1inch API error (Status 500): Internal Server Error" in str(excinfo.value)
+    assert mock_get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_does_not_wait_for_long_retry_after(client, mocker, mock_sleep):
+    """Test that a Retry-After beyond the configured maximum fails immediately."""
+    mocker.patch(
+        "aiohttp.ClientSession.get",
+        return_value=make_response(
+            429, text="slow down", headers={"Retry-After": "600"}
+        ),
+    )
+
+    with pytest.raises(OneInchAPIError):
+        await client.get("/portfolio/v3/1/balances/0xabc")
+
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_retries_network_errors(client, mocker, mock_sleep):
+    """Test that connection errors are retried and finally re-raised."""
+    mock_get = mocker.patch(
+        "aiohttp.ClientSession.get", side_effect=aiohttp.ClientConnectionError("boom")
+    )
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await client.get("/portfolio/v3/1/balances/0xabc")
+
+    assert mock_get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_maps_client_errors(client, mocker, mock_sleep):
+    """Test that 401 and 400 are mapped without retrying."""
+    mock_get = mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[
+            make_response(401),
+            make_response(400, text='{"description": "bad address"}'),
+        ],
+    )
+
+    with pytest.raises(PermissionError):
+        await client.get("/portfolio/v3/1/balances/0xabc")
+    with pytest.raises(ValueError) as excinfo:
+        await client.get("/portfolio/v3/1/balances/0xabc")
+
+    assert "1inch API error: bad address" in str(excinfo.value)
+    assert mock_get.call_count == 2
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fetch_conditional_request(client, mocker):
+    """Test fetch sends extra headers, returns headers and accepts 304."""
+    mock_get = mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[
+            make_response(200, {"0xabc": {}}, headers={"ETag": '"v1"'}),
+            make_response(304, headers={"ETag": '"v1"'}),
+        ],
+    )
+
+    first = await client.fetch("/token/v1.2/1")
+    second = await client.fetch("/token/v1.2/1", headers={"If-None-Match": '"v1"'})
+
+    assert first.status == 200
+    assert first.data == {"0xabc": {}}
+    assert first.headers["ETag"] == '"v1"'
+    assert second.status == 304
+    assert second.data is None
+    _, kwargs = mock_get.call_args
+    assert kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert kwargs["headers"]["Authorization"] == f"Bearer {DUMMY_API_KEY}"
@@ -2,17 +2,17 @@ import pytest
 
 from lomen.plugins.oneinch import OneInchPlugin
 from lomen.plugins.oneinch.tools.get_address_from_domain import GetAddressFromDomain
-from lomen.plugins.oneinch.tools.get_token_info import (
-    GetTokenInfoBySymbol,
-    GetTokenInfoByAddress,
-)
+from lomen.plugins.oneinch.tools.get_nfts import GetNFTsForAddress
 from lomen.plugins.oneinch.tools.get_portfolio import (
     GetPortfolio,
     GetPortfolioAllChains,
 )
 from lomen.plugins.oneinch.tools.get_profit_and_loss import GetProfitAndLoss
 from lomen.plugins.oneinch.tools.get_protocol_investments import GetProtocolInvestments
-from lomen.plugins.oneinch.tools.get_nfts import GetNFTsForAddress
+from lomen.plugins.oneinch.tools.get_token_info import (
+    GetTokenInfoByAddress,
+    GetTokenInfoBySymbol,
+)
 
 # Dummy API Key for testing plugin initialization
 DUMMY_API_KEY = "test-plugin-api-key"
@@ -65,3 +65,30 @@ def test_plugin_tools_property():
         assert isinstance(tool_instance, expected_type)
         assert hasattr(tool_instance, "api_key")
         assert tool_instance.api_key == DUMMY_API_KEY
+
+
+def test_plugin_tools_share_connection_pool():
+    """Test that all tools use the plugin's single connection pool."""
+    plugin = OneInchPlugin(api_key=DUMMY_API_KEY, connection_limit=10)
+
+    assert plugin.client.session.connection_limit == 10
+    for tool_instance in plugin.tools:
+        assert tool_instance.client is plugin.client
+
+
+def test_plugin_tools_are_created_once():
+    """Test repeated tools accesses return the same instances."""
+    plugin = OneInchPlugin(api_key=DUMMY_API_KEY)
+
+    tools = plugin.tools
+
+    assert plugin.tools is tools
+    assert [id(tool) for tool in plugin.tools] == [id(tool) for tool in tools]
+
+
+def test_all_chains_tool_reuses_plugin_portfolio_tool():
+    """Test get_portfolio_all_chains queries chains through the plugin's tool."""
+    plugin = OneInchPlugin(api_key=DUMMY_API_KEY)
+    tools = {tool.name: tool for tool in plugin.tools}
+
+    assert tools["get_portfolio_all_chains"].portfolio_tool is tools["get_portfolio"]
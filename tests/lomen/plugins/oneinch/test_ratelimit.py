@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+
+from lomen.plugins.oneinch.client import OneInchClient
+from lomen.plugins.oneinch.ratelimit import (
+    TokenBucket,
+    configure_rate_limiter,
+    get_rate_limiter,
+    rate_limiter_stats,
+)
+
+
+def test_token_bucket_rejects_invalid_config():
+    """Test that non-positive rates and bursts are rejected."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_without_waiting():
+    """Test that up to `burst` requests go through immediately."""
+    bucket = TokenBucket(rate=1, burst=5)
+
+    waits = [await bucket.acquire() for _ in range(5)]
+
+    assert max(waits) < 0.05
+    stats = bucket.stats()
+    assert stats["acquired"] == 5
+    assert stats["throttled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests_beyond_burst():
+    """Test that requests beyond the burst are spread out at `rate` per second."""
+    bucket = TokenBucket(rate=50, burst=2)
+
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(7)))
+    elapsed = time.monotonic() - start
+
+    # 5 requests over the burst at 50/s need roughly 100 ms
+    assert elapsed >= 0.09
+    stats = bucket.stats()
+    assert stats["acquired"] == 7
+    assert stats["throttled"] == 5
+    assert stats["waiting"] == 0
+    assert stats["max_wait_seconds"] >= 0.09
+    assert stats["total_wait_seconds"] > 0
+
+
+def test_get_rate_limiter_is_shared_per_api_key():
+    """Test that clients with the same key share one bucket."""
+    first = OneInchClient("shared-key", rate_limit=3, rate_limit_burst=4)
+    second = OneInchClient("shared-key")
+    other = OneInchClient("other-key")
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is not other.rate_limiter
+    assert first.rate_limiter.rate == 3
+    assert first.rate_limiter.burst == 4
+    assert "shared-key" not in rate_limiter_stats()
+
+
+def test_get_rate_limiter_does_not_reconfigure():
+    """Test that only configure_rate_limiter changes an existing bucket."""
+    bucket = get_rate_limiter("configured-key", rate=3, burst=4)
+
+    assert get_rate_limiter("configured-key", rate=5, burst=6) is bucket
+    assert (bucket.rate, bucket.burst) == (3, 4)
+
+    assert configure_rate_limiter("configured-key", rate=5, burst=6) is bucket
+    assert (bucket.rate, bucket.burst) == (5, 6)
+    assert configure_rate_limiter("configured-key", rate=0) is None
+    assert bucket.rate == 5
+
+
+def test_get_rate_limiter_disabled(monkeypatch):
+    """Test that a rate of 0 disables client-side limiting."""
+    monkeypatch.setenv("ONEINCH_RATE_LIMIT_RPS", "0")
+
+    assert get_rate_limiter("unlimited-key") is None
+    assert OneInchClient("unlimited-key").rate_limiter is None
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from lomen.plugins.oneinch.session import OneInchSession
+
+
+def test_session_configuration_from_env(monkeypatch):
+    """Test that pool limits fall back to environment variables."""
+    monkeypatch.setenv("ONEINCH_CONNECTION_LIMIT", "7")
+    monkeypatch.setenv("ONEINCH_DNS_CACHE_TTL", "42")
+
+    session = OneInchSession()
+
+    assert session.connection_limit == 7
+    assert session.dns_cache_ttl == 42
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_and_closed():
+    """Test that the pooled session is created once and closed by aclose."""
+    pool = OneInchSession(connection_limit=5, dns_cache_ttl=60)
+    assert pool.closed
+
+    first = pool.get()
+    second = pool.get()
+
+    assert first is second
+    assert first.connector.limit == 5
+
+    await pool.aclose()
+
+    assert first.closed
+    assert pool.closed
+
+
+@pytest.mark.asyncio
+async def test_session_recreated_after_close():
+    """Test that a closed pool transparently opens a new session."""
+    pool = OneInchSession()
+    first = pool.get()
+    await pool.aclose()
+
+    second = pool.get()
+
+    assert second is not first
+    assert not second.closed
+    await pool.aclose()
+
+
+def test_session_of_previous_loop_is_closed():
+    """Test that switching event loops closes the session of the old loop."""
+    pool = OneInchSession()
+
+    async def get():
+        return pool.get()
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert second is not first
+    assert first.closed
+    assert not second.closed
+
+    asyncio.run(pool.aclose())
+    assert second.closed
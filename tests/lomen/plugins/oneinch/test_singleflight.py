@@ -0,0 +1,106 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lomen.plugins.oneinch.client import OneInchClient, request_key
+from lomen.plugins.oneinch.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Test that concurrent calls with the same key run the work once."""
+    singleflight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(*(singleflight.do("key", work) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == {"value": 1} for result in results)
+    assert singleflight.stats() == {"started": 1, "shared": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_coalesced():
+    """Test that a finished call is not reused (no staleness)."""
+    singleflight = SingleFlight()
+    work = AsyncMock(side_effect=[1, 2])
+
+    assert await singleflight.do("key", work) == 1
+    assert await singleflight.do("key", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_and_forgotten():
+    """Test that all waiters see the error and the key is released afterwards."""
+    singleflight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream failed")
+
+    results = await asyncio.gather(
+        singleflight.do("key", fail),
+        singleflight.do("key", fail),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert singleflight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    """Test that cancelling one waiter leaves the shared call running for others."""
+    singleflight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(singleflight.do("key", work))
+    second = asyncio.ensure_future(singleflight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+
+
+def test_request_key_is_canonical():
+    """Test that address case and parameter order do not affect the key."""
+    assert request_key("/portfolio/v3/1/balances/0xABC") == request_key(
+        "/portfolio/v3/1/balances/0xabc"
+    )
+    assert request_key("/search", {"a": 1, "b": "x"}) == request_key(
+        "/search", {"b": "x", "a": 1}
+    )
+    assert request_key("/portfolio/v3/1/balances/0xabc") != request_key(
+        "/portfolio/v3/137/balances/0xabc"
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_coalesces_identical_requests(mocker):
+    """Test that the client sends one upstream request for duplicate calls."""
+    client = OneInchClient("test-api-key")
+
+    async def slow_get(path, params):
+        await asyncio.sleep(0.01)
+        return {"path": path}
+
+    mock_get = mocker.patch.object(client, "_get", side_effect=slow_get)
+
+    results = await asyncio.gather(
+        client.get("/portfolio/v3/1/balances/0xAbC"),
+        client.get("/portfolio/v3/1/balances/0xabc"),
+        client.get("/portfolio/v3/137/balances/0xabc"),
+    )
+
+    assert mock_get.call_count == 2
+    assert results[0] is results[1]
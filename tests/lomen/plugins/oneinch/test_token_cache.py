@@ -0,0 +1,65 @@
+import json
+import os
+
+from lomen.plugins.oneinch.token_cache import TokenSymbolIndex, token_file_path
+
+USDC = {"address": "0xa0b8", "symbol": "USDC", "decimals": 6}
+WETH = {"address": "0xc02a", "symbol": "WETH", "decimals": 18}
+
+
+def write_tokens(directory, chain_id, tokens, mtime=None):
+    path = token_file_path(chain_id, str(directory))
+    with open(path, "w") as f:
+        json.dump({token["address"]: token for token in tokens}, f)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_lookup_is_case_insensitive(tmp_path):
+    """Test that symbols resolve regardless of case."""
+    write_tokens(tmp_path, 1, [USDC, WETH])
+    index = TokenSymbolIndex(str(tmp_path))
+
+    assert index.lookup("usdc", 1) == USDC
+    assert index.lookup("WeTh", 1) == WETH
+    assert index.lookup("DAI", 1) is None
+
+
+def test_missing_chain_file(tmp_path):
+    """Test that chains without a token list return no match."""
+    index = TokenSymbolIndex(str(tmp_path))
+
+    assert index.lookup("USDC", 137) is None
+
+
+def test_index_is_built_once(tmp_path, mocker):
+    """Test that repeated lookups do not re-read the file."""
+    write_tokens(tmp_path, 1, [USDC])
+    index = TokenSymbolIndex(str(tmp_path))
+    load = mocker.spy(index, "_load")
+
+    for _ in range(5):
+        index.lookup("USDC", 1)
+
+    assert load.call_count == 1
+
+
+def test_index_reloads_when_file_changes(tmp_path):
+    """Test that a rewritten token list is picked up via its mtime."""
+    write_tokens(tmp_path, 1, [USDC], mtime=1_000_000)
+    index = TokenSymbolIndex(str(tmp_path))
+    assert index.lookup("WETH", 1) is None
+
+    write_tokens(tmp_path, 1, [USDC, WETH], mtime=2_000_000)
+
+    assert index.lookup("WETH", 1) == WETH
+
+
+def test_invalid_file_is_ignored(tmp_path):
+    """Test that a corrupt token list falls back to no match."""
+    with open(token_file_path(1, str(tmp_path)), "w") as f:
+        f.write("{not json")
+    index = TokenSymbolIndex(str(tmp_path))
+
+    assert index.lookup("USDC", 1) is None
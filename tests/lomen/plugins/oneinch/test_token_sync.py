@@ -0,0 +1,100 @@
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lomen.plugins.oneinch.client import OneInchAPIError, OneInchResponse
+from lomen.plugins.oneinch.token_sync import (
+    meta_file_path,
+    sync_chain,
+    sync_tokens,
+    write_json_atomic,
+)
+
+TOKENS = {
+    "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48": {"symbol": "USDC", "decimals": 6},
+}
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.fetch = AsyncMock()
+    return client
+
+
+def test_write_json_atomic(tmp_path):
+    """Test the file is fully written and no temporary files are left behind."""
+    path = tmp_path / "nested" / "1.json"
+
+    write_json_atomic(str(path), TOKENS)
+
+    assert json.loads(path.read_text()) == TOKENS
+    assert os.listdir(path.parent) == ["1.json"]
+
+
+@pytest.mark.asyncio
+async def test_sync_chain_downloads_and_stores_validators(client, tmp_path):
+    """Test a first sync writes the list and its ETag / Last-Modified."""
+    client.fetch.return_value = OneInchResponse(
+        200, TOKENS, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    )
+
+    result = await sync_chain(client, 1, directory=str(tmp_path))
+
+    assert result == {"chain_id": 1, "status": "updated", "tokens": 1}
+    client.fetch.assert_awaited_once_with("/token/v1.2/1", headers={})
+    assert json.loads((tmp_path / "1.json").read_text()) == TOKENS
+    meta = json.loads((tmp_path / "1.meta.json").read_text())
+    assert meta == {"etag": '"v1"', "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+
+@pytest.mark.asyncio
+async def test_sync_chain_conditional_refresh(client, tmp_path):
+    """Test a refresh sends the stored validators and keeps the file on 304."""
+    write_json_atomic(str(tmp_path / "1.json"), TOKENS)
+    write_json_atomic(meta_file_path(1, str(tmp_path)), {"etag": '"v1"'})
+    client.fetch.return_value = OneInchResponse(304, None, {})
+
+    result = await sync_chain(client, 1, directory=str(tmp_path))
+
+    assert result == {"chain_id": 1, "status": "unchanged"}
+    client.fetch.assert_awaited_once_with(
+        "/token/v1.2/1", headers={"If-None-Match": '"v1"'}
+    )
+    assert json.loads((tmp_path / "1.json").read_text()) == TOKENS
+
+
+@pytest.mark.asyncio
+async def test_sync_chain_force_and_missing_file_skip_validators(client, tmp_path):
+    """Test validators are not sent when forced or when the list is missing."""
+    write_json_atomic(meta_file_path(1, str(tmp_path)), {"etag": '"v1"'})
+    client.fetch.return_value = OneInchResponse(200, TOKENS, {})
+
+    await sync_chain(client, 1, directory=str(tmp_path))
+    await sync_chain(client, 1, directory=str(tmp_path), force=True)
+
+    for call in client.fetch.await_args_list:
+        assert call.kwargs["headers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_sync_tokens_reports_per_chain_errors(client, tmp_path):
+    """Test one failing chain does not prevent the others from syncing."""
+
+    async def fetch(path, headers=None):
+        if path == "/token/v1.2/56":
+            raise OneInchAPIError(500, "upstream down")
+        return OneInchResponse(200, TOKENS, {})
+
+    client.fetch.side_effect = fetch
+
+    results = await sync_tokens(client, chain_ids=[1, 56], directory=str(tmp_path))
+
+    assert [r["chain_id"] for r in results] == [1, 56]
+    assert results[0]["status"] == "updated"
+    assert results[1]["status"] == "error"
+    assert "upstream down" in results[1]["error"]
+    assert (tmp_path / "1.json").exists()
+    assert not (tmp_path / "56.json").exists()
@@ -1,6 +1,7 @@
-import pytest
+from unittest.mock import AsyncMock
+
 import aiohttp
-from unittest.mock import patch, MagicMock, AsyncMock
+import pytest
 
 from lomen.plugins.oneinch.tools.get_address_from_domain import (
     GetAddressFromDomain,
@@ -48,8 +49,9 @@ async def test_get_address_from_domain_success(tool, mocker):
     assert result == expected_address
     # Check if aiohttp.ClientSession.get was called correctly (optional but good)
     aiohttp.ClientSession.get.assert_called_once_with(
-        f"https://api.1inch.dev/domains/v2.0/lookup?name={domain_to_resolve}",
+        "https://api.1inch.dev/domains/v2.0/lookup",
         headers={"Authorization": f"Bearer {DUMMY_API_KEY}"},
+        params={"name": domain_to_resolve},
     )
 
 
@@ -1,15 +1,16 @@
-import pytest
 import asyncio
+from unittest.mock import AsyncMock
+
 import aiohttp
-from unittest.mock import patch, MagicMock, AsyncMock
+import pytest
 
 from lomen.plugins.oneinch.tools.get_portfolio import (
-    GetPortfolio,
-    GetPortfolioParams,
-    GetPortfolioAllChains,
     # Remove direct import of the Params class to avoid collection error
     # GetPortfolioAllChainsParams,
     INCH1_SUPPORTED_CHAIN_IDS,
+    GetPortfolio,
+    GetPortfolioAllChains,
+    GetPortfolioParams,
 )
 
 # Use @pytest.mark.asyncio for specific async tests
@@ -70,7 +71,9 @@ async def test_get_portfolio_unsupported_chain(tool_single_chain):
     with pytest.raises(ValueError) as excinfo:
         await tool_single_chain.arun(address=address, chain_id=invalid_chain_id)
 
-    assert f"Chain ID {invalid_chain_id} is not supported by this tool" in str(excinfo.value)
+    assert f"Chain ID {invalid_chain_id} is not supported by this tool" in str(
+        excinfo.value
+    )
 
 
 @pytest.mark.asyncio
@@ -108,12 +111,16 @@ async def test_get_portfolio_all_chains_success(tool_all_chains, mocker):
     num_supported_chains = len(INCH1_SUPPORTED_CHAIN_IDS)
     # Expected result is list of chain-specific results (simplified for test)
     mock_results = [
-        {"chain_name": f"Chain {i}", "chain_id": i, "portfolio": []} for i in range(num_supported_chains)
+        {"chain_name": f"Chain {i}", "chain_id": i, "portfolio": []}
+        for i in range(num_supported_chains)
     ]
 
     # Mock the _call_all_apis method directly (higher-level than individual call)
     mocker.patch.object(
-        tool_all_chains, "_call_all_apis", new_callable=AsyncMock, return_value=mock_results
+        tool_all_chains,
+        "_call_all_apis",
+        new_callable=AsyncMock,
+        return_value=mock_results,
     )
 
     result = await tool_all_chains.arun(address=address)
@@ -181,4 +188,73 @@ def test_get_portfolio_all_chains_params(tool_all_chains):
 
     assert inspect.isclass(expected_params_class)
     # Optionally, check a known field if needed, though type check is usually enough
-    # assert 'address' in expected_params_class.model_fields
\ No newline at end of file
+    # assert 'address' in expected_params_class.model_fields
+
+
+def make_chain_fetcher(delays):
+    """Build a fake single-chain fetch whose latency depends on the chain."""
+
+    async def fake_arun(address, chain_id, bypass_cache=False, refresh_cache=False):
+        await asyncio.sleep(delays.get(chain_id, 0))
+        return {"chain_id": chain_id, "address": address, "total_usd_value": 10}
+
+    return fake_arun
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_all_chains_returns_partial_results_on_deadline(mocker):
+    """Test that unfinished chains are marked timed_out when the deadline passes."""
+    tool = GetPortfolioAllChains(api_key=DUMMY_API_KEY, deadline=0.05)
+    tool.supported_chains = [1, 137, 56]
+    mocker.patch.object(
+        tool.portfolio_tool, "arun", side_effect=make_chain_fetcher({137: 5})
+    )
+
+    result = await tool.arun(address="0xTestAddress")
+
+    assert list(result["chains"]) == ["1", "137", "56"]
+    assert result["chains"]["1"]["status"] == "ok"
+    assert result["chains"]["56"]["status"] == "ok"
+    assert result["chains"]["137"]["status"] == "timed_out"
+    assert result["summary"]["chains_timed_out"] == [137]
+    assert result["summary"]["complete"] is False
+    assert result["summary"]["total_value_usd"] == 20
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_all_chains_per_chain_timeout(mocker):
+    """Test that a single slow chain times out without holding up the others."""
+    tool = GetPortfolioAllChains(
+        api_key=DUMMY_API_KEY, per_chain_timeout=0.02, deadline=5
+    )
+    tool.supported_chains = [1, 10]
+    mocker.patch.object(
+        tool.portfolio_tool, "arun", side_effect=make_chain_fetcher({10: 5})
+    )
+
+    result = await tool.arun(address="0xTestAddress")
+
+    assert result["chains"]["1"]["status"] == "ok"
+    assert result["chains"]["10"]["status"] == "timed_out"
+    assert result["summary"]["complete"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_all_chains_streams_in_completion_order(mocker):
+    """Test that chains are delivered incrementally as they finish."""
+    tool = GetPortfolioAllChains(api_key=DUMMY_API_KEY)
+    tool.supported_chains = [1, 137]
+    mocker.patch.object(
+        tool.portfolio_tool, "arun", side_effect=make_chain_fetcher({1: 0.02})
+    )
+    received = []
+
+    async def on_partial_result(chain_result):
+        received.append(chain_result["chain_id"])
+
+    streamed = [item["chain_id"] async for item in tool.astream(address="0xAddr")]
+    result = await tool.arun(address="0xAddr", on_partial_result=on_partial_result)
+
+    assert streamed == [137, 1]
+    assert received == [137, 1]
+    assert result["summary"]["complete"] is True
@@ -1,14 +1,15 @@
-import pytest
+import builtins
 import json
+from unittest.mock import AsyncMock
+
 import aiohttp
-import os
-from unittest.mock import patch, MagicMock, AsyncMock, mock_open
+import pytest
 
 from lomen.plugins.oneinch.tools.get_token_info import (
-    GetTokenInfoBySymbol,
-    GetTokenInfoBySymbolParams,
     GetTokenInfoByAddress,
     GetTokenInfoByAddressParams,
+    GetTokenInfoBySymbol,
+    GetTokenInfoBySymbolParams,
 )
 
 # Use @pytest.mark.asyncio for specific async tests
@@ -24,6 +25,13 @@ def tool_by_symbol():
     return GetTokenInfoBySymbol(api_key=DUMMY_API_KEY)
 
 
+@pytest.fixture
+def tokens_dir(tmp_path, monkeypatch):
+    """Point the local token cache at an empty temporary directory."""
+    monkeypatch.setenv("LOMEN_TOKENS_DIR", str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def tool_by_address():
     """Fixture for GetTokenInfoByAddress tool."""
@@ -34,7 +42,7 @@ def tool_by_address():
 
 
 @pytest.mark.asyncio
-async def test_get_token_info_by_symbol_api_success(tool_by_symbol, mocker):
+async def test_get_token_info_by_symbol_api_success(tool_by_symbol, tokens_dir, mocker):
     """Test successful token info fetch by symbol via API."""
     symbol = "USDC"
     chain_id = 1
@@ -49,8 +57,8 @@ async def test_get_token_info_by_symbol_api_success(tool_by_symbol, mocker):
         "marketCap": 30000000000,
     }
 
-    # Mock os.path.exists to return False (cache miss)
-    mocker.patch("os.path.exists", return_value=False)
+    # No token list for the chain (cache miss)
+    index_lookup = mocker.spy(tool_by_symbol.token_index, "lookup")
 
     # Mock API response
     mock_resp = AsyncMock()
@@ -64,12 +72,12 @@ async def test_get_token_info_by_symbol_api_success(tool_by_symbol, mocker):
     result = await tool_by_symbol.arun(symbol=symbol, chain_id=chain_id)
 
     assert result == expected_data
-    os.path.exists.assert_called_once()  # Check cache was checked
+    index_lookup.assert_called_once()  # Check cache was checked
     aiohttp.ClientSession.get.assert_called_once()  # Check API was called
 
 
 @pytest.mark.asyncio
-async def test_get_token_info_by_symbol_cache_hit(tool_by_symbol, mocker):
+async def test_get_token_info_by_symbol_cache_hit(tool_by_symbol, tokens_dir, mocker):
     """Test successful token info fetch by symbol from local cache."""
     symbol = "WETH"
     chain_id = 1
@@ -84,31 +92,29 @@ async def test_get_token_info_by_symbol_cache_hit(tool_by_symbol, mocker):
     mock_file_content = json.dumps(
         {"some_other_token": {}, cached_data["address"]: cached_data}
     )
-    mock_read_data = mock_file_content
-
-    # Mock os.path.exists to return True (cache hit)
-    mocker.patch("os.path.exists", return_value=True)
-    # Mock open to simulate reading the file
-    mocker.patch("builtins.open", mock_open(read_data=mock_read_data))
+    (tokens_dir / f"{chain_id}.json").write_text(mock_file_content)
+    open_spy = mocker.spy(builtins, "open")
     # Mock aiohttp just in case, although it shouldn't be called
     mock_api_get = mocker.patch("aiohttp.ClientSession.get")
 
     result = await tool_by_symbol.arun(symbol=symbol, chain_id=chain_id)
+    # Lookups are case-insensitive and served from the in-memory index
+    second = await tool_by_symbol.arun(symbol=symbol.lower(), chain_id=chain_id)
 
     assert result == cached_data
-    os.path.exists.assert_called_once()
-    open.assert_called_once()  # Check file was opened
+    assert second == cached_data
+    open_spy.assert_called_once()  # File was parsed only once
     mock_api_get.assert_not_called()  # Ensure API was NOT called
 
 
 @pytest.mark.asyncio
-async def test_get_token_info_by_symbol_api_not_found(tool_by_symbol, mocker):
+async def test_get_token_info_by_symbol_api_not_found(
+    tool_by_symbol, tokens_dir, mocker
+):
     """Test token info fetch by symbol when API returns empty list."""
     symbol = "NOSUCHTOKEN"
     chain_id = 1
 
-    mocker.patch("os.path.exists", return_value=False)  # Cache miss
-
     # Mock API response (empty list)
     mock_resp = AsyncMock()
     mock_resp.status = 200
@@ -125,15 +131,13 @@ async def test_get_token_info_by_symbol_api_not_found(tool_by_symbol, mocker):
 
 
 @pytest.mark.asyncio
-async def test_get_token_info_by_symbol_api_error(tool_by_symbol, mocker):
+async def test_get_token_info_by_symbol_api_error(tool_by_symbol, tokens_dir, mocker):
     """Test token info fetch by symbol with API error."""
     symbol = "USDC"
     chain_id = 1
     mock_status = 500
     mock_error_text = "Internal Server Error"
 
-    mocker.patch("os.path.exists", return_value=False)  # Cache miss
-
     # Mock API response
     mock_resp = AsyncMock()
     mock_resp.status = mock_status
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from lomen.plugins.base import BasePlugin, BaseTool
+from lomen.plugins.base import BasePlugin, BaseTool, tool_parameters_schema
 
 
 def test_base_tool():
@@ -92,4 +92,79 @@ def test_evm_rpc_plugin():
     # Test that tools property returns a list of tools
     tools = plugin.tools
     assert isinstance(tools, list)
-    assert len(tools) == 2
+    assert len(tools) == 3
+
+
+def test_tool_parameters_schema_is_computed_once_per_model():
+    """Test Pydantic v2 schemas are preferred and cached per model class."""
+    calls = []
+
+    class Params:
+        @classmethod
+        def model_json_schema(cls):
+            calls.append("model_json_schema")
+            return {"type": "object", "properties": {"x": {"type": "integer"}}}
+
+        @classmethod
+        def schema(cls):
+            calls.append("schema")
+            return {}
+
+    tool = MagicMock(spec=BaseTool)
+    tool.get_params.return_value = Params
+
+    first = tool_parameters_schema(tool)
+    second = ConcretePlugin()._get_serializable_params(tool)
+
+    assert first == {"type": "object", "properties": {"x": {"type": "integer"}}}
+    assert second is first
+    assert calls == ["model_json_schema"]
+
+
+class LifecyclePlugin(BasePlugin):
+    """Plugin creating mock tools, counting how often it does so."""
+
+    def __init__(self):
+        self.created = 0
+
+    @property
+    def name(self):
+        return "lifecycle"
+
+    def create_tools(self):
+        self.created += 1
+        return [MagicMock(spec=BaseTool), MagicMock(spec=BaseTool)]
+
+
+def test_plugin_tools_are_created_once():
+    """Test tools are created on first access and reused afterwards."""
+    plugin = LifecyclePlugin()
+
+    tools = plugin.tools
+
+    assert plugin.tools is tools
+    assert plugin.created == 1
+
+
+@pytest.mark.asyncio
+async def test_plugin_startup_and_aclose_reach_tools():
+    """Test the plugin lifecycle is forwarded to each of its tools."""
+    plugin = LifecyclePlugin()
+
+    await plugin.startup()
+    await plugin.aclose()
+
+    for tool in plugin.tools:
+        tool.startup.assert_awaited_once()
+        tool.aclose.assert_awaited_once()
+    assert plugin.created == 1
+
+
+@pytest.mark.asyncio
+async def test_plugin_aclose_without_tools_does_not_create_them():
+    """Test closing a plugin whose tools were never used creates none."""
+    plugin = LifecyclePlugin()
+
+    await plugin.aclose()
+
+    assert plugin.created == 0
@@ -0,0 +1,209 @@
+"""Tests for plugin manifests and lazily loaded plugins."""
+
+import inspect
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from typing import Optional, get_args
+
+import pytest
+
+from lomen.plugins.manifest import (
+    LazyPlugin,
+    build_manifest,
+    create_plugin,
+    find_manifests,
+    signature_from_schema,
+)
+
+FAKE_PLUGIN = '''
+from typing import Optional
+
+from lomen.plugins.base import BasePlugin, BaseTool
+
+
+class EchoTool(BaseTool):
+    @property
+    def name(self):
+        return "echo"
+
+    @property
+    def description(self):
+        return "Echoes its input."
+
+    async def arun(self, text: str, times: Optional[int] = 1):
+        """Echo the text."""
+        return {"text": text * times}
+
+    def get_params(self):
+        return {"properties": {"text": {"description": "The text."}}}
+
+
+class FakePlugin(BasePlugin):
+    required_env = ("FAKE_PLUGIN_KEY",)
+
+    def __init__(self):
+        self.closed = False
+
+    @property
+    def name(self):
+        return "fake"
+
+    @property
+    def description(self):
+        return "Fake plugin."
+
+    @property
+    def readme(self):
+        return "# Fake"
+
+    @property
+    def tools(self):
+        return [EchoTool()]
+
+    async def aclose(self):
+        self.closed = True
+'''
+
+
+@pytest.fixture
+def fake_manifest(tmp_path, monkeypatch):
+    """Manifest of a plugin package that has not been imported."""
+    package = tmp_path / "lomen_fake_plugin"
+    package.mkdir()
+    (package / "__init__.py").write_text(textwrap.dedent(FAKE_PLUGIN))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("FAKE_PLUGIN_KEY", "secret")
+    monkeypatch.delitem(sys.modules, "lomen_fake_plugin", raising=False)
+
+    from lomen_fake_plugin import FakePlugin
+
+    manifest = build_manifest(FakePlugin())
+    del sys.modules["lomen_fake_plugin"]
+    return manifest
+
+
+def test_build_manifest(fake_manifest):
+    """Test the manifest describes the plugin and its tools."""
+    assert fake_manifest["name"] == "fake"
+    assert fake_manifest["plugin"] == "lomen_fake_plugin:FakePlugin"
+    assert fake_manifest["required_env"] == ["FAKE_PLUGIN_KEY"]
+    (tool,) = fake_manifest["tools"]
+    assert tool["name"] == "echo"
+    assert tool["doc"] == "Echo the text."
+    assert tool["streaming"] is False
+    assert tool["parameters"] == {
+        "type": "object",
+        "properties": {
+            "text": {"type": "string", "description": "The text."},
+            "times": {
+                "anyOf": [{"type": "integer"}, {"type": "null"}],
+                "default": 1,
+            },
+        },
+        "required": ["text"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_lazy_plugin_imports_on_first_call(fake_manifest):
+    """Test tools are listed from the manifest and loaded when called."""
+    plugin = LazyPlugin(fake_manifest)
+    (tool,) = plugin.tools
+
+    assert tool.name == "echo"
+    assert tool.description == "Echoes its input."
+    assert tool.arun.__doc__ == "Echo the text."
+    assert list(inspect.signature(tool.arun).parameters) == ["text", "times"]
+    assert "lomen_fake_plugin" not in sys.modules
+    assert not plugin.loaded
+
+    assert await tool.arun(text="ab", times=2) == {"text": "abab"}
+    assert "lomen_fake_plugin" in sys.modules
+    assert plugin.loaded
+
+    await plugin.aclose()
+    assert plugin.load().closed
+
+
+def test_lazy_plugin_requires_env(fake_manifest, monkeypatch):
+    """Test a plugin missing required settings is rejected without importing it."""
+    monkeypatch.delenv("FAKE_PLUGIN_KEY")
+
+    with pytest.raises(ValueError) as excinfo:
+        create_plugin(fake_manifest)
+
+    assert "FAKE_PLUGIN_KEY" in str(excinfo.value)
+    assert "lomen_fake_plugin" not in sys.modules
+
+
+def test_signature_from_schema():
+    """Test JSON schemas map back to annotations, defaults and the stream hook."""
+    signature = signature_from_schema(
+        {
+            "properties": {
+                "address": {"type": "string"},
+                "rpc_url": {
+                    "anyOf": [{"type": "string"}, {"type": "null"}],
+                    "default": None,
+                },
+            },
+            "required": ["address"],
+        },
+        streaming=True,
+    )
+
+    address, rpc_url, callback = signature.parameters.values()
+    assert address.annotation is str
+    assert address.default is inspect.Parameter.empty
+    assert rpc_url.annotation == Optional[str]
+    assert rpc_url.default is None
+    assert callback.name == "on_partial_result"
+
+
+def test_signature_from_schema_keeps_descriptions():
+    """Test parameter descriptions are attached to the annotations."""
+    signature = signature_from_schema(
+        {"properties": {"chain_id": {"type": "integer", "description": "Chain."}}}
+    )
+
+    annotation = signature.parameters["chain_id"].annotation
+    base, field = get_args(annotation)
+    assert base is int
+    assert field.description == "Chain."
+
+
+@pytest.mark.parametrize("plugin_name", ["blockchain", "evm_rpc", "oneinch"])
+def test_bundled_manifests_are_current(plugin_name, monkeypatch):
+    """Test the checked-in manifests match the plugins (regenerate if this fails)."""
+    monkeypatch.setenv("ONEINCH_API_KEY", "test")
+    manifest = find_manifests()[plugin_name]
+
+    plugin = create_plugin(manifest, lazy=False)
+
+    assert json.loads(json.dumps(build_manifest(plugin))) == manifest
+
+
+def test_cli_plugin_discovery_does_not_import_plugins():
+    """Test `lomen --all` can list tools without importing web3 or aiohttp."""
+    code = (
+        "import sys\n"
+        "from lomen.cli import instantiate_plugins\n"
+        "plugins = instantiate_plugins([], all_plugins=True)\n"
+        "tools = sum(len(plugin.tools) for plugin in plugins)\n"
+        "print(tools, 'web3' in sys.modules, 'aiohttp' in sys.modules)\n"
+    )
+    env = {
+        **os.environ,
+        "ONEINCH_API_KEY": "test",
+        "PYTHONPATH": os.pathsep.join(sys.path),
+    }
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "12 False False"
@@ -0,0 +1,191 @@
+"""Tests for the command-line interface."""
+
+import asyncio
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from lomen.cli import (
+    DEFAULT_BACKLOG,
+    DEFAULT_KEEP_ALIVE,
+    SERVE_PLUGINS_ENV,
+    SERVE_TRANSPORT_ENV,
+    create_app,
+    create_server,
+    instantiate_tools,
+    main,
+    serve_http,
+)
+from lomen.plugins.base import BasePlugin
+
+
+def make_plugin():
+    """Plugin mock without tools."""
+    plugin = MagicMock(spec=BasePlugin)
+    plugin.name = "mock"
+    plugin.tools = []
+    return plugin
+
+
+@pytest.mark.asyncio
+async def test_create_app_manages_plugins_in_app_lifespan():
+    """Test plugins are started and closed once per app, not per session."""
+    plugin = make_plugin()
+    app = create_app([plugin], "sse")
+
+    async with app.router.lifespan_context(app):
+        plugin.startup.assert_awaited_once()
+        plugin.aclose.assert_not_awaited()
+
+    plugin.aclose.assert_awaited_once()
+
+
+def test_create_app_rejects_unknown_transport():
+    """Test only HTTP transports can be served as an app."""
+    with pytest.raises(ValueError):
+        create_app([make_plugin()], "stdio")
+
+
+def test_serve_http_single_worker(mocker):
+    """Test a single worker serves the app object with the HTTP settings."""
+    run = mocker.patch("uvicorn.run")
+    app = mocker.patch("lomen.cli.create_app")
+    plugin = make_plugin()
+
+    serve_http(MagicMock(), [plugin], None, "sse", "127.0.0.1", 9000)
+
+    run.assert_called_once_with(
+        app.return_value,
+        host="127.0.0.1",
+        port=9000,
+        backlog=DEFAULT_BACKLOG,
+        timeout_keep_alive=DEFAULT_KEEP_ALIVE,
+        log_level="info",
+    )
+
+
+def test_serve_http_multiple_workers(mocker, monkeypatch):
+    """Test workers build their own app from the selection in the environment."""
+    run = mocker.patch("uvicorn.run")
+    # Restored after the test, as serve_http sets them for the workers
+    monkeypatch.setenv(SERVE_PLUGINS_ENV, "")
+    monkeypatch.setenv(SERVE_TRANSPORT_ENV, "")
+
+    serve_http(
+        MagicMock(),
+        [make_plugin()],
+        ["blockchain", "evm_rpc"],
+        "streamable-http",
+        "0.0.0.0",
+        8000,
+        workers=4,
+        backlog=512,
+        keep_alive=30,
+    )
+
+    args, kwargs = run.call_args
+    assert args == ("lomen.cli:app_factory",)
+    assert kwargs["factory"] is True
+    assert kwargs["workers"] == 4
+    assert kwargs["backlog"] == 512
+    assert kwargs["timeout_keep_alive"] == 30
+    assert os.environ[SERVE_PLUGINS_ENV] == "blockchain,evm_rpc"
+    assert os.environ[SERVE_TRANSPORT_ENV] == "streamable-http"
+
+
+def test_instantiate_tools_resolves_owning_plugins():
+    """Test only the plugins owning the selected tools are returned, unloaded."""
+    plugins, found = instantiate_tools(
+        ["get_block", "missing_tool", "get_blockchain_metadata", "get_blocks"]
+    )
+
+    assert [plugin.name for plugin in plugins] == ["evm_rpc", "blockchain"]
+    assert found == ["get_block", "get_blockchain_metadata", "get_blocks"]
+    assert not any(plugin.loaded for plugin in plugins)
+
+
+@pytest.mark.asyncio
+async def test_create_server_registers_selected_tools():
+    """Test a tool selection limits the tools the server lists."""
+    plugins, found = instantiate_tools(["get_block", "get_blockchain_metadata"])
+
+    server = create_server(plugins, tool_names=found)
+
+    tools = await server.list_tools()
+    assert sorted(tool.name for tool in tools) == [
+        "get_block",
+        "get_blockchain_metadata",
+    ]
+
+
+def test_multiple_workers_require_streamable_http():
+    """Test SSE cannot be spread over workers, as sessions live in one process."""
+    with pytest.raises(SystemExit):
+        main(["--all", "--transport", "sse", "--workers", "2"])
+
+
+def test_streamable_http_requires_a_supporting_mcp(mocker, monkeypatch):
+    """Test an MCP SDK without streamable HTTP fails before workers start."""
+    from mcp.server.fastmcp import FastMCP
+
+    monkeypatch.delattr(FastMCP, "streamable_http_app", raising=False)
+    run = mocker.patch("uvicorn.run")
+
+    with pytest.raises(SystemExit):
+        main(["--all", "--transport", "streamable-http", "--workers", "2"])
+    with pytest.raises(ValueError):
+        serve_http(
+            MagicMock(),
+            [make_plugin()],
+            None,
+            "streamable-http",
+            "0.0.0.0",
+            8000,
+            workers=2,
+        )
+    run.assert_not_called()
+
+
+def test_create_app_serves_metrics():
+    """Test the app exposes the process metrics in the Prometheus format."""
+    from starlette.testclient import TestClient
+
+    from lomen.metrics import metrics
+
+    metrics.observe_tool("get_block", 0.1)
+    app = create_app([make_plugin()], "sse")
+
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'lomen_tool_calls_total{tool="get_block",outcome="ok"}' in response.text
+
+
+def test_create_app_serves_executor_metrics():
+    """Test /metrics reports the concurrency of the app's tool executor."""
+    from starlette.testclient import TestClient
+
+    from lomen.adapters.mcp import ToolBusyError, ToolExecutor
+
+    executor = ToolExecutor(max_concurrency=1, max_queue=0)
+    app = create_app([make_plugin()], "sse", executor=executor)
+
+    async def overload():
+        async with executor.slot("cli_probe"):
+            with pytest.raises(ToolBusyError):
+                async with executor.slot("cli_probe_rejected"):
+                    pass
+
+    asyncio.run(overload())
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert app.state.executor is executor
+    assert 'lomen_tool_calls_running{tool="cli_probe"} 0' in response.text
+    assert 'lomen_tool_queue_wait_seconds_count{tool="cli_probe"} 1' in response.text
+    assert (
+        'lomen_tool_rejections_total{tool="cli_probe_rejected",reason="queue_full"} 1'
+    ) in response.text
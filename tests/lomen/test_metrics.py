@@ -0,0 +1,92 @@
+"""Tests for tool and upstream call metrics."""
+
+import pytest
+
+from lomen.metrics import Histogram, MetricsRegistry, instrument
+
+
+@pytest.mark.asyncio
+async def test_instrument_records_calls_errors_and_sizes():
+    """Test calls are recorded with latency, error type and response size."""
+    registry = MetricsRegistry()
+
+    async def arun(fail: bool = False):
+        if fail:
+            raise ValueError("boom")
+        return {"result": "ok"}
+
+    tool = instrument("echo", arun, registry)
+
+    assert await tool() == {"result": "ok"}
+    with pytest.raises(ValueError):
+        await tool(fail=True)
+
+    stats = registry.snapshot()["tools"]["echo"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["errors_by_type"] == {"ValueError": 1}
+    assert stats["latency_seconds"]["count"] == 2
+    assert stats["response_bytes"]["sum"] == len('{"result": "ok"}')
+
+
+def test_instrument_wraps_sync_functions():
+    """Test plain functions stay plain and keep their signature."""
+    registry = MetricsRegistry()
+
+    def run(text: str):
+        """Echo the text."""
+        return text
+
+    tool = instrument("echo", run, registry)
+
+    assert tool("abc") == "abc"
+    assert tool.__doc__ == "Echo the text."
+    assert registry.snapshot()["tools"]["echo"]["response_bytes"]["sum"] == 3
+
+
+def test_histogram_quantiles():
+    """Test quantiles are interpolated within their bucket."""
+    histogram = Histogram((1.0, 2.0, float("inf")))
+    for value in (0.5, 0.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.quantile(0.5) == pytest.approx(1.0)
+    assert histogram.quantile(1.0) == pytest.approx(3.0)
+    assert Histogram((1.0,)).quantile(0.5) is None
+
+
+def test_render_prometheus():
+    """Test the text exposition has cumulative buckets and escaped labels."""
+    registry = MetricsRegistry()
+    registry.observe_tool("get_block", 0.02, response_bytes=100)
+    registry.observe_tool("get_block", 0.2, TimeoutError())
+    registry.observe_upstream("evm_rpc", 'rpc."host"', 0.01, "ok")
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE lomen_tool_duration_seconds histogram" in text
+    assert 'lomen_tool_calls_total{tool="get_block",outcome="error"} 1' in text
+    assert (
+        'lomen_tool_errors_total{tool="get_block",error_type="TimeoutError"} 1'
+    ) in text
+    assert 'lomen_tool_duration_seconds_bucket{tool="get_block",le="0.025"} 1' in text
+    assert 'lomen_tool_duration_seconds_bucket{tool="get_block",le="+Inf"} 2' in text
+    assert 'lomen_tool_duration_seconds_count{tool="get_block"} 2' in text
+    assert (
+        'lomen_upstream_requests_total{upstream="evm_rpc",target="rpc.\\"host\\"",'
+        'outcome="ok"} 1'
+    ) in text
+
+    registry.reset()
+    assert registry.snapshot() == {
+        "tools": {},
+        "upstreams": {},
+        "executor": {
+            "running": 0,
+            "waiting": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "tools": {},
+        },
+    }
@@ -0,0 +1,129 @@
+"""Tests for the plugin registry."""
+
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+from lomen.plugins.base import BasePlugin, BaseTool
+from lomen.registry import PluginRegistry
+
+
+def make_tool(name):
+    """Tool mock with a dictionary parameter schema."""
+    tool = MagicMock(spec=BaseTool)
+    tool.name = name
+    tool.description = f"{name} description"
+    tool.get_params.return_value = {"type": "object", "properties": {}}
+    return tool
+
+
+def make_plugin(name, tool_names):
+    """Plugin whose ``tools`` and ``readme`` accesses are counted."""
+    plugin = MagicMock(spec=BasePlugin)
+    plugin.name = name
+    plugin.description = f"{name} plugin"
+    tools = PropertyMock(return_value=[make_tool(tool) for tool in tool_names])
+    readme = PropertyMock(return_value=f"# {name}")
+    type(plugin).tools = tools
+    type(plugin).readme = readme
+    return plugin, tools, readme
+
+
+@pytest.fixture
+def registry():
+    """Registry with two plugins registered."""
+    registry = PluginRegistry()
+    registry.register_plugin(make_plugin("first", ["a", "b"])[0])
+    registry.register_plugin(make_plugin("second", ["c"])[0])
+    return registry
+
+
+def test_list_all_tools(registry):
+    """Test tools of all plugins are listed with their plugin and schema."""
+    tools = registry.list_all_tools()
+
+    assert [(tool["plugin_name"], tool["name"]) for tool in tools] == [
+        ("first", "a"),
+        ("first", "b"),
+        ("second", "c"),
+    ]
+    assert tools[0]["description"] == "a description"
+    assert tools[0]["parameters"] == {"type": "object", "properties": {}}
+
+
+def test_catalog_is_built_once():
+    """Test repeated listings do not walk the plugins' tools again."""
+    registry = PluginRegistry()
+    plugin, tools, readme = make_plugin("first", ["a"])
+    registry.register_plugin(plugin)
+
+    registry.list_all_tools()
+    registry.list_all_tools()
+    registry.get_plugin_details("first")
+    registry.get_tool("a")
+
+    assert tools.call_count == 1
+    assert readme.call_count == 1
+
+
+def test_register_plugin_invalidates_catalog(registry):
+    """Test a newly registered plugin shows up in the cached listings."""
+    assert registry.get_tool("d") is None
+
+    registry.register_plugin(make_plugin("third", ["d"])[0])
+
+    assert registry.get_tool("d").name == "d"
+    assert len(registry.list_all_tools()) == 4
+    assert [plugin["name"] for plugin in registry.list_plugins()] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_get_tool(registry):
+    """Test tools are looked up by name across plugins."""
+    assert registry.get_tool("c").description == "c description"
+    assert registry.get_tool("missing") is None
+
+
+def test_get_tool_plugin(registry):
+    """Test the plugin owning a tool is found through the index."""
+    assert registry.get_tool_plugin("b") is registry.get_plugin("first")
+    assert registry.get_tool_plugin("missing") is None
+
+
+def test_get_plugin_details(registry):
+    """Test plugin details include the readme and tool schemas."""
+    details = registry.get_plugin_details("first")
+
+    assert details["readme"] == "# first"
+    assert [tool["name"] for tool in details["tools"]] == ["a", "b"]
+    assert registry.get_plugin_details("missing") is None
+
+
+def test_list_plugins(registry):
+    """Test plugin metadata is listed with tool counts."""
+    assert registry.list_plugins() == [
+        {
+            "name": "first",
+            "description": "first plugin",
+            "readme": "# first",
+            "tools_count": 2,
+        },
+        {
+            "name": "second",
+            "description": "second plugin",
+            "readme": "# second",
+            "tools_count": 1,
+        },
+    ]
+
+
+def test_listings_are_copies(registry):
+    """Test callers cannot alter the cached catalog."""
+    registry.list_all_tools().clear()
+    registry.get_plugin_details("first")["tools"] = []
+
+    assert len(registry.list_all_tools()) == 3
+    assert len(registry.get_plugin_details("first")["tools"]) == 2
@@ -0,0 +1,80 @@
+"""Tests for optional tracing."""
+
+import pytest
+
+from lomen import tracing
+
+
+@pytest.fixture
+def exporter():
+    """Tracing into an in-memory exporter, turned off again after the test."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracing.configure(True, tracer_provider=provider)
+    yield exporter
+    tracing.configure(False)
+
+
+@pytest.mark.asyncio
+async def test_disabled_tracing_is_a_no_op():
+    """Test nothing is wrapped or recorded when tracing is off."""
+    tracing.configure(False)
+
+    async def arun():
+        return 1
+
+    assert tracing.trace_tool("echo", arun) is arun
+    with tracing.span("request", {"lomen.chain_id": 1}) as span:
+        span.set_attribute("lomen.cache.hit", True)
+        tracing.set_attribute("lomen.cache.hit", True)
+    tracing.end_span(tracing.start_span("request"), "500")
+    assert not tracing.is_enabled()
+
+
+@pytest.mark.asyncio
+async def test_tool_span_is_parent_of_request_spans(exporter):
+    """Test request spans nest under the tool call with their attributes."""
+
+    async def arun(chain_id: int):
+        tracing.set_attribute("lomen.cache.hit", False)
+        with tracing.span("evm_rpc request", {"server.address": "rpc"}):
+            pass
+        attempt = tracing.start_span("oneinch request", {"lomen.chain_id": None})
+        tracing.end_span(attempt, "429")
+        return chain_id
+
+    tool = tracing.trace_tool("get_block", arun)
+
+    assert await tool(chain_id=137) == 137
+
+    rpc, attempt, parent = exporter.get_finished_spans()
+    assert parent.name == "tool get_block"
+    assert parent.attributes["lomen.chain_id"] == 137
+    assert parent.attributes["lomen.cache.hit"] is False
+    assert rpc.parent.span_id == parent.context.span_id
+    assert attempt.parent.span_id == parent.context.span_id
+    assert attempt.attributes["error.type"] == "429"
+    assert "lomen.chain_id" not in attempt.attributes
+
+
+@pytest.mark.asyncio
+async def test_tool_span_records_errors(exporter):
+    """Test a failing call marks its span failed."""
+
+    async def arun():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await tracing.trace_tool("echo", arun)()
+
+    (span,) = exporter.get_finished_spans()
+    assert not span.status.is_ok
+    assert span.events[0].name == "exception"